@@ -14,6 +14,7 @@ from travel_planner.agents.recommendation import RecommendationAgent
 from travel_planner.data.dynamodb import DynamoDBClient
 from travel_planner.data.preferences import UserPreferences
 from travel_planner.data.repository import DynamoDBRepository
+from travel_planner.services.cache_service import CacheService
 from travel_planner.services.conversation_service import ConversationService
 from travel_planner.utils.logging import get_logger
 
@@ -63,9 +64,11 @@ def route_event(event: dict[str, Any]) -> tuple[str, dict[str, Any]]:
 
 
 async def _handle_chat(params: dict[str, Any]) -> dict[str, Any]:
-    repo = _get_repo()
+    db = _get_db()
     agent = ConversationAgent()
-    service = ConversationService(repo=repo, agent=agent)
+    service = ConversationService(
+        repo=DynamoDBRepository(db), agent=agent, cache=CacheService(db)
+    )
 
     location = params.get("context", {}).get("location")
     timestamp = params.get("context", {}).get("timestamp")
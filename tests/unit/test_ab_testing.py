@@ -26,3 +26,12 @@ def test_record_outcome():
     service = ABTestService(db=mock_db)
     service.record_outcome("test1", "A", score=0.85)
     mock_db.put_item.assert_called_once()
+
+
+def test_record_outcome_uses_one_timestamp():
+    mock_db = MagicMock()
+    service = ABTestService(db=mock_db)
+    service.record_outcome("test1", "B", score=0.5)
+    item = mock_db.put_item.call_args.args[0]
+    seconds = int(item["SK"].rsplit("#", 1)[1])
+    assert seconds == int(item["Data"]["timestamp"])
@@ -142,3 +142,19 @@ async def test_process_method_not_implemented():
 
     with pytest.raises(NotImplementedError):
         await agent.process("Hello", None)
+
+
+@pytest.mark.asyncio
+async def test_ainvoke_flattens_result():
+    """Test that ainvoke awaits run and flattens a nested result."""
+
+    class EchoAgent(BaseAgent):
+        async def run(self, input_data, context=None):
+            return {"result": {"content": input_data}, "status": "ok"}
+
+    agent = EchoAgent(AgentConfig(name="Echo", instructions="Echo input"))
+    state = type("State", (), {"conversation_history": [], "query": None})()
+
+    result = await agent.ainvoke(state)
+
+    assert result == {"content": "Plan a trip", "status": "ok"}
@@ -35,3 +35,11 @@ def test_cache_expired():
     cache = CacheService(mock_db)
     result = cache.get("expired_key")
     assert result is None
+
+
+def test_cache_key_normalizes_case_whitespace_and_punctuation():
+    cache = CacheService(MagicMock())
+    assert cache._cache_key("Best ramen in Tokyo?") == cache._cache_key(
+        "  best   ramen in \uff34okyo "
+    )
+    assert cache._cache_key("ramen") != cache._cache_key("sushi")
@@ -0,0 +1,810 @@
+"""
+Unit tests for the checkpoint serialization system.
+"""
+
+import importlib
+import os
+import threading
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from travel_planner.data.models import TravelPlan, TravelQuery
+from travel_planner.orchestration.serialization import codec
+from travel_planner.orchestration.serialization.checkpoint import (
+    _CHECKPOINT_POOL,
+    HISTORY_SUFFIX,
+    CheckpointManager,
+    _unlogged_messages,
+)
+from travel_planner.orchestration.serialization.incremental import (
+    IncrementalCheckpointManager,
+)
+from travel_planner.orchestration.serialization.sqlite_store import (
+    SQLiteCheckpointManager,
+)
+from travel_planner.orchestration.states.planning_state import (
+    Msg,
+    TravelPlanningState,
+    _iso_now,
+    new_checkpoint_id,
+)
+from travel_planner.orchestration.states.workflow_stages import WorkflowStage
+
+
+@pytest.fixture
+def checkpoint_manager(tmp_path):
+    """Create a checkpoint manager backed by a temporary directory."""
+    return CheckpointManager(checkpoint_dir=str(tmp_path))
+
+
+@pytest.fixture
+def travel_state():
+    """Create a basic travel planning state for testing."""
+    state = TravelPlanningState(
+        query=TravelQuery(raw_query="Plan a trip to Paris", destination="Paris"),
+        plan=TravelPlan(overview="Three days in Paris"),
+    )
+    state.update_stage(WorkflowStage.QUERY_ANALYZED)
+    return state
+
+
+def test_save_and_load_checkpoint(checkpoint_manager, travel_state):
+    """Test that a saved checkpoint round-trips through disk."""
+    checkpoint_id = checkpoint_manager.save_checkpoint(travel_state)
+
+    # Force a disk read by dropping the in-memory cache
+    checkpoint_manager.active_checkpoints.clear()
+    loaded = checkpoint_manager.load_checkpoint(checkpoint_id)
+
+    assert loaded.query.destination == "Paris"
+    assert loaded.plan.overview == "Three days in Paris"
+    assert loaded.current_stage == WorkflowStage.QUERY_ANALYZED
+
+
+def test_from_checkpoint_data_restores_saved_fields(travel_state):
+    """Test that checkpoint data is rebuilt into typed fields as saved."""
+    travel_state.conversation_history.append(Msg("user", "Plan a trip to Paris"))
+    checkpoint_data = codec.decode(codec.encode(travel_state.create_checkpoint()))
+
+    restored = TravelPlanningState.from_checkpoint_data(checkpoint_data)
+
+    assert restored.current_stage is WorkflowStage.QUERY_ANALYZED
+    assert restored.last_update_time == travel_state.last_update_time
+    assert restored.stage_times == travel_state.stage_times
+    assert restored.plan == travel_state.plan
+    assert restored.state_checkpoint_id == travel_state.state_checkpoint_id
+    assert restored.conversation_history == travel_state.conversation_history
+    assert isinstance(restored.conversation_history[0], Msg)
+
+
+def test_revalidated_state_keeps_its_times(travel_state):
+    """Test that rebuilding a state from its fields leaves its times alone."""
+    rebuilt = TravelPlanningState.model_validate(travel_state.model_dump())
+
+    assert rebuilt.start_time == travel_state.start_time
+    assert rebuilt.last_update_time == travel_state.last_update_time
+    assert rebuilt.stage_times == travel_state.stage_times
+
+
+def test_from_checkpoint_data_reads_legacy_times(travel_state):
+    """Test that ISO timestamps and str(stage) keys from older checkpoints load."""
+    started = datetime(2026, 5, 1, 9, 30)
+    checkpoint_data = travel_state.create_checkpoint()
+    checkpoint_data["start_time"] = started.isoformat()
+    checkpoint_data["stage_times"] = {
+        "WorkflowStage.QUERY_ANALYZED": started.isoformat()
+    }
+
+    restored = TravelPlanningState.from_checkpoint_data(checkpoint_data)
+
+    assert restored.start_time == int(started.timestamp()) * 1_000_000_000
+    assert restored.stage_times == {"query_analyzed": restored.start_time}
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_save_checkpoint_fsync_follows_config(
+    monkeypatch, checkpoint_manager, travel_state, enabled
+):
+    """Test that checkpoint writes are fsynced only when configured to be."""
+    from travel_planner.config import config
+
+    monkeypatch.setattr(config.system, "checkpoint_fsync", enabled)
+    with patch("os.fsync") as fsync:
+        checkpoint_manager.save_checkpoint(travel_state)
+
+    assert fsync.called is enabled
+
+
+def test_peek_checkpoint_skips_state_reconstruction(checkpoint_manager, travel_state):
+    """Test that peeking returns the raw checkpoint data without validation."""
+    checkpoint_id = checkpoint_manager.save_checkpoint(travel_state)
+    checkpoint_manager.active_checkpoints.clear()
+
+    with patch.object(
+        checkpoint_manager, "_reconstruct_state_from_checkpoint"
+    ) as reconstruct:
+        checkpoint_data = checkpoint_manager.peek_checkpoint(checkpoint_id)
+        reconstruct.assert_not_called()
+
+    assert checkpoint_data["workflow_stage"] == str(WorkflowStage.QUERY_ANALYZED)
+    assert checkpoint_data["plan"]["overview"] == "Three days in Paris"
+    with pytest.raises(ValueError, match="not found"):
+        checkpoint_manager.peek_checkpoint("checkpoint_missing")
+
+
+def test_conversation_history_is_logged_once(checkpoint_manager, travel_state):
+    """Test that re-saves append only new messages to the history log."""
+    travel_state.conversation_history.append(Msg("user", "Plan a trip to Paris"))
+    checkpoint_id = checkpoint_manager.save_checkpoint(travel_state)
+    travel_state.conversation_history.append(Msg("assistant", "Sure"))
+    checkpoint_manager.save_checkpoint(travel_state)
+
+    history_path = os.path.join(
+        checkpoint_manager.checkpoint_dir, f"{checkpoint_id}{HISTORY_SUFFIX}"
+    )
+    with open(history_path, "rb") as f:
+        assert len(f.read().splitlines()) == len(travel_state.conversation_history)
+
+    checkpoint_manager.active_checkpoints.clear()
+    loaded = checkpoint_manager.load_checkpoint(checkpoint_id)
+    assert list(loaded.conversation_history) == list(travel_state.conversation_history)
+
+
+def test_unlogged_messages_follow_ring_buffer_rotation():
+    """Test that new messages are found after older ones drop off the front."""
+    a, b, c, d = ({"role": "user", "content": text} for text in "abcd")
+
+    assert _unlogged_messages([], [a]) == [a]
+    assert _unlogged_messages([a, b], [a, b, c]) == [c]
+    assert _unlogged_messages([a, b, c], [b, c, d]) == [d]
+    assert _unlogged_messages([a, b], [c, d]) is None
+
+
+def test_save_checkpoint_in_background(checkpoint_manager, travel_state):
+    """Test that background saves are loadable immediately and reach disk."""
+    checkpoint_id = checkpoint_manager.save_checkpoint_in_background(travel_state)
+
+    # Available from memory before the write is confirmed
+    assert checkpoint_manager.load_checkpoint(checkpoint_id).plan.overview == (
+        "Three days in Paris"
+    )
+
+    assert checkpoint_manager.wait_for_checkpoint(checkpoint_id) == checkpoint_id
+    checkpoint_manager.active_checkpoints.clear()
+    loaded = checkpoint_manager.load_checkpoint(checkpoint_id)
+    assert loaded.query.destination == "Paris"
+
+
+def test_failed_background_save_is_logged(checkpoint_manager, travel_state):
+    """Test that a background write error is logged even if nobody waits."""
+    with (
+        patch.object(
+            checkpoint_manager, "_write_checkpoint", side_effect=OSError("disk full")
+        ),
+        patch(
+            "travel_planner.orchestration.serialization.checkpoint.logger"
+        ) as mock_logger,
+    ):
+        checkpoint_id = checkpoint_manager.save_checkpoint_in_background(travel_state)
+        with pytest.raises(OSError):
+            checkpoint_manager.wait_for_checkpoint(checkpoint_id)
+        # The writer runs done-callbacks before taking its next job
+        _CHECKPOINT_POOL.submit(lambda: None).result()
+
+    mock_logger.opt.assert_called_once()
+    assert isinstance(mock_logger.opt.call_args.kwargs["exception"], OSError)
+
+
+def test_background_saves_reach_disk_in_order(checkpoint_manager, travel_state):
+    """Test that the latest background save of a checkpoint wins on disk."""
+    checkpoint_id = checkpoint_manager.save_checkpoint_in_background(travel_state)
+    travel_state.plan.overview = "Four days in Paris"
+    checkpoint_manager.save_checkpoint_in_background(travel_state)
+
+    checkpoint_manager.wait_for_checkpoint(checkpoint_id)
+    checkpoint_manager.active_checkpoints.clear()
+    loaded = checkpoint_manager.load_checkpoint(checkpoint_id)
+    assert loaded.plan.overview == "Four days in Paris"
+
+
+def test_queued_write_never_overwrites_a_later_save(tmp_path, travel_state):
+    """Test that a background write still queued loses to a later direct save."""
+    manager = CheckpointManager(checkpoint_dir=str(tmp_path))
+    release = threading.Event()
+    _CHECKPOINT_POOL.submit(release.wait)
+    checkpoint_id = manager.save_checkpoint_in_background(travel_state)
+    travel_state.plan.overview = "Four days in Paris"
+    manager.save_checkpoint(travel_state)
+    release.set()
+    _CHECKPOINT_POOL.submit(lambda: None).result()
+
+    reloaded = CheckpointManager(checkpoint_dir=str(tmp_path)).load_checkpoint(
+        checkpoint_id
+    )
+    assert reloaded.plan.overview == "Four days in Paris"
+
+
+def test_queued_write_is_dropped_by_delete(tmp_path, travel_state):
+    """Test that a deleted checkpoint does not reappear from a queued write."""
+    manager = CheckpointManager(checkpoint_dir=str(tmp_path))
+    release = threading.Event()
+    _CHECKPOINT_POOL.submit(release.wait)
+    checkpoint_id = manager.save_checkpoint_in_background(travel_state)
+    manager.delete_checkpoint(checkpoint_id)
+    release.set()
+    _CHECKPOINT_POOL.submit(lambda: None).result()
+
+    assert not [name for name in os.listdir(tmp_path) if checkpoint_id in name]
+    with pytest.raises(ValueError):
+        CheckpointManager(checkpoint_dir=str(tmp_path)).load_checkpoint(checkpoint_id)
+
+
+def test_deferred_checkpoint_stays_in_memory_until_flushed(
+    checkpoint_manager, travel_state
+):
+    """Test that persist=False skips the disk write until the next flush."""
+    with patch("atexit.register"):
+        checkpoint_id = checkpoint_manager.save_checkpoint(travel_state, persist=False)
+    path = os.path.join(
+        checkpoint_manager.checkpoint_dir, f"{checkpoint_id}{codec.FILE_SUFFIX}"
+    )
+
+    assert not os.path.exists(path)
+    checkpoint_manager.active_checkpoints.clear()
+    assert checkpoint_manager.load_checkpoint(checkpoint_id).query.destination == (
+        "Paris"
+    )
+
+    assert checkpoint_manager.flush_pending_checkpoints() == 1
+    assert os.path.exists(path)
+    assert checkpoint_manager.pending_flush == {}
+    assert checkpoint_manager._flush_timer is None
+
+
+def test_flush_never_overwrites_a_newer_save(checkpoint_manager, travel_state):
+    """Test that a save racing a deferred flush still ends up on disk last."""
+    with patch("atexit.register"):
+        checkpoint_id = checkpoint_manager.save_checkpoint(travel_state, persist=False)
+    write = checkpoint_manager._write_checkpoint
+    saver = threading.Thread(
+        target=checkpoint_manager.save_checkpoint, args=(travel_state,)
+    )
+
+    def slow_flush_write(checkpoint_id, checkpoint_data):
+        # The newer save starts while the flush is still writing
+        if not saver.is_alive() and travel_state.error is None:
+            travel_state.error = "Train strike"
+            saver.start()
+            time.sleep(0.05)
+        write(checkpoint_id, checkpoint_data)
+
+    with patch.object(
+        checkpoint_manager, "_write_checkpoint", side_effect=slow_flush_write
+    ):
+        checkpoint_manager.flush_pending_checkpoints()
+        saver.join()
+
+    fresh = CheckpointManager(checkpoint_dir=checkpoint_manager.checkpoint_dir)
+    assert fresh.load_checkpoint(checkpoint_id).error == "Train strike"
+
+
+def test_loaded_state_changes_are_saved(tmp_path, travel_state):
+    """Test that mutating a loaded state does not alter the cached checkpoint."""
+    manager = CheckpointManager(checkpoint_dir=str(tmp_path))
+    travel_state.add_task_result("flight_search", {"flights": []})
+    checkpoint_id = manager.save_checkpoint(travel_state)
+
+    loaded = manager.load_checkpoint(checkpoint_id)
+    loaded.add_task_result("hotel_search", {"hotels": []})
+    manager.save_checkpoint(loaded)
+
+    reloaded = CheckpointManager(checkpoint_dir=str(tmp_path)).load_checkpoint(
+        checkpoint_id
+    )
+    assert reloaded.completed_tasks == ["flight_search", "hotel_search"]
+    assert set(reloaded.task_results) == {"flight_search", "hotel_search"}
+
+
+def test_unchanged_checkpoint_is_not_rewritten(checkpoint_manager, travel_state):
+    """Test that re-saving an unchanged state skips the disk write."""
+    with patch.object(
+        checkpoint_manager,
+        "_write_checkpoint",
+        wraps=checkpoint_manager._write_checkpoint,
+    ) as write:
+        checkpoint_id = checkpoint_manager.save_checkpoint(travel_state)
+        assert checkpoint_manager.save_checkpoint(travel_state) == checkpoint_id
+        assert write.call_count == 1
+
+        travel_state.error = "Flight search failed"
+        checkpoint_manager.save_checkpoint(travel_state)
+        assert write.call_count == 2
+
+
+def test_unchanged_check_ignores_cached_dict(checkpoint_manager, travel_state):
+    """Test that changes to a peeked dict cannot make a real change look saved."""
+    checkpoint_id = checkpoint_manager.save_checkpoint(travel_state)
+    checkpoint_manager.peek_checkpoint(checkpoint_id)["error"] = "Hotel full"
+
+    with patch.object(
+        checkpoint_manager,
+        "_write_checkpoint",
+        wraps=checkpoint_manager._write_checkpoint,
+    ) as write:
+        travel_state.error = "Hotel full"
+        checkpoint_manager.save_checkpoint(travel_state)
+        assert write.call_count == 1
+
+
+def test_failed_write_is_retried_by_next_save(tmp_path, travel_state):
+    """Test that a save after a failed write is not skipped as unchanged."""
+    manager = CheckpointManager(checkpoint_dir=str(tmp_path))
+    with (
+        patch.object(manager, "_write_checkpoint", side_effect=OSError("disk full")),
+        pytest.raises(OSError),
+    ):
+        manager.save_checkpoint(travel_state)
+
+    checkpoint_id = manager.save_checkpoint(travel_state)
+
+    reloaded = CheckpointManager(checkpoint_dir=str(tmp_path)).load_checkpoint(
+        checkpoint_id
+    )
+    assert reloaded.query.destination == "Paris"
+
+
+def test_checkpoint_cache_is_bounded(tmp_path, travel_state):
+    """Test that the in-memory cache evicts the least recently used entry."""
+    manager = CheckpointManager(checkpoint_dir=str(tmp_path), cache_size=2)
+    ids = [
+        manager.save_checkpoint(
+            travel_state.model_copy(update={"state_checkpoint_id": None})
+        )
+        for _ in range(3)
+    ]
+
+    assert list(manager.active_checkpoints) == ids[1:]
+    # Evicted checkpoints still load from disk
+    assert manager.load_checkpoint(ids[0]).plan.overview == "Three days in Paris"
+    assert list(manager.active_checkpoints) == [ids[2], ids[0]]
+
+
+def test_list_checkpoints_uses_index(checkpoint_manager, travel_state):
+    """Test that listing follows saves and deletes, and rebuilds a lost index."""
+    first = checkpoint_manager.save_checkpoint(travel_state)
+    travel_state.update_stage(WorkflowStage.DESTINATION_RESEARCHED)
+    # Re-saving the same state replaces its index entry
+    checkpoint_manager.save_checkpoint(travel_state)
+    other_state = travel_state.model_copy(update={"state_checkpoint_id": None})
+    second = checkpoint_manager.save_checkpoint(other_state)
+    checkpoint_manager.delete_checkpoint(first)
+
+    listed = checkpoint_manager.list_checkpoints()
+    assert [info["checkpoint_id"] for info in listed] == [second]
+    assert listed[0]["workflow_stage"] == str(WorkflowStage.DESTINATION_RESEARCHED)
+
+    os.remove(checkpoint_manager._index_path)
+    with patch.object(codec, "decode") as decode:
+        # Rebuilt from the metadata sidecars alone
+        assert checkpoint_manager.list_checkpoints() == listed
+        decode.assert_not_called()
+    assert os.path.exists(checkpoint_manager._index_path)
+    assert not os.path.exists(checkpoint_manager._meta_path(first))
+
+    # Checkpoints without a sidecar fall back to the full file
+    os.remove(checkpoint_manager._index_path)
+    os.remove(checkpoint_manager._meta_path(second))
+    assert checkpoint_manager.list_checkpoints() == listed
+
+
+def test_index_is_compacted_once_mostly_dead(
+    monkeypatch, checkpoint_manager, travel_state
+):
+    """Test that superseded index rows are dropped once they dominate."""
+    from travel_planner.orchestration.serialization import checkpoint
+
+    monkeypatch.setattr(checkpoint, "INDEX_COMPACT_MIN_DEAD_ROWS", 4)
+    for attempt in range(6):
+        travel_state.error = f"Attempt {attempt} failed"
+        checkpoint_id = checkpoint_manager.save_checkpoint(travel_state)
+
+    listed = checkpoint_manager.list_checkpoints()
+
+    with open(checkpoint_manager._index_path, "rb") as f:
+        assert len(f.read().splitlines()) == 1
+    assert listed[0]["error"] == "Attempt 5 failed"
+    assert checkpoint_manager.list_checkpoints() == listed
+    checkpoint_manager.delete_checkpoint(checkpoint_id)
+    assert checkpoint_manager.list_checkpoints() == []
+
+
+def test_cleanup_old_checkpoints_by_mtime(checkpoint_manager, travel_state):
+    """Test that cleanup removes only checkpoints older than the cutoff."""
+    old_id = checkpoint_manager.save_checkpoint(travel_state)
+    new_state = travel_state.model_copy(update={"state_checkpoint_id": None})
+    new_id = checkpoint_manager.save_checkpoint(new_state)
+    old_path = os.path.join(
+        checkpoint_manager.checkpoint_dir, f"{old_id}{codec.FILE_SUFFIX}"
+    )
+    ten_days_ago = time.time() - 10 * 86400
+    os.utime(old_path, (ten_days_ago, ten_days_ago))
+
+    assert checkpoint_manager.cleanup_old_checkpoints(max_age_days=7) == 1
+    assert [
+        info["checkpoint_id"] for info in checkpoint_manager.list_checkpoints()
+    ] == [new_id]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_codec_round_trip(monkeypatch, use_orjson):
+    """Test that both codec backends agree on the encoded form."""
+    if not use_orjson:
+        monkeypatch.setattr(codec, "orjson", None)
+    stamp = datetime(2026, 5, 1, 12, 30)
+
+    encoded = codec.dumps({"stage": WorkflowStage.COMPLETE, "at": stamp, "n": [1]})
+
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == {
+        "stage": "complete",
+        "at": "2026-05-01T12:30:00",
+        "n": [1],
+    }
+
+
+def test_codec_decode_reads_json_checkpoints(checkpoint_manager, travel_state):
+    """Test that JSON checkpoint files load whatever format new files use."""
+    checkpoint_data = travel_state.create_checkpoint()
+    checkpoint_id = checkpoint_data["checkpoint_id"]
+    path = os.path.join(checkpoint_manager.checkpoint_dir, f"{checkpoint_id}.json")
+    with open(path, "wb") as f:
+        f.write(codec.dumps(checkpoint_data))
+
+    assert codec.decode(codec.encode({"n": [1]})) == {"n": [1]}
+    assert checkpoint_manager.load_checkpoint(checkpoint_id).plan.overview == (
+        "Three days in Paris"
+    )
+    assert checkpoint_manager.delete_checkpoint(checkpoint_id)
+    assert not os.path.exists(path)
+
+
+def test_codec_decode_sniffs_compression(monkeypatch):
+    """Test that compressed and uncompressed payloads both decode."""
+    pytest.importorskip("zstandard")
+    compressed = codec.encode({"n": [1]})
+    monkeypatch.setattr(codec, "zstandard", None)
+    plain = codec.encode({"n": [1]})
+
+    assert compressed != plain
+    assert codec.decode(plain) == {"n": [1]}
+    with pytest.raises(ValueError, match="zstandard"):
+        codec.decode(compressed)
+    monkeypatch.undo()
+    assert codec.decode(compressed) == codec.decode(plain)
+
+
+def test_sqlite_checkpoint_store(tmp_path, travel_state):
+    """Test that the SQLite backend saves, lists, loads and expires checkpoints."""
+    manager = SQLiteCheckpointManager(checkpoint_dir=str(tmp_path))
+    first = manager.save_checkpoint(travel_state)
+    other_state = travel_state.model_copy(update={"state_checkpoint_id": None})
+    other_state.update_stage(WorkflowStage.DESTINATION_RESEARCHED)
+    second = manager.save_checkpoint(other_state)
+
+    assert [info["checkpoint_id"] for info in manager.list_checkpoints()] == [
+        second,
+        first,
+    ]
+    listed = manager.list_checkpoints(stage=str(WorkflowStage.QUERY_ANALYZED))
+    assert [info["checkpoint_id"] for info in listed] == [first]
+    assert listed[0]["workflow_stage"] == str(WorkflowStage.QUERY_ANALYZED)
+
+    manager.active_checkpoints.clear()
+    assert manager.load_checkpoint(first).plan.overview == "Three days in Paris"
+
+    with manager._db_lock:
+        manager._conn.execute(
+            "UPDATE ckpt SET ts = ? WHERE id = ?", ("2000-01-01T00:00:00", second)
+        )
+    assert manager.cleanup_old_checkpoints(max_age_days=7) == 1
+    assert manager.delete_checkpoint(first)
+    assert manager.list_checkpoints() == []
+    with pytest.raises(ValueError, match="not found"):
+        manager.load_checkpoint(first)
+    manager.close()
+
+
+def test_apply_state_diff_leaves_base_untouched(checkpoint_manager, travel_state):
+    """Test that applying an incremental diff rebuilds the state on a copy."""
+    manager = IncrementalCheckpointManager(base_manager=checkpoint_manager)
+    base_state = travel_state.model_copy(deep=True)
+
+    travel_state.update_stage(WorkflowStage.DESTINATION_RESEARCHED)
+    travel_state.plan.overview = "Four days in Paris"
+    diff = manager._calculate_state_diff(
+        base_state.model_dump(), travel_state.model_dump()
+    )
+
+    restored = manager._apply_state_diff(base_state, diff)
+
+    assert restored.current_stage == WorkflowStage.DESTINATION_RESEARCHED
+    assert restored.plan.overview == "Four days in Paris"
+    assert base_state.current_stage == WorkflowStage.QUERY_ANALYZED
+    assert base_state.plan.overview == "Three days in Paris"
+
+
+def test_incremental_save_diffs_without_reloading_base(
+    checkpoint_manager, travel_state
+):
+    """Test that incremental saves diff against a cached dump of the full base."""
+    manager = IncrementalCheckpointManager(base_manager=checkpoint_manager)
+    manager.save_checkpoint(travel_state)
+
+    travel_state.update_stage(WorkflowStage.DESTINATION_RESEARCHED)
+    with patch.object(
+        checkpoint_manager, "load_checkpoint", wraps=checkpoint_manager.load_checkpoint
+    ) as load:
+        checkpoint_id = manager.save_checkpoint(travel_state)
+        load.assert_not_called()
+
+    checkpoint = manager.checkpoints[checkpoint_id]
+    assert checkpoint.parent_id == manager.last_full_checkpoint_id
+    assert "current_stage" in checkpoint.data
+    assert "query" not in checkpoint.data
+    assert (
+        manager.load_checkpoint(checkpoint_id).current_stage
+        == WorkflowStage.DESTINATION_RESEARCHED
+    )
+
+
+def test_incremental_checkpoints_survive_restart(tmp_path, travel_state):
+    """Test that a fresh manager can load increments saved by another one."""
+    manager = IncrementalCheckpointManager(
+        base_manager=CheckpointManager(checkpoint_dir=str(tmp_path))
+    )
+    manager.save_checkpoint(travel_state)
+    travel_state.update_stage(WorkflowStage.DESTINATION_RESEARCHED)
+    checkpoint_id = manager.save_checkpoint(travel_state)
+
+    restarted = IncrementalCheckpointManager(
+        base_manager=CheckpointManager(checkpoint_dir=str(tmp_path))
+    )
+    restored = restarted.load_checkpoint(checkpoint_id)
+
+    assert restored.current_stage is WorkflowStage.DESTINATION_RESEARCHED
+    assert restored.query.destination == "Paris"
+    assert isinstance(restored.last_update_time, int)
+    with pytest.raises(ValueError, match="not found"):
+        restarted.load_checkpoint("incr_missing")
+
+
+def test_new_chain_keeps_older_chain_base(tmp_path, travel_state):
+    """Test that starting a new chain leaves earlier increments loadable."""
+    manager = IncrementalCheckpointManager(
+        base_manager=CheckpointManager(checkpoint_dir=str(tmp_path))
+    )
+    manager.max_chain_length = 1
+    first_id = manager.save_checkpoint(travel_state)
+    travel_state.plan.overview = "Four days in Paris"
+    increment_id = manager.save_checkpoint(travel_state)
+    travel_state.query.destination = "Tokyo"
+    travel_state.plan.overview = "A week in Tokyo"
+    tokyo_id = manager.save_checkpoint(travel_state)
+
+    restarted = IncrementalCheckpointManager(
+        base_manager=CheckpointManager(checkpoint_dir=str(tmp_path))
+    )
+    assert restarted.load_checkpoint(first_id).plan.overview == "Three days in Paris"
+    restored = restarted.load_checkpoint(increment_id)
+    assert restored.query.destination == "Paris"
+    assert restored.plan.overview == "Four days in Paris"
+    restored = restarted.load_checkpoint(tokyo_id)
+    assert restored.query.destination == "Tokyo"
+    assert restored.state_checkpoint_id == travel_state.state_checkpoint_id
+
+
+def test_incremental_saves_in_one_second_get_distinct_ids(
+    checkpoint_manager, travel_state
+):
+    """Test that same-second saves neither share IDs nor files."""
+    manager = IncrementalCheckpointManager(base_manager=checkpoint_manager)
+    manager.save_checkpoint(travel_state)
+    first = manager.save_checkpoint(travel_state)
+    travel_state.plan.overview = "Four days in Paris"
+    second = manager.save_checkpoint(travel_state)
+
+    assert first != second
+    manager.checkpoints.clear()
+    assert manager.load_checkpoint(first).plan.overview == "Three days in Paris"
+
+
+def test_incremental_checkpoints_are_bounded_and_deletable(tmp_path, travel_state):
+    """Test that increments are evicted from memory and removed from disk."""
+    manager = IncrementalCheckpointManager(
+        base_manager=CheckpointManager(checkpoint_dir=str(tmp_path)), cache_size=2
+    )
+    ids = [manager.save_checkpoint(travel_state) for _ in range(3)]
+
+    assert list(manager.checkpoints) == ids[1:]
+    assert manager.load_checkpoint(ids[0]).query.destination == "Paris"
+
+    assert manager.delete_checkpoint(ids[0])
+    assert not manager.delete_checkpoint(ids[0])
+    old_path = manager._incremental_path(ids[1])
+    os.utime(old_path, (0, 0))
+    assert manager.cleanup_old_checkpoints(max_age_days=7) == 1
+    assert not os.path.exists(old_path)
+    assert manager.load_checkpoint(ids[2]).query.destination == "Paris"
+
+
+def test_json_patch_increments_record_only_changed_paths(
+    monkeypatch, tmp_path, travel_state
+):
+    """Test that JSON Patch increments hold nested edits and survive restart."""
+    from travel_planner.config import config
+
+    monkeypatch.setattr(config.system, "checkpoint_json_patch", True)
+    manager = IncrementalCheckpointManager(
+        base_manager=CheckpointManager(checkpoint_dir=str(tmp_path))
+    )
+    manager.save_checkpoint(travel_state)
+
+    travel_state.plan.overview = "Four days in Paris"
+    travel_state.update_stage(WorkflowStage.DESTINATION_RESEARCHED)
+    checkpoint_id = manager.save_checkpoint(travel_state)
+
+    paths = {op["path"] for op in manager.checkpoints[checkpoint_id].data["ops"]}
+    assert "/plan/overview" in paths
+    assert "/plan" not in paths
+
+    restarted = IncrementalCheckpointManager(
+        base_manager=CheckpointManager(checkpoint_dir=str(tmp_path))
+    )
+    restored = restarted.load_checkpoint(checkpoint_id)
+    assert restored.plan.overview == "Four days in Paris"
+    assert restored.current_stage is WorkflowStage.DESTINATION_RESEARCHED
+
+
+def test_json_patch_falls_back_without_jsonpatch(
+    monkeypatch, checkpoint_manager, travel_state
+):
+    """Test that increments store changed fields when jsonpatch is missing."""
+    from travel_planner.config import config
+    from travel_planner.orchestration.serialization import incremental
+
+    monkeypatch.setattr(config.system, "checkpoint_json_patch", True)
+    monkeypatch.setattr(incremental, "jsonpatch", None)
+    manager = IncrementalCheckpointManager(base_manager=checkpoint_manager)
+    manager.save_checkpoint(travel_state)
+
+    travel_state.plan.overview = "Four days in Paris"
+    checkpoint_id = manager.save_checkpoint(travel_state)
+
+    checkpoint = manager.checkpoints[checkpoint_id]
+    assert "format" not in checkpoint.metadata
+    assert set(checkpoint.data) >= {"plan"}
+    assert manager.load_checkpoint(checkpoint_id).plan.overview == (
+        "Four days in Paris"
+    )
+
+
+def test_large_diff_starts_a_new_chain(checkpoint_manager, travel_state):
+    """Test that a diff over the size threshold becomes a full checkpoint."""
+    manager = IncrementalCheckpointManager(
+        base_manager=checkpoint_manager, full_checkpoint_threshold=16
+    )
+    manager.save_checkpoint(travel_state)
+
+    travel_state.update_stage(WorkflowStage.DESTINATION_RESEARCHED)
+    checkpoint_id = manager.save_checkpoint(travel_state)
+
+    assert manager.checkpoints[checkpoint_id].metadata["is_full"]
+    assert manager.chain_length == 0
+    assert (
+        manager.load_checkpoint(checkpoint_id).current_stage
+        == WorkflowStage.DESTINATION_RESEARCHED
+    )
+
+
+def test_checkpoint_ids_sort_by_creation_time():
+    """Test that checkpoint IDs embed a sortable creation timestamp."""
+    with patch(
+        "travel_planner.orchestration.states.planning_state.datetime"
+    ) as mock_datetime:
+        mock_datetime.now.return_value = datetime(2026, 5, 1, 9, 0, 0)
+        earlier = new_checkpoint_id()
+        mock_datetime.now.return_value = datetime(2026, 5, 1, 10, 0, 0)
+        later = new_checkpoint_id()
+
+    assert earlier.startswith("checkpoint_20260501090000_")
+    assert sorted([later, earlier]) == [earlier, later]
+
+
+def test_unused_containers_are_checkpointed_empty():
+    """Test that lazily allocated containers are saved as empty containers."""
+    state = TravelPlanningState()
+    assert state.task_results is None
+
+    checkpoint_data = state.create_checkpoint()
+
+    assert checkpoint_data["task_results"] == {}
+    assert checkpoint_data["human_feedback"] == []
+
+    state.add_task_result("flight_search", {"flights": []})
+    assert state.completed_tasks == ["flight_search"]
+
+
+def test_completed_tasks_stay_unique_after_restore():
+    """Test that task completion is deduplicated across checkpoint restores."""
+    state = TravelPlanningState()
+    state.add_task_result("flight_search", {"flights": []})
+
+    restored = TravelPlanningState.from_checkpoint_data(state.create_checkpoint())
+    restored.add_task_result("flight_search", {"flights": ["AF123"]})
+    restored.add_task_result("activity_planning", {})
+
+    assert restored.completed_tasks == ["flight_search", "activity_planning"]
+    assert restored.task_results["flight_search"]["result"] == {"flights": ["AF123"]}
+
+
+def test_completed_task_index_follows_reassigned_list():
+    """Test that replacing completed_tasks with a same-sized list reindexes it."""
+    state = TravelPlanningState()
+    state.add_task_result("flight_search", {})
+    state.add_task_result("hotel_search", {})
+
+    state.completed_tasks = ["activity_planning", "budget_management"]
+    state.add_task_result("flight_search", {})
+
+    assert state.completed_tasks == [
+        "activity_planning",
+        "budget_management",
+        "flight_search",
+    ]
+
+
+def test_iso_now_matches_datetime_now():
+    """Test that cached ISO timestamps agree with datetime.now()."""
+    before = datetime.now()
+    stamps = [_iso_now() for _ in range(3)]
+    after = datetime.now()
+
+    parsed = [datetime.fromisoformat(stamp) for stamp in stamps]
+    assert before <= parsed[0] <= parsed[-1] <= after
+
+
+def test_checkpoint_hash_tracks_relevant_fields(travel_state):
+    """Test that the checkpoint hash only changes with plan, query or stage."""
+    baseline = travel_state.checkpoint_hash()
+    assert travel_state.model_copy(deep=True).checkpoint_hash() == baseline
+
+    assert travel_state.should_retry("query_analysis")
+    assert travel_state.checkpoint_hash() == baseline
+
+    travel_state.plan.overview = "Four days in Paris"
+    assert travel_state.checkpoint_hash() != baseline
+
+
+def test_generate_final_plan_skips_orchestrator_by_default(travel_state):
+    """Test that the final plan node only calls the LLM when a summary is wanted."""
+    final_plan = importlib.import_module(
+        "travel_planner.orchestration.nodes.final_plan"
+    )
+
+    with (
+        patch.object(final_plan, "OrchestratorAgent") as orchestrator_cls,
+        patch(
+            "travel_planner.orchestration.serialization.checkpoint"
+            ".save_state_checkpoint_in_background",
+            return_value="checkpoint_test",
+        ),
+    ):
+        state = final_plan.generate_final_plan(travel_state)
+
+    orchestrator_cls.assert_not_called()
+    assert state.current_stage == WorkflowStage.COMPLETE
+    assert state.state_checkpoint_id == "checkpoint_test"
+    assert state.task_results["generate_final_plan"]["result"] == {"status": "complete"}
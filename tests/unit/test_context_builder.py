@@ -132,3 +132,46 @@ def test_build_system_prompt_no_location():
     assert "<user_preferences>" in prompt
     assert "<real_time_context>" not in prompt
     assert "<rules>" in prompt
+
+
+def test_build_system_prompt_reuses_assembled_prompt():
+    prefs = UserPreferences(travel_styles=[TravelStyle.GOURMET])
+    location = {"lat": 35.6762, "lng": 139.6503}
+    builder = ContextBuilder()
+    first = builder.build_system_prompt(
+        preferences=prefs, location=location, timestamp="2026-03-01T12:30:00Z"
+    )
+    second = ContextBuilder().build_system_prompt(
+        preferences=prefs.model_copy(),
+        location=dict(location),
+        timestamp="2026-03-01T12:30:45Z",
+    )
+    later = builder.build_system_prompt(
+        preferences=prefs, location=location, timestamp="2026-03-01T12:31:00Z"
+    )
+    assert second is first
+    assert later != first
+    assert "12:31" in later
+
+
+def test_build_system_prompt_static_sections_lead():
+    builder = ContextBuilder()
+    bare = builder.build_system_prompt()
+    prompt = builder.build_system_prompt(
+        preferences=UserPreferences(travel_styles=[TravelStyle.NATURE]),
+        location={"lat": 34.6937, "lng": 135.5023},
+        timestamp="2026-01-10T19:00:00Z",
+    )
+    assert prompt.startswith(bare)
+    assert prompt.index("</rules>") < prompt.index("<user_preferences>")
+    assert prompt.index("<user_preferences>") < prompt.index("<real_time_context>")
+
+
+def test_build_and_system_prompt_share_time_labels():
+    builder = ContextBuilder()
+    timestamp = "2026-01-10T12:15:00Z"
+    ctx = builder.build(message="Lunch?", timestamp=timestamp)
+    prompt = builder.build_system_prompt(timestamp=timestamp)
+    assert ctx["time_of_day"] == "lunchtime"
+    assert ctx["day_of_week"] == "Saturday"
+    assert "Time: lunchtime (Saturday 12:15)" in prompt
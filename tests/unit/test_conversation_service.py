@@ -7,9 +7,12 @@ import pytest
 
 os.environ.setdefault("GEMINI_API_KEY", "test-key")
 
-from travel_planner.data.conversation_models import MessageRole
+from travel_planner.data.conversation_models import Message, MessageRole
 from travel_planner.data.preferences import CuisineType, UserPreferences
-from travel_planner.services.conversation_service import ConversationService
+from travel_planner.services.conversation_service import (
+    MAX_HISTORY_MESSAGES,
+    ConversationService,
+)
 
 
 @pytest.fixture
@@ -18,7 +21,7 @@ def mock_repo():
     repo.get_preferences.return_value = UserPreferences(
         cuisine_types=[CuisineType.JAPANESE],
     )
-    repo.get_messages.return_value = []
+    repo.get_recent_messages.return_value = []
     repo.get_conversation.return_value = None
     return repo
 
@@ -63,3 +66,78 @@ async def test_handle_chat_loads_preferences(service, mock_repo):
         message="Recommend lunch",
     )
     mock_repo.get_preferences.assert_called_with("123")
+
+
+async def test_handle_chat_new_conversation_skips_history(service, mock_repo):
+    await service.handle_chat(user_id="123", message="Recommend lunch")
+    mock_repo.save_conversation.assert_called_once()
+    mock_repo.get_recent_messages.assert_not_called()
+
+
+async def test_handle_chat_continues_message_sequence(service, mock_repo):
+    # Only the latest window of a longer conversation is loaded
+    mock_repo.get_recent_messages.return_value = [
+        Message(
+            conversation_id="existing-conv",
+            sequence=41,
+            role=MessageRole.USER,
+            content="Lunch ideas?",
+        ),
+        Message(
+            conversation_id="existing-conv",
+            sequence=42,
+            role=MessageRole.ASSISTANT,
+            content="Try soba.",
+        ),
+    ]
+    result = await service.handle_chat(
+        user_id="123",
+        message="And dinner?",
+        conversation_id="existing-conv",
+    )
+    mock_repo.get_recent_messages.assert_called_once_with(
+        "existing-conv", MAX_HISTORY_MESSAGES
+    )
+    mock_repo.get_messages.assert_not_called()
+    saved = [c.args[0] for c in mock_repo.save_message.call_args_list]
+    assert [m.sequence for m in saved] == [43, 44]
+    assert saved[0].role == MessageRole.USER
+    assert result["message_id"] == "000044"
+
+
+async def test_handle_chat_caches_response(mock_repo, mock_agent):
+    cache = MagicMock()
+    cache.get.return_value = None
+    service = ConversationService(repo=mock_repo, agent=mock_agent, cache=cache)
+
+    await service.handle_chat(user_id="123", message="Where should I eat?")
+
+    key = cache.get.call_args.args[0]
+    cache.set.assert_called_once_with(key, "Try the ramen at Ichiran!")
+
+
+async def test_handle_chat_uses_cached_response(mock_repo, mock_agent):
+    cache = MagicMock()
+    cache.get.return_value = "Cached ramen tip"
+    service = ConversationService(repo=mock_repo, agent=mock_agent, cache=cache)
+
+    result = await service.handle_chat(user_id="123", message="Where should I eat?")
+
+    assert result["response"] == "Cached ramen tip"
+    mock_agent.chat.assert_not_called()
+    cache.set.assert_not_called()
+    assert mock_repo.save_message.call_count == 2
+
+
+async def test_handle_chat_cache_key_ignores_case_and_punctuation(
+    mock_repo, mock_agent
+):
+    cache = MagicMock()
+    cache.get.return_value = None
+    service = ConversationService(repo=mock_repo, agent=mock_agent, cache=cache)
+
+    await service.handle_chat(user_id="123", message="Best ramen in Tokyo?")
+    await service.handle_chat(user_id="123", message="best  ramen in tokyo")
+
+    first, second = (c.args[0] for c in cache.get.call_args_list)
+    assert first == second
@@ -85,6 +85,23 @@ def test_query_with_sk_prefix(mock_boto3):
     assert "KeyConditionExpression" in call_kwargs
 
 
+def test_query_gsi1_many_keeps_key_order(mock_boto3):
+    mock, mock_table = mock_boto3
+    mock_table.meta.client.query.side_effect = lambda **kwargs: {
+        "Items": [
+            {"PK": kwargs["KeyConditionExpression"].get_expression()["values"][1]}
+        ]
+    }
+    client = DynamoDBClient(table_name="test-table", region="ap-northeast-1")
+    results = client.query_gsi1_many(["GEOHASH#a", "GEOHASH#b", "GEOHASH#c"])
+    assert [items[0]["PK"] for items in results] == [
+        "GEOHASH#a",
+        "GEOHASH#b",
+        "GEOHASH#c",
+    ]
+    assert mock_table.meta.client.query.call_args[1]["IndexName"] == "GSI1"
+
+
 def test_delete_item(mock_boto3):
     mock, mock_table = mock_boto3
     client = DynamoDBClient(table_name="test-table", region="ap-northeast-1")
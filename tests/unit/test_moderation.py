@@ -36,3 +36,9 @@ def test_output_with_pii_email():
     result = moderate_output("Contact them at user@example.com for booking")
     assert not result.is_safe
     assert "PII" in result.reason
+
+
+def test_output_with_pii_phone():
+    result = moderate_output("Call the ryokan on 090-1234-5678 to reserve")
+    assert not result.is_safe
+    assert result.reason == "PII detected: phone number"
@@ -2,7 +2,9 @@
 Unit tests for the parallel execution functionality.
 """
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+import importlib
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -12,8 +14,11 @@ from travel_planner.orchestration.parallel import (
     ParallelResult,
     ParallelTask,
     combine_parallel_branch_results,
+    configure_event_loop,
     execute_in_parallel,
+    iter_parallel_results,
     merge_parallel_results,
+    parallel_search_tasks,
 )
 from travel_planner.orchestration.states.planning_state import TravelPlanningState
 
@@ -105,6 +110,85 @@ async def test_execute_in_parallel_with_error(mock_agent):
     assert results["Agent2"]["error"] == "Test error"
 
 
+@pytest.mark.asyncio
+async def test_iter_parallel_results_yields_in_completion_order(travel_state):
+    """Test that results are yielded as soon as each task finishes."""
+
+    def make_agent(name, delay):
+        agent = MagicMock(spec=BaseAgent)
+        agent.name = name
+
+        async def process(**kwargs):
+            await asyncio.sleep(delay)
+            return {"agent": name}
+
+        agent.process = process
+        return agent
+
+    tasks = [(make_agent("SlowAgent", 0.05), {}), (make_agent("FastAgent", 0), {})]
+
+    names = [name async for name, _ in iter_parallel_results(tasks, travel_state)]
+
+    assert names == ["FastAgent", "SlowAgent"]
+
+
+@pytest.mark.asyncio
+async def test_iter_parallel_results_cancels_stragglers_on_timeout(travel_state):
+    """Test that tasks still running when the caller times out are torn down."""
+    finished = []
+
+    async def process(**kwargs):
+        try:
+            await asyncio.sleep(10)
+        finally:
+            finished.append(True)
+
+    agent = MagicMock(spec=BaseAgent)
+    agent.name = "StuckAgent"
+    agent.process = process
+
+    with pytest.raises(TimeoutError):
+        async with asyncio.timeout(0.01):
+            async for _ in iter_parallel_results([(agent, {})], travel_state):
+                pass
+
+    assert finished == [True]
+
+
+@pytest.mark.asyncio
+async def test_execute_in_parallel_respects_concurrency_limit(
+    travel_state, monkeypatch
+):
+    """Test that agent calls never exceed the configured concurrency."""
+    from travel_planner.config import config
+
+    monkeypatch.setattr(config.system, "max_concurrency", 2)
+    running = 0
+    peak = 0
+
+    def make_agent(name):
+        agent = MagicMock(spec=BaseAgent)
+        agent.name = name
+
+        async def process(**kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {"agent": name}
+
+        agent.process = process
+        return agent
+
+    tasks = [(make_agent(f"Agent{i}"), {}) for i in range(5)]
+
+    results = await execute_in_parallel(tasks, travel_state)
+
+    assert len(results) == 5
+    assert peak == 2
+
+
 def test_merge_parallel_results(travel_state):
     """Test merging results from parallel execution into the state."""
     # Create sample results
@@ -166,6 +250,57 @@ def test_merge_parallel_results_with_errors(travel_state):
     assert "API rate limit exceeded" in updated_state.plan.alerts[0]
 
 
+@pytest.mark.asyncio
+async def test_parallel_search_tasks_leaves_caller_state_untouched(travel_state):
+    """Test that the copy-on-write working state never writes through."""
+    travel_state.plan.alerts = ["Existing alert"]
+
+    async def results(tasks, state):
+        yield "FlightSearchAgent", {"result": {"flights": [{"id": "AF1"}]}}
+        yield "AccommodationAgent", {"result": None, "error": "API error"}
+
+    with (
+        patch("travel_planner.orchestration.parallel.FlightSearchAgent"),
+        patch("travel_planner.orchestration.parallel.AccommodationAgent"),
+        patch("travel_planner.orchestration.parallel.TransportationAgent"),
+        patch("travel_planner.orchestration.parallel.ActivityPlanningAgent"),
+        patch("travel_planner.orchestration.parallel.iter_parallel_results", results),
+    ):
+        updated_state = await parallel_search_tasks(travel_state)
+
+    assert updated_state.plan.flights == [{"id": "AF1"}]
+    assert updated_state.plan.alerts == [
+        "Existing alert",
+        "AccommodationAgent: API error",
+    ]
+    assert travel_state.plan.alerts == ["Existing alert"]
+    assert not travel_state.plan.flights
+
+
+@pytest.mark.asyncio
+async def test_parallel_search_tasks_reuses_agents(travel_state):
+    """Test that agents are built once per event loop, not once per search."""
+    seen = []
+
+    async def results(tasks, state):
+        seen.append([agent for agent, _params in tasks])
+        return
+        yield
+
+    with (
+        patch("travel_planner.orchestration.parallel.FlightSearchAgent") as flight,
+        patch("travel_planner.orchestration.parallel.AccommodationAgent"),
+        patch("travel_planner.orchestration.parallel.TransportationAgent"),
+        patch("travel_planner.orchestration.parallel.ActivityPlanningAgent"),
+        patch("travel_planner.orchestration.parallel.iter_parallel_results", results),
+    ):
+        await parallel_search_tasks(travel_state)
+        await parallel_search_tasks(travel_state)
+
+    flight.assert_called_once()
+    assert seen[0] == seen[1]
+
+
 def test_combine_parallel_branch_results(travel_state):
     """Test combining results from LangGraph parallel branch execution."""
     # Create sample branch results
@@ -244,3 +379,114 @@ def test_combine_parallel_branch_results_with_errors(travel_state):
     assert len(updated_state.plan.alerts) == 1
     assert "accommodation" in updated_state.plan.alerts[0].lower()
     assert "API error" in updated_state.plan.alerts[0]
+
+
+def test_combine_parallel_branch_results_without_usable_results(travel_state):
+    """Test that branches with no clean result leave the state untouched."""
+    stage = travel_state.current_stage
+    branch_results = {
+        "accommodation": ParallelResult(
+            task_type=ParallelTask.ACCOMMODATION,
+            result={},
+            error="API error",
+            completed=False,
+        ),
+    }
+
+    updated_state = combine_parallel_branch_results(travel_state, branch_results)
+
+    assert updated_state.current_stage == stage
+    assert not updated_state.plan.alerts
+
+
+def test_branch_tasks_return_deltas_merged_by_combine(travel_state):
+    """Test that branch tasks return partial updates folded in on combine."""
+    from travel_planner.orchestration.nodes.parallel_search import (
+        combine_search_results,
+    )
+
+    # The package re-exports the node function under the module's name
+    flight_module = importlib.import_module(
+        "travel_planner.orchestration.nodes.flight_search"
+    )
+
+    agent = MagicMock()
+    agent.invoke.return_value = {"flight_options": [{"airline": "Air France"}]}
+
+    with patch.object(flight_module, "FlightSearchAgent", return_value=agent):
+        update = flight_module.flight_search_task(travel_state)
+
+    # The task must not touch the shared state
+    assert travel_state.branch_results == {}
+    assert not travel_state.plan.flights
+    assert list(update) == ["branch_results"]
+
+    travel_state.branch_results = update["branch_results"]
+    combined = combine_search_results(travel_state)
+
+    assert combined.plan.flights == [{"airline": "Air France"}]
+    assert "1 flights" in combined.conversation_history[-1].content
+
+
+def test_branch_agents_cannot_write_shared_state(travel_state):
+    """Test that a branch agent writing to the state fails the branch only."""
+    flight_module = importlib.import_module(
+        "travel_planner.orchestration.nodes.flight_search"
+    )
+
+    def invoke(state):
+        state.error = "written by a branch"
+        return {}
+
+    agent = MagicMock()
+    agent.invoke.side_effect = invoke
+
+    with patch.object(flight_module, "FlightSearchAgent", return_value=agent):
+        update = flight_module.flight_search_task(travel_state)
+
+    assert travel_state.error is None
+    branch = update["branch_results"][ParallelTask.FLIGHT_SEARCH.value]
+    assert not branch.completed
+    assert "read-only" in branch.error
+
+
+def test_parallel_result_is_slotted_and_frozen():
+    """Test that ParallelResult is a compact, immutable record."""
+    result = ParallelResult(task_type=ParallelTask.BUDGET, result={}, completed=True)
+
+    assert not hasattr(result, "__dict__")
+    with pytest.raises(AttributeError):
+        result.completed = False
+
+
+def test_configure_event_loop_opt_out(monkeypatch):
+    """Test that the uvloop policy is not installed when disabled."""
+    monkeypatch.setenv("TRAVEL_PLANNER_DISABLE_UVLOOP", "1")
+
+    with patch("asyncio.set_event_loop_policy") as set_policy:
+        assert configure_event_loop() is False
+
+    set_policy.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_transportation_task_awaits_agent(travel_state):
+    """Test that the transportation branch awaits a shared agent asynchronously."""
+    transport_module = importlib.import_module(
+        "travel_planner.orchestration.nodes.transportation_planning"
+    )
+
+    agent = MagicMock()
+    agent.ainvoke = AsyncMock(return_value={"transportation_options": {"metro": 1}})
+
+    with patch(
+        "travel_planner.orchestration.parallel.TransportationAgent", return_value=agent
+    ) as agent_cls:
+        update = await transport_module.transportation_task(travel_state)
+        await transport_module.transportation_task(travel_state)
+
+    agent_cls.assert_called_once()
+    agent.invoke.assert_not_called()
+    branch = update["branch_results"][ParallelTask.TRANSPORTATION.value]
+    assert branch.completed
+    assert branch.result == {"transportation_options": {"metro": 1}}
@@ -20,8 +20,9 @@ def test_get_neighbor_hashes():
 
 def test_find_nearby_places():
     mock_repo = MagicMock()
-    mock_repo.get_places_by_geohash.return_value = []
+    mock_repo.get_places_by_geohashes.return_value = []
     service = PlaceService(repo=mock_repo)
     places = service.find_nearby(35.6812, 139.7671)
     assert isinstance(places, list)
-    assert mock_repo.get_places_by_geohash.call_count >= 1
+    mock_repo.get_places_by_geohashes.assert_called_once()
+    assert len(mock_repo.get_places_by_geohashes.call_args.args[0]) == 9
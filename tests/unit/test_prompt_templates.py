@@ -1,6 +1,10 @@
 """Tests for prompt template management."""
 
-from travel_planner.prompts.templates import PromptTemplate, render_template
+from travel_planner.prompts.templates import (
+    PromptTemplate,
+    render_batch,
+    render_template,
+)
 
 
 def test_render_template_basic():
@@ -51,3 +55,49 @@ def test_prompt_template_render():
     )
     result = pt.render(category="restaurant", location="Shinjuku")
     assert result == "Recommend a restaurant near Shinjuku"
+
+
+def test_render_template_substitutes_in_one_pass():
+    template = "{greeting} {name}"
+    result = render_template(template, greeting="Hi {name},", name="Tanaka")
+    assert result == "Hi {name}, Tanaka"
+
+
+def test_prompt_template_render_many():
+    pt = PromptTemplate(
+        template_id="recommend_spot",
+        version=1,
+        template="Recommend a {category} near {location}",
+    )
+    results = pt.render_many(
+        [
+            {"category": "cafe", "location": "Ginza"},
+            {"category": "bar"},
+        ]
+    )
+    assert results == [
+        "Recommend a cafe near Ginza",
+        "Recommend a bar near {location}",
+    ]
+
+
+def test_render_batch_renders_each_variant():
+    variants = [
+        PromptTemplate(
+            template_id="recommend_spot",
+            version=1,
+            template="Recommend a {category} near {location}",
+            ab_variant="A",
+        ),
+        PromptTemplate(
+            template_id="recommend_spot",
+            version=2,
+            template="Suggest one {category} in {location}",
+            ab_variant="B",
+        ),
+    ]
+    results = render_batch(variants, category="cafe", location="Ginza")
+    assert results == [
+        "Recommend a cafe near Ginza",
+        "Suggest one cafe in Ginza",
+    ]
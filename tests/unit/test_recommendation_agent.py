@@ -46,3 +46,16 @@ async def test_recommend_with_preferences(mock_genai):
     )
     assert result is not None
     mock_genai.aio.models.generate_content.assert_called_once()
+
+
+async def test_recommend_renders_preferences_once(mock_genai):
+    prefs = UserPreferences(cuisine_types=[CuisineType.JAPANESE])
+    agent = RecommendationAgent()
+    with patch.object(
+        UserPreferences,
+        "to_prompt_context",
+        autospec=True,
+        return_value="Cuisine: Japanese",
+    ) as render:
+        await agent.recommend(preferences=prefs, category="restaurant")
+    render.assert_called_once_with(prefs)
@@ -150,3 +150,22 @@ def test_get_messages(repo, mock_db):
     msgs = repo.get_messages("789")
     assert len(msgs) == 1
     mock_db.query.assert_called_with(pk="CONVERSATION#789#MESSAGE")
+
+
+def test_get_recent_messages(repo, mock_db):
+    mock_db.query.return_value = [
+        {
+            "Data": {
+                "conversation_id": "789",
+                "sequence": seq,
+                "role": "user",
+                "content": f"Message {seq}",
+            },
+        }
+        for seq in (30, 29)
+    ]
+    msgs = repo.get_recent_messages("789", limit=2)
+    assert [m.sequence for m in msgs] == [29, 30]
+    mock_db.query.assert_called_with(
+        pk="CONVERSATION#789#MESSAGE", limit=2, scan_forward=False
+    )
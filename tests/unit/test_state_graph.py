@@ -13,7 +13,11 @@ from travel_planner.orchestration.core.agent_registry import (
     register_agent,
     register_default_agents,
 )
-from travel_planner.orchestration.states.planning_state import TravelPlanningState
+from travel_planner.orchestration.states.planning_state import (
+    MAX_CONVERSATION_HISTORY,
+    Msg,
+    TravelPlanningState,
+)
 from travel_planner.orchestration.states.workflow_stages import WorkflowStage
 
 
@@ -54,6 +58,21 @@ def test_register_default_agents():
         mock_register_defaults.assert_called_once()
 
 
+def test_register_defaults_creates_agents_once():
+    """Test that repeated default registration reuses the existing agents."""
+    registry = AgentRegistry()
+
+    with patch("travel_planner.agents.base.genai.Client"):
+        registry.register_defaults()
+        orchestrator = registry.get("orchestrator")
+        registry.register_defaults()
+        assert registry.get("orchestrator") is orchestrator
+
+        registry.clear()
+        registry.register_defaults()
+        assert registry.get("orchestrator") is not orchestrator
+
+
 def test_travel_planning_state():
     """Test TravelPlanningState functionality."""
     # Create initial state with TravelQuery
@@ -70,7 +89,7 @@ def test_travel_planning_state():
     # Test stage transitions
     state.update_stage(WorkflowStage.QUERY_ANALYZED)
     assert state.current_stage == WorkflowStage.QUERY_ANALYZED
-    assert str(WorkflowStage.QUERY_ANALYZED) in state.stage_times
+    assert WorkflowStage.QUERY_ANALYZED.value in state.stage_times
 
     # Test error handling
     state.mark_error("Test error")
@@ -79,6 +98,158 @@ def test_travel_planning_state():
     assert state.current_stage == WorkflowStage.ERROR
 
 
+def test_conversation_history_ring_buffer():
+    """Test that conversation history is bounded and serializes to dicts."""
+    from travel_planner.data.models import TravelQuery
+
+    state = TravelPlanningState(
+        query=TravelQuery(raw_query="Plan a trip to Paris"),
+        conversation_history=[{"role": "user", "content": "Plan a trip to Paris"}],
+    )
+    assert state.conversation_history[0] == Msg("user", "Plan a trip to Paris")
+
+    for i in range(MAX_CONVERSATION_HISTORY + 10):
+        state.conversation_history.append(Msg("system", f"message {i}"))
+
+    assert len(state.conversation_history) == MAX_CONVERSATION_HISTORY
+    assert state.conversation_history[-1].content == (
+        f"message {MAX_CONVERSATION_HISTORY + 9}"
+    )
+
+    checkpoint = state.create_checkpoint()
+    assert checkpoint["conversation_history"][-1] == {
+        "role": "system",
+        "content": f"message {MAX_CONVERSATION_HISTORY + 9}",
+    }
+
+
+def test_state_transaction_commits_or_discards():
+    """Test that transaction updates apply together and are dropped on error."""
+    state = TravelPlanningState()
+
+    with pytest.raises(RuntimeError), state.transaction() as txn:
+        txn.update_stage(WorkflowStage.FLIGHTS_SEARCHED)
+        txn.append_message(Msg("system", "Found 2 flights"))
+        raise RuntimeError("processing failed")
+
+    assert state.current_stage == WorkflowStage.START
+    assert not state.conversation_history
+
+    with state.transaction() as txn:
+        txn.update_stage(WorkflowStage.FLIGHTS_SEARCHED)
+        txn.append_message(Msg("system", "Found 2 flights"))
+        txn.add_task_result("flight_search", {"flights": []})
+
+    assert state.current_stage == WorkflowStage.FLIGHTS_SEARCHED
+    assert state.conversation_history[-1] == Msg("system", "Found 2 flights")
+    assert state.completed_tasks == ["flight_search"]
+
+
+def test_exhausted_retries_mark_terminal_failure():
+    """Test that a task out of retries routes the workflow to error handling."""
+    from travel_planner.orchestration.nodes.base_node import execute_agent_task
+    from travel_planner.orchestration.routing.conditions import has_terminal_failure
+
+    state = TravelPlanningState(retry_count={"flight_search": 3})
+    agent = MagicMock()
+    agent.invoke.side_effect = RuntimeError("search backend down")
+
+    state = execute_agent_task(
+        state=state,
+        agent=agent,
+        task_name="flight_search",
+        complete_stage=WorkflowStage.FLIGHTS_SEARCHED,
+        result_formatter=str,
+    )
+
+    assert state.current_stage == WorkflowStage.ERROR
+    assert state.terminal_failure
+    assert has_terminal_failure(state) == "true"
+
+
+def test_failing_task_routes_graph_to_error_handling():
+    """Test that a task failing on every retry ends the graph in handle_error."""
+    from travel_planner.data.models import TravelQuery
+    from travel_planner.orchestration.core.graph_builder import create_planning_graph
+
+    research_agent = MagicMock()
+    research_agent.return_value.invoke.side_effect = RuntimeError("backend down")
+
+    with (
+        patch("travel_planner.orchestration.nodes.query_analysis.OrchestratorAgent"),
+        patch(
+            "travel_planner.orchestration.nodes.destination_research."
+            "DestinationResearchAgent",
+            research_agent,
+        ),
+        patch(
+            "travel_planner.orchestration.routing.error_recovery.save_state_checkpoint",
+            return_value="checkpoint_error",
+        ),
+    ):
+        result = create_planning_graph().invoke(
+            TravelPlanningState(query=TravelQuery(raw_query="Somewhere warm"))
+        )
+
+    # The first attempt plus three retries
+    assert research_agent.return_value.invoke.call_count == 4
+    assert result["terminal_failure"]
+    assert result["current_stage"] == WorkflowStage.ERROR
+    assert result["conversation_history"][-1] == Msg(
+        "system", "Error occurred: Error during destination_research: backend down"
+    )
+
+
+def test_final_plan_retries_in_place():
+    """Test that a failed final plan generation is retried before giving up."""
+    from travel_planner.orchestration.nodes.final_plan import generate_final_plan
+
+    state = TravelPlanningState(generate_summary=True)
+    with (
+        patch(
+            "travel_planner.orchestration.nodes.final_plan.OrchestratorAgent"
+        ) as orchestrator,
+        patch(
+            "travel_planner.orchestration.serialization.checkpoint."
+            "save_state_checkpoint_in_background",
+            return_value="checkpoint_final",
+        ),
+    ):
+        orchestrator.return_value.invoke.side_effect = [
+            RuntimeError("rate limited"),
+            {"status": "complete"},
+        ]
+        state = generate_final_plan(state)
+
+    assert state.current_stage == WorkflowStage.COMPLETE
+    assert not state.terminal_failure
+    assert state.retry_count == {"generate_final_plan": 1}
+
+
+def test_plan_complete_requires_every_component():
+    """Test that plan_complete marks the state complete only once all parts exist."""
+    from travel_planner.data.models import TravelPlan
+    from travel_planner.orchestration.routing.conditions import plan_complete
+
+    # Component models are irrelevant to the check, so skip their validation
+    state = TravelPlanningState(
+        plan=TravelPlan.model_construct(
+            destination={"name": "Paris"},
+            flights=[{"airline": "Air France"}],
+            accommodation=[{"name": "Hotel Paris"}],
+            activities={"day1": ["Louvre"]},
+            transportation={"metro": {}},
+            budget=None,
+        )
+    )
+    assert not plan_complete(state)
+    assert state.current_stage != WorkflowStage.COMPLETE
+
+    state.plan.budget = {"total": 1000}
+    assert plan_complete(state)
+    assert state.current_stage == WorkflowStage.COMPLETE
+
+
 def test_create_planning_graph():
     """Test creation of the planning graph."""
     # This is a high-level test just to ensure the create_planning_graph function exists
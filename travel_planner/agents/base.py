@@ -93,9 +93,22 @@ class BaseAgent(Generic[T]):
     def invoke(self, state: Any) -> dict[str, Any]:
         """Synchronous bridge for LangGraph node calls.
 
-        Extracts input from the workflow state and calls the async run()
-        method via asyncio.run(). Safe because LangGraph runs sync nodes
-        in a thread pool with no running event loop.
+        Runs ainvoke() via asyncio.run(). Safe because LangGraph runs sync
+        nodes in a thread pool with no running event loop.
+
+        Args:
+            state: TravelPlanningState (or similar) passed by LangGraph
+
+        Returns:
+            Result dictionary suitable for node consumption
+        """
+        return asyncio.run(self.ainvoke(state))
+
+    async def ainvoke(self, state: Any) -> dict[str, Any]:
+        """Asynchronous bridge for LangGraph node calls.
+
+        Extracts input from the workflow state and awaits the run() method,
+        letting async nodes overlap the agent call with other work.
 
         Args:
             state: TravelPlanningState (or similar) passed by LangGraph
@@ -104,14 +117,19 @@ class BaseAgent(Generic[T]):
             Result dictionary suitable for node consumption
         """
         # Extract input from state
+        input_data: list[dict[str, Any]] | str
         if hasattr(state, "conversation_history") and state.conversation_history:
-            input_data = state.conversation_history
+            # History entries may be compact records; agents expect plain dicts
+            input_data = [
+                msg._asdict() if hasattr(msg, "_asdict") else msg
+                for msg in state.conversation_history
+            ]
         elif hasattr(state, "query") and state.query:
             input_data = getattr(state.query, "raw_query", "") or str(state.query)
         else:
             input_data = "Plan a trip"
 
-        result = asyncio.run(self.run(input_data))
+        result = await self.run(input_data)
 
         # Flatten nested "result" key for node compatibility
         if (
@@ -42,13 +42,15 @@ class RecommendationAgent(BaseAgent):
         timestamp: str | None = None,
     ) -> str:
         """Generate recommendations based on preferences and context."""
+        # Rendered once for both the system prompt and the request message
+        pref_text = preferences.to_prompt_context()
         system_prompt = self.context_builder.build_system_prompt(
             preferences=preferences,
             location=location,
             timestamp=timestamp,
+            preferences_text=pref_text,
         )
 
-        pref_text = preferences.to_prompt_context()
         message = (
             f"Recommend {category} options. "
             f"User preferences: {pref_text}"
@@ -28,6 +28,13 @@ class LogLevel(str, Enum):
     CRITICAL = "CRITICAL"
 
 
+class CheckpointBackend(str, Enum):
+    """Storage backends for workflow checkpoints."""
+
+    FILES = "files"
+    SQLITE = "sqlite"
+
+
 class BrowserConfig(BaseModel):
     """Configuration for browser automation."""
 
@@ -171,7 +178,22 @@ class SystemConfig(BaseModel):
         default="development",
         description="Environment (development, staging, production)",
     )
-    max_concurrency: int = Field(default=3, description="Maximum concurrent operations")
+    # The default lets all four search agents run at once
+    max_concurrency: int = Field(default=4, description="Maximum concurrent operations")
+    agent_submit_interval: float = Field(
+        default=0.0, description="Minimum seconds between agent call starts"
+    )
+    checkpoint_fsync: bool = Field(
+        default=True, description="Flush checkpoint files to stable storage"
+    )
+    checkpoint_json_patch: bool = Field(
+        default=False,
+        description="Store incremental checkpoints as JSON Patch deltas",
+    )
+    checkpoint_backend: CheckpointBackend = Field(
+        default=CheckpointBackend.FILES,
+        description="Store checkpoints as files or in a SQLite database",
+    )
     default_budget: float = Field(default=2000, description="Default budget amount")
     default_currency: str = Field(default="USD", description="Default currency")
 
@@ -181,7 +203,15 @@ class SystemConfig(BaseModel):
         return cls(
             log_level=LogLevel(os.getenv("LOG_LEVEL", "INFO")),
             environment=os.getenv("ENVIRONMENT", "development"),
-            max_concurrency=int(os.getenv("MAX_CONCURRENCY", "3")),
+            max_concurrency=int(os.getenv("MAX_CONCURRENCY", "4")),
+            agent_submit_interval=float(os.getenv("AGENT_SUBMIT_INTERVAL", "0")),
+            checkpoint_fsync=os.getenv("CHECKPOINT_FSYNC", "true").lower() == "true",
+            checkpoint_json_patch=(
+                os.getenv("CHECKPOINT_JSON_PATCH", "false").lower() == "true"
+            ),
+            checkpoint_backend=CheckpointBackend(
+                os.getenv("CHECKPOINT_BACKEND", "files").lower()
+            ),
             default_budget=float(os.getenv("DEFAULT_BUDGET", "2000")),
             default_currency=os.getenv("DEFAULT_CURRENCY", "USD"),
         )
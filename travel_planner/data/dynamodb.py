@@ -5,6 +5,7 @@ Supports both DynamoDB Local (development) and AWS DynamoDB (production).
 Set DYNAMODB_ENDPOINT env var for local, omit for AWS.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import boto3
@@ -14,6 +15,9 @@ from travel_planner.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Upper bound on Query requests issued at once by query_gsi1_many
+MAX_PARALLEL_QUERIES = 16
+
 
 class DynamoDBClient:
     """Client for DynamoDB single-table operations."""
@@ -135,6 +139,38 @@ class DynamoDBClient:
             limit=limit,
         )
 
+    def query_gsi1_many(self, gsi1pks: list[str]) -> list[list[dict[str, Any]]]:
+        """
+        Query GSI1 for several partition keys concurrently.
+
+        GSI queries cannot be combined into a BatchGetItem, so each key is
+        still one Query request, but the requests overlap instead of paying
+        one round trip after another.
+
+        Args:
+            gsi1pks: GSI1 partition key values
+
+        Returns:
+            Items for each key, in the order of gsi1pks
+        """
+        if not gsi1pks:
+            return []
+        # Table resources are not thread-safe, but their low-level client is,
+        # and it still converts conditions and items to and from Python types
+        client = self.table.meta.client
+
+        def query_one(gsi1pk: str) -> list[dict[str, Any]]:
+            response = client.query(
+                TableName=self.table_name,
+                IndexName="GSI1",
+                KeyConditionExpression=Key("GSI1PK").eq(gsi1pk),
+            )
+            return response.get("Items", [])
+
+        workers = min(len(gsi1pks), MAX_PARALLEL_QUERIES)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(query_one, gsi1pks))
+
     def create_table_if_not_exists(self) -> None:
         """Create the table (for DynamoDB Local development)."""
         try:
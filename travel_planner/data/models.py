@@ -5,6 +5,7 @@ This module defines the core data structures used throughout the travel planning
 process, including queries, user preferences, and the final travel plan.
 """
 
+from dataclasses import dataclass
 from datetime import date, datetime
 from enum import Enum
 from typing import Any
@@ -91,7 +92,8 @@ class FlightSearchParams(BaseModel):
     sort_by: str = "price"
 
 
-class NodeFunctionParams(BaseModel):
+@dataclass(slots=True, frozen=True)
+class NodeFunctionParams:
     """Parameters for creating node functions."""
 
     agent_class: Any  # Type[BaseAgent], using Any to avoid circular imports
@@ -102,7 +104,8 @@ class NodeFunctionParams(BaseModel):
     message_template: str
 
 
-class AgentTaskParams(BaseModel):
+@dataclass(slots=True, frozen=True)
+class AgentTaskParams:
     """Parameters for executing agent tasks."""
 
     state: Any  # TravelPlanningState
@@ -145,6 +145,17 @@ class DynamoDBRepository:
         items = self.db.query(**kwargs)
         return [Message.model_validate(i["Data"]) for i in items]
 
+    def get_recent_messages(
+        self, conversation_id: str, limit: int = 20
+    ) -> list[Message]:
+        """Get the last ``limit`` messages, oldest first."""
+        items = self.db.query(
+            pk=f"CONVERSATION#{conversation_id}#MESSAGE",
+            limit=limit,
+            scan_forward=False,
+        )
+        return [Message.model_validate(i["Data"]) for i in reversed(items)]
+
     # --- Locations (AP5) ---
 
     def save_location(self, location: Location) -> None:
@@ -178,6 +189,16 @@ class DynamoDBRepository:
             if i.get("EntityType") == "Place"
         ]
 
+    def get_places_by_geohashes(self, geohashes: list[str]) -> list[Place]:
+        """Get the places in several geohash cells, querying them concurrently."""
+        results = self.db.query_gsi1_many([f"GEOHASH#{h}" for h in geohashes])
+        return [
+            Place.model_validate(i["Data"])
+            for items in results
+            for i in items
+            if i.get("EntityType") == "Place"
+        ]
+
     # --- Content (AP12, AP13, AP14) ---
 
     def save_content(self, content: Content) -> None:
@@ -25,6 +25,7 @@ from travel_planner.config import TravelPlannerConfig, initialize_config
 from travel_planner.data.models import TravelPlan, TravelQuery
 from travel_planner.data.dynamodb import DynamoDBClient
 from travel_planner.data.preferences import UserPreferences
+from travel_planner.orchestration.parallel import configure_event_loop
 from travel_planner.orchestration.workflow import TravelWorkflow
 from travel_planner.prompts.context import ContextBuilder
 from travel_planner.utils.logging import get_logger, setup_logging
@@ -1659,4 +1660,5 @@ def _handle_general_exception(e: Exception) -> int:
 
 
 if __name__ == "__main__":
+    configure_event_loop()
     sys.exit(asyncio.run(main()))
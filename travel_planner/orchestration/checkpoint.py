@@ -288,22 +288,12 @@ class CheckpointManager:
             task_results=checkpoint_data.get("task_results", {}),
             human_feedback=checkpoint_data.get("human_feedback", []),
             guidance_requested=checkpoint_data.get("guidance_requested", False),
-            start_time=datetime.fromisoformat(checkpoint_data.get("start_time"))
-            if checkpoint_data.get("start_time")
-            else None,
-            last_update_time=datetime.fromisoformat(
-                checkpoint_data.get("last_update_time")
-            )
-            if checkpoint_data.get("last_update_time")
-            else None,
+            # The state converts stored times to epoch nanoseconds
+            start_time=checkpoint_data.get("start_time"),
+            last_update_time=checkpoint_data.get("last_update_time"),
+            stage_times=checkpoint_data.get("stage_times") or {},
         )
 
-        # Reconstruct stage_times as datetimes
-        state.stage_times = {}
-        for stage_name, time_str in checkpoint_data.get("stage_times", {}).items():
-            if time_str:
-                state.stage_times[stage_name] = datetime.fromisoformat(time_str)
-
         return state
 
 
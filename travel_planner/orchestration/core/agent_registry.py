@@ -5,6 +5,8 @@ This module provides a central registry for agent access, implementing
 dependency injection to reduce circular dependencies and improve testability.
 """
 
+import threading
+
 from travel_planner.agents.base import BaseAgent
 from travel_planner.utils.logging import get_logger
 
@@ -23,6 +25,10 @@ class AgentRegistry:
     def __init__(self):
         """Initialize the agent registry."""
         self._agents: dict[str, BaseAgent] = {}
+        # Default agents are built once; each workflow would otherwise
+        # re-create all of them and their API clients
+        self._defaults_registered = False
+        self._defaults_lock = threading.Lock()
 
     def register(self, agent_type: str, agent: BaseAgent) -> None:
         """
@@ -53,7 +59,21 @@ class AgentRegistry:
         return self._agents[agent_type]
 
     def register_defaults(self) -> None:
-        """Register all default agents in the registry."""
+        """
+        Register all default agents in the registry.
+
+        Agents are only created on the first call; later calls are no-ops
+        until the registry is cleared.
+        """
+        if self._defaults_registered:
+            return
+        with self._defaults_lock:
+            if not self._defaults_registered:
+                self._register_defaults()
+                self._defaults_registered = True
+
+    def _register_defaults(self) -> None:
+        """Create and register the default agents."""
         from travel_planner.agents.accommodation import AccommodationAgent
         from travel_planner.agents.activity_planning import ActivityPlanningAgent
         from travel_planner.agents.budget_management import BudgetManagementAgent
@@ -75,6 +95,7 @@ class AgentRegistry:
     def clear(self) -> None:
         """Clear all registered agents (useful for testing)."""
         self._agents.clear()
+        self._defaults_registered = False
         logger.debug("Agent registry cleared")
 
 
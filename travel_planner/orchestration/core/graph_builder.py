@@ -6,18 +6,30 @@ using LangGraph. It connects the various nodes and defines the edges
 and conditions for workflow transitions.
 """
 
+from functools import lru_cache
+
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import END, START, StateGraph
 
 from travel_planner.orchestration.nodes.activity_planning import activity_planning
 from travel_planner.orchestration.nodes.budget_management import budget_management
 from travel_planner.orchestration.nodes.destination_research import destination_research
-from travel_planner.orchestration.nodes.final_plan import generate_final_plan
+from travel_planner.orchestration.nodes.final_plan import (
+    agenerate_final_plan,
+    generate_final_plan,
+)
 from travel_planner.orchestration.nodes.parallel_search import (
     combine_search_results,
     parallel_search,
 )
-from travel_planner.orchestration.nodes.query_analysis import query_analysis
-from travel_planner.orchestration.routing.conditions import query_research_needed
+from travel_planner.orchestration.nodes.query_analysis import (
+    aquery_analysis,
+    query_analysis,
+)
+from travel_planner.orchestration.routing.conditions import (
+    has_terminal_failure,
+    query_research_needed,
+)
 from travel_planner.orchestration.routing.error_recovery import handle_error
 from travel_planner.orchestration.states.planning_state import TravelPlanningState
 from travel_planner.utils.logging import get_logger
@@ -27,13 +39,28 @@ logger = get_logger(__name__)
 
 def create_planning_graph() -> StateGraph:
     """
-    Create a state graph for travel planning.
+    Get the compiled state graph for travel planning.
+
+    The compiled graph holds no per-run state, so it is built once and shared
+    by every caller.
+
+    Returns:
+        Compiled StateGraph instance that orchestrates the travel planning workflow
+    """
+    return _build_planning_graph()
+
+
+@lru_cache(maxsize=1)
+def _build_planning_graph() -> StateGraph:
+    """
+    Build and compile the state graph for travel planning.
 
     The graph implements this flow:
         START -> analyze_query -> [conditional] -> research_destination OR parallel_search
         research_destination -> parallel_search
         parallel_search -> combine_search_results -> plan_activities
         plan_activities -> manage_budget -> generate_final_plan -> END
+        any step after analyze_query -> handle_error on terminal failure
 
     Returns:
         Compiled StateGraph instance that orchestrates the travel planning workflow
@@ -43,14 +70,20 @@ def create_planning_graph() -> StateGraph:
     # Create a new state graph
     workflow = StateGraph(TravelPlanningState)
 
-    # Define the nodes in the graph
-    workflow.add_node("analyze_query", query_analysis)
+    # Define the nodes in the graph. Orchestrator-backed nodes carry an async
+    # variant so ainvoke() awaits the LLM call instead of blocking a thread.
+    workflow.add_node(
+        "analyze_query", RunnableLambda(query_analysis, afunc=aquery_analysis)
+    )
     workflow.add_node("research_destination", destination_research)
     workflow.add_node("parallel_search", parallel_search)
     workflow.add_node("combine_search_results", combine_search_results)
     workflow.add_node("plan_activities", activity_planning)
     workflow.add_node("manage_budget", budget_management)
-    workflow.add_node("generate_final_plan", generate_final_plan)
+    workflow.add_node(
+        "generate_final_plan",
+        RunnableLambda(generate_final_plan, afunc=agenerate_final_plan),
+    )
     workflow.add_node("handle_error", handle_error)
 
     # Define edges
@@ -68,23 +101,27 @@ def create_planning_graph() -> StateGraph:
         },
     )
 
-    # After destination research, move to parallel search
-    workflow.add_edge("research_destination", "parallel_search")
-
-    # After parallel search, combine results
-    workflow.add_edge("parallel_search", "combine_search_results")
-
-    # After combining search results, move to activity planning
-    workflow.add_edge("combine_search_results", "plan_activities")
-
-    # After activity planning, move to budget management
-    workflow.add_edge("plan_activities", "manage_budget")
-
-    # After budget management, generate the final plan
-    workflow.add_edge("manage_budget", "generate_final_plan")
-
-    # After generating the final plan, end the workflow
-    workflow.add_edge("generate_final_plan", END)
+    # The remaining steps run in sequence. A task that has exhausted its
+    # retries short-circuits to error handling instead of running the rest.
+    for source, target in (
+        # After destination research, move to parallel search
+        ("research_destination", "parallel_search"),
+        # After parallel search, combine results
+        ("parallel_search", "combine_search_results"),
+        # After combining search results, move to activity planning
+        ("combine_search_results", "plan_activities"),
+        # After activity planning, move to budget management
+        ("plan_activities", "manage_budget"),
+        # After budget management, generate the final plan
+        ("manage_budget", "generate_final_plan"),
+        # After generating the final plan, end the workflow
+        ("generate_final_plan", END),
+    ):
+        workflow.add_conditional_edges(
+            source,
+            has_terminal_failure,
+            {"true": "handle_error", "false": target},
+        )
 
     # Error handling ends the workflow
     workflow.add_edge("handle_error", END)
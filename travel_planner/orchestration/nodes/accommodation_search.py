@@ -5,11 +5,14 @@ This module defines functions for searching accommodations using the accommodati
 agent, both for individual execution and as part of parallel processing.
 """
 
+from typing import Any
+
 from travel_planner.agents.accommodation import AccommodationAgent
 from travel_planner.data.models import NodeFunctionParams
 from travel_planner.orchestration.nodes.base_node import (
     create_node_function,
 )
+from travel_planner.orchestration.parallel import ParallelResult, ParallelTask
 from travel_planner.orchestration.states.planning_state import TravelPlanningState
 from travel_planner.orchestration.states.workflow_stages import WorkflowStage
 from travel_planner.utils.logging import get_logger
@@ -30,7 +33,7 @@ accommodation_search = create_node_function(
 )
 
 
-def accommodation_task(state: TravelPlanningState) -> dict[str, any]:
+def accommodation_task(state: TravelPlanningState) -> dict[str, Any]:
     """
     Execute accommodation search task in parallel branch.
 
@@ -38,26 +41,29 @@ def accommodation_task(state: TravelPlanningState) -> dict[str, any]:
         state: Current travel planning state
 
     Returns:
-        Dictionary with task results
+        Partial state update with this task's branch result
     """
-    from travel_planner.orchestration.parallel import ParallelResult, ParallelTask
-
     try:
         agent = AccommodationAgent()
-        result = agent.invoke(state)
+        # Branches must not write to the shared state; they return a delta
+        result = agent.invoke(state.read_only())
 
         return {
-            "result": ParallelResult(
-                task_type=ParallelTask.ACCOMMODATION, result=result, completed=True
-            )
+            "branch_results": {
+                ParallelTask.ACCOMMODATION.value: ParallelResult(
+                    task_type=ParallelTask.ACCOMMODATION, result=result, completed=True
+                )
+            }
         }
     except Exception as e:
-        logger.error(f"Error in accommodation task: {e!s}")
+        logger.error("Error in accommodation task: {!s}", e)
         return {
-            "result": ParallelResult(
-                task_type=ParallelTask.ACCOMMODATION,
-                result={},
-                error=str(e),
-                completed=False,
-            )
+            "branch_results": {
+                ParallelTask.ACCOMMODATION.value: ParallelResult(
+                    task_type=ParallelTask.ACCOMMODATION,
+                    result={},
+                    error=str(e),
+                    completed=False,
+                )
+            }
         }
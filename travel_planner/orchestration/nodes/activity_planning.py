@@ -5,10 +5,13 @@ This module defines functions for planning activities using the activity
 planning agent, both for individual execution and as part of parallel processing.
 """
 
+from typing import Any
+
 from travel_planner.agents.activity_planning import ActivityPlanningAgent
 from travel_planner.orchestration.nodes.base_node import (
     execute_agent_task,
 )
+from travel_planner.orchestration.parallel import ParallelResult, ParallelTask
 from travel_planner.orchestration.states.planning_state import TravelPlanningState
 from travel_planner.orchestration.states.workflow_stages import WorkflowStage
 from travel_planner.utils.logging import get_logger
@@ -46,7 +49,7 @@ def activity_planning(state: TravelPlanningState) -> TravelPlanningState:
     )
 
 
-def activities_task(state: TravelPlanningState) -> dict[str, any]:
+def activities_task(state: TravelPlanningState) -> dict[str, Any]:
     """
     Execute activity planning task in parallel branch.
 
@@ -54,26 +57,29 @@ def activities_task(state: TravelPlanningState) -> dict[str, any]:
         state: Current travel planning state
 
     Returns:
-        Dictionary with task results
+        Partial state update with this task's branch result
     """
-    from travel_planner.orchestration.parallel import ParallelResult, ParallelTask
-
     try:
         agent = ActivityPlanningAgent()
-        result = agent.invoke(state)
+        # Branches must not write to the shared state; they return a delta
+        result = agent.invoke(state.read_only())
 
         return {
-            "result": ParallelResult(
-                task_type=ParallelTask.ACTIVITIES, result=result, completed=True
-            )
+            "branch_results": {
+                ParallelTask.ACTIVITIES.value: ParallelResult(
+                    task_type=ParallelTask.ACTIVITIES, result=result, completed=True
+                )
+            }
         }
     except Exception as e:
-        logger.error(f"Error in activities task: {e!s}")
+        logger.error("Error in activities task: {!s}", e)
         return {
-            "result": ParallelResult(
-                task_type=ParallelTask.ACTIVITIES,
-                result={},
-                error=str(e),
-                completed=False,
-            )
+            "branch_results": {
+                ParallelTask.ACTIVITIES.value: ParallelResult(
+                    task_type=ParallelTask.ACTIVITIES,
+                    result={},
+                    error=str(e),
+                    completed=False,
+                )
+            }
         }
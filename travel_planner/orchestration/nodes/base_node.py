@@ -9,7 +9,10 @@ from collections.abc import Callable
 from typing import Any
 
 from travel_planner.data.models import AgentTaskParams, NodeFunctionParams, TravelPlan
-from travel_planner.orchestration.states.planning_state import TravelPlanningState
+from travel_planner.orchestration.states.planning_state import (
+    Msg,
+    TravelPlanningState,
+)
 from travel_planner.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -33,44 +36,60 @@ def execute_agent_task(
     """
     if params is None:
         params = AgentTaskParams(**kwargs)
-    logger.info(f"Executing {params.task_name} with {params.agent.__class__.__name__}")
+    logger.info(
+        "Executing {} with {}", params.task_name, params.agent.__class__.__name__
+    )
+
+    # The graph has no edge back into a failed node, so retries happen here
+    while True:
+        try:
+            return _run_agent_task(params)
+        except Exception as e:
+            logger.error("Error in {}: {!s}", params.task_name, e)
+            if not params.state.should_retry(params.task_name):
+                params.state.mark_error(f"Error during {params.task_name}: {e!s}")
+                params.state.terminal_failure = True
+                return params.state
+            logger.info(
+                "Retrying {} (attempt {})",
+                params.task_name,
+                params.state.retry_count.get(params.task_name, 0),
+            )
+
 
-    try:
-        # Execute the agent
-        result = params.agent.invoke(params.state)
+def _run_agent_task(params: AgentTaskParams) -> TravelPlanningState:
+    """
+    Invoke the agent once and commit its result to the state.
+
+    Args:
+        params: Task to run
+
+    Returns:
+        Updated travel planning state
+    """
+    # Execute the agent
+    result = params.agent.invoke(params.state)
 
-        # Initialize plan if needed
-        if params.state.plan is None:
-            params.state.plan = TravelPlan()
+    # Initialize plan if needed
+    if params.state.plan is None:
+        params.state.plan = TravelPlan()
 
-        # Update workflow stage
-        params.state.update_stage(params.complete_stage)
+    # Stage, history and task result are committed together on success
+    with params.state.transaction() as txn:
+        txn.update_stage(params.complete_stage)
 
         # Format message and add to conversation history
         message = params.result_formatter(result)
-        params.state.conversation_history.append({"role": "system", "content": message})
+        txn.append_message(Msg("system", message))
 
         # Process results if a processor is provided
         if params.result_processor:
             params.result_processor(params.state, result)
 
-        # Add task result
-        params.state.add_task_result(params.task_name, result)
-
-        logger.info(f"Completed {params.task_name} successfully")
-        return params.state
-
-    except Exception as e:
-        logger.error(f"Error in {params.task_name}: {e!s}")
-        params.state.mark_error(f"Error during {params.task_name}: {e!s}")
-
-        # Check if we should retry
-        if params.state.should_retry(params.task_name):
-            logger.info(
-                f"Will retry {params.task_name} (attempt {params.state.retry_count.get(params.task_name, 0)})"
-            )
+        txn.add_task_result(params.task_name, result)
 
-        return params.state
+    logger.info("Completed {} successfully", params.task_name)
+    return params.state
 
 
 def create_node_function(
@@ -91,26 +110,33 @@ def create_node_function(
         Node execution function
     """
 
+    # Bind the fixed parameters once so each call reads closure cells rather
+    # than attributes on params
+    agent_class = params.agent_class
+    task_name = params.task_name
+    complete_stage = params.complete_stage
+    result_field = params.result_field
+    plan_field = params.plan_field
+    message_template = params.message_template
+
     def result_formatter(result: dict[str, Any]) -> str:
         """Format the result for conversation history."""
-        data = result.get(params.result_field, [])
+        data = result.get(result_field, [])
         count = len(data) if isinstance(data, list) else 1 if data else 0
-        return params.message_template.format(count=count)
+        return message_template.format(count=count)
 
     def result_processor(state: TravelPlanningState, result: dict[str, Any]) -> None:
         """Process results and update the plan."""
-        if state.plan and params.result_field in result:
-            setattr(state.plan, params.plan_field, result[params.result_field])
+        if state.plan and result_field in result:
+            setattr(state.plan, plan_field, result[result_field])
 
     def node_function(state: TravelPlanningState) -> TravelPlanningState:
         """The actual node execution function."""
-        agent = params.agent_class()
-
         agent_task_params = AgentTaskParams(
             state=state,
-            agent=agent,
-            task_name=params.task_name,
-            complete_stage=params.complete_stage,
+            agent=agent_class(),
+            task_name=task_name,
+            complete_stage=complete_stage,
             result_formatter=result_formatter,
             result_processor=result_processor,
         )
@@ -118,9 +144,7 @@ def create_node_function(
         return execute_agent_task(agent_task_params)
 
     # Set function metadata
-    node_function.__name__ = params.task_name
-    node_function.__doc__ = (
-        f"Execute {params.task_name} using {params.agent_class.__name__}."
-    )
+    node_function.__name__ = task_name
+    node_function.__doc__ = f"Execute {task_name} using {agent_class.__name__}."
 
     return node_function
@@ -5,10 +5,13 @@ This module defines functions for managing the travel budget using the budget
 management agent, both for individual execution and as part of parallel processing.
 """
 
+from typing import Any
+
 from travel_planner.agents.budget_management import BudgetManagementAgent
 from travel_planner.orchestration.nodes.base_node import (
     execute_agent_task,
 )
+from travel_planner.orchestration.parallel import ParallelResult, ParallelTask
 from travel_planner.orchestration.states.planning_state import TravelPlanningState
 from travel_planner.orchestration.states.workflow_stages import WorkflowStage
 from travel_planner.utils.logging import get_logger
@@ -49,7 +52,7 @@ def budget_management(state: TravelPlanningState) -> TravelPlanningState:
     )
 
 
-def budget_task(state: TravelPlanningState) -> dict[str, any]:
+def budget_task(state: TravelPlanningState) -> dict[str, Any]:
     """
     Execute budget management task (usually runs after other tasks are complete).
 
@@ -57,23 +60,29 @@ def budget_task(state: TravelPlanningState) -> dict[str, any]:
         state: Current travel planning state
 
     Returns:
-        Dictionary with task results
+        Partial state update with this task's branch result
     """
-    from travel_planner.orchestration.parallel import ParallelResult, ParallelTask
-
     try:
         agent = BudgetManagementAgent()
-        result = agent.invoke(state)
+        # Branches must not write to the shared state; they return a delta
+        result = agent.invoke(state.read_only())
 
         return {
-            "result": ParallelResult(
-                task_type=ParallelTask.BUDGET, result=result, completed=True
-            )
+            "branch_results": {
+                ParallelTask.BUDGET.value: ParallelResult(
+                    task_type=ParallelTask.BUDGET, result=result, completed=True
+                )
+            }
         }
     except Exception as e:
-        logger.error(f"Error in budget task: {e!s}")
+        logger.error("Error in budget task: {!s}", e)
         return {
-            "result": ParallelResult(
-                task_type=ParallelTask.BUDGET, result={}, error=str(e), completed=False
-            )
+            "branch_results": {
+                ParallelTask.BUDGET.value: ParallelResult(
+                    task_type=ParallelTask.BUDGET,
+                    result={},
+                    error=str(e),
+                    completed=False,
+                )
+            }
         }
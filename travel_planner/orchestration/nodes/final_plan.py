@@ -5,8 +5,13 @@ This module defines the function that generates the final travel plan by
 integrating all components and creating a comprehensive output.
 """
 
+from typing import Any
+
 from travel_planner.agents.orchestrator import OrchestratorAgent
-from travel_planner.orchestration.states.planning_state import TravelPlanningState
+from travel_planner.orchestration.states.planning_state import (
+    Msg,
+    TravelPlanningState,
+)
 from travel_planner.orchestration.states.workflow_stages import WorkflowStage
 from travel_planner.utils.logging import get_logger
 
@@ -23,43 +28,110 @@ def generate_final_plan(state: TravelPlanningState) -> TravelPlanningState:
     Returns:
         Updated travel planning state with complete plan
     """
-    from travel_planner.orchestration.serialization.checkpoint import (
-        save_state_checkpoint,
-    )
+    while True:
+        try:
+            logger.info("Generating final travel plan")
+
+            result: dict[str, Any] = {"status": "complete"}
+            if state.generate_summary:
+                # Optional narrative summary; the plan itself is already assembled
+                result = OrchestratorAgent().invoke(state)
+            return _complete_final_plan(state, result)
+
+        except Exception as e:
+            if not _retry_final_plan(state, e):
+                return state
+
+
+async def agenerate_final_plan(state: TravelPlanningState) -> TravelPlanningState:
+    """
+    Async variant of generate_final_plan used when the graph runs asynchronously.
+
+    Args:
+        state: Current travel planning state
+
+    Returns:
+        Updated travel planning state with complete plan
+    """
+    while True:
+        try:
+            logger.info("Generating final travel plan")
 
-    try:
-        logger.info("Generating final travel plan")
+            result: dict[str, Any] = {"status": "complete"}
+            if state.generate_summary:
+                # Optional narrative summary; the plan itself is already assembled
+                result = await OrchestratorAgent().ainvoke(state)
+            return _complete_final_plan(state, result)
 
-        orchestrator = OrchestratorAgent()
-        result = orchestrator.invoke(state)
+        except Exception as e:
+            if not _retry_final_plan(state, e):
+                return state
 
-        # Don't overwrite plan with nonexistent key — the plan was
-        # assembled by prior nodes; just mark workflow complete.
-        state.update_stage(WorkflowStage.COMPLETE)
 
-        # Create and save a checkpoint of the final state
-        checkpoint_id = save_state_checkpoint(state)
+def _complete_final_plan(
+    state: TravelPlanningState, result: dict[str, Any]
+) -> TravelPlanningState:
+    """
+    Mark the workflow complete and checkpoint the final state.
+
+    Args:
+        state: Current travel planning state
+        result: Summary from the orchestrator agent, or a completion marker
+
+    Returns:
+        Updated travel planning state with complete plan
+    """
+    from travel_planner.orchestration.serialization.checkpoint import (
+        save_state_checkpoint_in_background,
+    )
+
+    # Don't overwrite plan with nonexistent key — the plan was
+    # assembled by prior nodes; just mark workflow complete.
+    state.update_stage(WorkflowStage.COMPLETE)
+
+    # Skip the write if an identical state was already checkpointed (retries)
+    checkpoint_hash = state.checkpoint_hash()
+    if state.state_checkpoint_id and checkpoint_hash == state.state_checkpoint_hash:
+        checkpoint_id = state.state_checkpoint_id
+    else:
+        # Snapshot the final state; the disk write completes in the background
+        checkpoint_id = save_state_checkpoint_in_background(state)
         state.state_checkpoint_id = checkpoint_id
+        state.state_checkpoint_hash = checkpoint_hash
 
-        # Add completion info to conversation history
-        state.conversation_history.append(
-            {
-                "role": "system",
-                "content": f"Travel planning completed successfully. Final plan saved as checkpoint {checkpoint_id}",
-            }
+    # Add completion info to conversation history
+    state.conversation_history.append(
+        Msg(
+            "system",
+            f"Travel planning completed successfully. Final plan saved as checkpoint {checkpoint_id}",
         )
+    )
 
-        # Record task result
-        state.add_task_result("generate_final_plan", result)
+    # Record task result
+    state.add_task_result("generate_final_plan", result)
 
-        logger.info(
-            f"Final plan generated successfully. Checkpoint ID: {checkpoint_id}"
-        )
-        return state
-
-    except Exception as e:
-        logger.error(f"Error during final plan generation: {e!s}")
-        state.mark_error(f"Error during final plan generation: {e!s}")
-        if state.should_retry("generate_final_plan"):
-            logger.info("Will retry final plan generation")
-        return state
+    logger.info("Final plan generated successfully. Checkpoint ID: {}", checkpoint_id)
+    return state
+
+
+def _retry_final_plan(state: TravelPlanningState, error: Exception) -> bool:
+    """
+    Decide whether to retry a failed final plan generation.
+
+    The graph has no edge back into this node, so retries happen in place;
+    once they run out the failure is recorded on the state as terminal.
+
+    Args:
+        state: Current travel planning state
+        error: The exception raised while generating the plan
+
+    Returns:
+        True to retry, False once the state has been marked with the error
+    """
+    logger.error("Error during final plan generation: {!s}", error)
+    if state.should_retry("generate_final_plan"):
+        logger.info("Retrying final plan generation")
+        return True
+    state.mark_error(f"Error during final plan generation: {error!s}")
+    state.terminal_failure = True
+    return False
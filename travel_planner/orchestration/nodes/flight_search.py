@@ -5,11 +5,14 @@ This module defines functions for searching flights using the flight
 search agent, both for individual execution and as part of parallel processing.
 """
 
+from typing import Any
+
 from travel_planner.agents.flight_search import FlightSearchAgent
 from travel_planner.data.models import NodeFunctionParams
 from travel_planner.orchestration.nodes.base_node import (
     create_node_function,
 )
+from travel_planner.orchestration.parallel import ParallelResult, ParallelTask
 from travel_planner.orchestration.states.planning_state import TravelPlanningState
 from travel_planner.orchestration.states.workflow_stages import WorkflowStage
 from travel_planner.utils.logging import get_logger
@@ -30,7 +33,7 @@ flight_search = create_node_function(
 )
 
 
-def flight_search_task(state: TravelPlanningState) -> dict[str, any]:
+def flight_search_task(state: TravelPlanningState) -> dict[str, Any]:
     """
     Execute flight search task in parallel branch.
 
@@ -38,26 +41,29 @@ def flight_search_task(state: TravelPlanningState) -> dict[str, any]:
         state: Current travel planning state
 
     Returns:
-        Dictionary with task results
+        Partial state update with this task's branch result
     """
-    from travel_planner.orchestration.parallel import ParallelResult, ParallelTask
-
     try:
         agent = FlightSearchAgent()
-        result = agent.invoke(state)
+        # Branches must not write to the shared state; they return a delta
+        result = agent.invoke(state.read_only())
 
         return {
-            "result": ParallelResult(
-                task_type=ParallelTask.FLIGHT_SEARCH, result=result, completed=True
-            )
+            "branch_results": {
+                ParallelTask.FLIGHT_SEARCH.value: ParallelResult(
+                    task_type=ParallelTask.FLIGHT_SEARCH, result=result, completed=True
+                )
+            }
         }
     except Exception as e:
-        logger.error(f"Error in flight search task: {e!s}")
+        logger.error("Error in flight search task: {!s}", e)
         return {
-            "result": ParallelResult(
-                task_type=ParallelTask.FLIGHT_SEARCH,
-                result={},
-                error=str(e),
-                completed=False,
-            )
+            "branch_results": {
+                ParallelTask.FLIGHT_SEARCH.value: ParallelResult(
+                    task_type=ParallelTask.FLIGHT_SEARCH,
+                    result={},
+                    error=str(e),
+                    completed=False,
+                )
+            }
         }
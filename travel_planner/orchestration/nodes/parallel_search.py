@@ -10,7 +10,11 @@ from travel_planner.orchestration.nodes.flight_search import flight_search
 from travel_planner.orchestration.nodes.transportation_planning import (
     transportation_planning,
 )
-from travel_planner.orchestration.states.planning_state import TravelPlanningState
+from travel_planner.orchestration.parallel import combine_parallel_branch_results
+from travel_planner.orchestration.states.planning_state import (
+    Msg,
+    TravelPlanningState,
+)
 from travel_planner.orchestration.states.workflow_stages import WorkflowStage
 from travel_planner.utils.logging import get_logger
 
@@ -40,9 +44,9 @@ def parallel_search(state: TravelPlanningState) -> TravelPlanningState:
         try:
             state = search_fn(state)
         except Exception as e:
-            logger.error(f"Error in {name}: {e!s}")
+            logger.error("Error in {}: {!s}", name, e)
             state.conversation_history.append(
-                {"role": "system", "content": f"Warning: {name} failed: {e!s}"}
+                Msg("system", f"Warning: {name} failed: {e!s}")
             )
 
     return state
@@ -52,6 +56,9 @@ def combine_search_results(state: TravelPlanningState) -> TravelPlanningState:
     """
     Combine the results from the parallel search branch.
 
+    Branch tasks return their results as deltas in ``branch_results`` rather
+    than mutating the shared state; they are folded into the plan here.
+
     Args:
         state: Current travel planning state
 
@@ -60,30 +67,28 @@ def combine_search_results(state: TravelPlanningState) -> TravelPlanningState:
     """
     logger.info("Combining results from parallel search")
 
+    # Merge any branch deltas into the plan
+    if state.branch_results:
+        state = combine_parallel_branch_results(state, state.branch_results)
+
     # Update the stage to indicate completion of parallel search
     state.update_stage(WorkflowStage.PARALLEL_SEARCH_COMPLETED)
 
-    # Log combined results
-    has_plan = state.plan is not None
     # Get counts of each type of result
-    flights = state.plan.flights if has_plan else None
-    flight_count = len(flights) if flights else 0
-
-    accom = state.plan.accommodation if has_plan else None
-    accom_count = len(accom) if accom else 0
-
-    transport = state.plan.transportation if has_plan else None
-    transport_count = len(transport) if transport else 0
+    plan = state.plan
+    flight_count = len(plan.flights) if plan and plan.flights else 0
+    accom_count = len(plan.accommodation) if plan and plan.accommodation else 0
+    transport_count = len(plan.transportation) if plan and plan.transportation else 0
 
     state.conversation_history.append(
-        {
-            "role": "system",
-            "content": (
+        Msg(
+            "system",
+            (
                 f"Completed parallel search: {flight_count} flights, "
                 f"{accom_count} accommodations, "
                 f"{transport_count} transportation options"
             ),
-        }
+        )
     )
 
     return state
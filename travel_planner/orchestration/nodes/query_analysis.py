@@ -5,8 +5,13 @@ This module defines the function that analyzes user queries to extract travel
 requirements and preferences using the orchestrator agent.
 """
 
+from typing import Any
+
 from travel_planner.agents.orchestrator import OrchestratorAgent
-from travel_planner.orchestration.states.planning_state import TravelPlanningState
+from travel_planner.orchestration.states.planning_state import (
+    Msg,
+    TravelPlanningState,
+)
 from travel_planner.orchestration.states.workflow_stages import WorkflowStage
 from travel_planner.utils.logging import get_logger
 
@@ -54,7 +59,39 @@ def query_analysis(state: TravelPlanningState) -> TravelPlanningState:
 
     orchestrator = OrchestratorAgent()
     result = orchestrator.invoke(state)
+    return _apply_query_analysis(state, result)
+
+
+async def aquery_analysis(state: TravelPlanningState) -> TravelPlanningState:
+    """
+    Async variant of query_analysis used when the graph runs asynchronously.
+
+    Args:
+        state: Current travel planning state
+
+    Returns:
+        Updated travel planning state
+    """
+    logger.info("Starting query analysis")
 
+    orchestrator = OrchestratorAgent()
+    result = await orchestrator.ainvoke(state)
+    return _apply_query_analysis(state, result)
+
+
+def _apply_query_analysis(
+    state: TravelPlanningState, result: dict[str, Any]
+) -> TravelPlanningState:
+    """
+    Record the orchestrator's analysis result on the state.
+
+    Args:
+        state: Current travel planning state
+        result: Result returned by the orchestrator agent
+
+    Returns:
+        Updated travel planning state
+    """
     # The agent returns LLM text, not structured query/preferences keys.
     # Parse destination from the raw query if not already set.
     if state.query and not state.query.destination:
@@ -66,18 +103,18 @@ def query_analysis(state: TravelPlanningState) -> TravelPlanningState:
 
     has_destination = state.query and state.query.destination
     destination = state.query.destination if has_destination else "Unknown"
-    logger.info(f"Query analyzed. Destination: {destination}")
+    logger.info("Query analyzed. Destination: {}", destination)
 
     # Add the result to conversation history for context
     state.conversation_history.append(
-        {
-            "role": "system",
-            "content": (
+        Msg(
+            "system",
+            (
                 f"Query analyzed: {destination}"
                 if destination != "Unknown"
                 else "Query analyzed: Destination research needed"
             ),
-        }
+        )
     )
 
     # Add the task result
@@ -5,11 +5,18 @@ This module defines functions for planning transportation using the transportati
 agent, both for individual execution and as part of parallel processing.
 """
 
+from typing import Any
+
 from travel_planner.agents.transportation import TransportationAgent
 from travel_planner.data.models import NodeFunctionParams
 from travel_planner.orchestration.nodes.base_node import (
     create_node_function,
 )
+from travel_planner.orchestration.parallel import (
+    ParallelResult,
+    ParallelTask,
+    get_search_agent,
+)
 from travel_planner.orchestration.states.planning_state import TravelPlanningState
 from travel_planner.orchestration.states.workflow_stages import WorkflowStage
 from travel_planner.utils.logging import get_logger
@@ -30,34 +37,41 @@ transportation_planning = create_node_function(
 )
 
 
-def transportation_task(state: TravelPlanningState) -> dict[str, any]:
+async def transportation_task(state: TravelPlanningState) -> dict[str, Any]:
     """
     Execute transportation planning task in parallel branch.
 
+    The agent call is awaited so the event loop keeps serving the other
+    branches while the LLM responds. The agent itself is shared with
+    parallel_search_tasks on the same event loop.
+
     Args:
         state: Current travel planning state
 
     Returns:
-        Dictionary with task results
+        Partial state update with this task's branch result
     """
-    from travel_planner.orchestration.parallel import ParallelResult, ParallelTask
-
     try:
-        agent = TransportationAgent()
-        result = agent.invoke(state)
+        agent = get_search_agent("transportation")
+        # Branches must not write to the shared state; they return a delta
+        result = await agent.ainvoke(state.read_only())
 
         return {
-            "result": ParallelResult(
-                task_type=ParallelTask.TRANSPORTATION, result=result, completed=True
-            )
+            "branch_results": {
+                ParallelTask.TRANSPORTATION.value: ParallelResult(
+                    task_type=ParallelTask.TRANSPORTATION, result=result, completed=True
+                )
+            }
         }
     except Exception as e:
-        logger.error(f"Error in transportation task: {e!s}")
+        logger.error("Error in transportation task: {!s}", e)
         return {
-            "result": ParallelResult(
-                task_type=ParallelTask.TRANSPORTATION,
-                result={},
-                error=str(e),
-                completed=False,
-            )
+            "branch_results": {
+                ParallelTask.TRANSPORTATION.value: ParallelResult(
+                    task_type=ParallelTask.TRANSPORTATION,
+                    result={},
+                    error=str(e),
+                    completed=False,
+                )
+            }
         }
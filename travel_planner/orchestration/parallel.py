@@ -7,16 +7,30 @@ on different aspects of the travel planning process.
 """
 
 import asyncio
-from collections.abc import Callable
+import os
+import sys
+import weakref
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING, Any, TypeVar
 
-from pydantic import BaseModel
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
 
+from travel_planner.agents.accommodation import AccommodationAgent
+from travel_planner.agents.activity_planning import ActivityPlanningAgent
 from travel_planner.agents.base import BaseAgent
-from travel_planner.orchestration.states.workflow_stages import (
-    PARALLEL_SEARCH_COMPLETED,
-)
+from travel_planner.agents.flight_search import FlightSearchAgent
+from travel_planner.agents.transportation import TransportationAgent
+from travel_planner.config import config
+from travel_planner.data.models import TravelPlan
+from travel_planner.orchestration.states.workflow_stages import WorkflowStage
 from travel_planner.utils.logging import get_logger
 
 # Use TYPE_CHECKING to avoid circular imports
@@ -33,7 +47,35 @@ UpdateFunction = Callable[[T], T]
 logger = get_logger(__name__)
 
 
-class ParallelTask(Enum):
+def configure_event_loop() -> bool:
+    """
+    Install uvloop as the asyncio event loop policy when it is available.
+
+    Call once at process start, before the first event loop is created. Set
+    TRAVEL_PLANNER_DISABLE_UVLOOP=1 to keep the standard library loop.
+
+    Returns:
+        True if uvloop was installed, False if the default loop is kept
+    """
+    if os.getenv("TRAVEL_PLANNER_DISABLE_UVLOOP", "").lower() in ("1", "true"):
+        return False
+
+    # uvloop does not support Windows or free-threaded (no-GIL) builds
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+    if sys.platform == "win32" or not is_gil_enabled():
+        return False
+
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop")
+    return True
+
+
+class ParallelTask(str, Enum):
     """Enum representing different parallel tasks in the travel planning process."""
 
     FLIGHT_SEARCH = "flight_search"
@@ -43,7 +85,95 @@ class ParallelTask(Enum):
     BUDGET = "budget"
 
 
-class ParallelResult(BaseModel):
+class _AgentCallLimiter:
+    """Caps concurrent agent calls and spaces out their start times."""
+
+    def __init__(self, max_concurrency: int, submit_interval: float):
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._submit_interval = submit_interval
+        self._next_submit = 0.0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one of the concurrency slots for the duration of an agent call."""
+        async with self._semaphore:
+            if self._submit_interval:
+                # Reserve the next start time before sleeping so that waiters
+                # queue up one interval apart
+                now = asyncio.get_running_loop().time()
+                start = max(now, self._next_submit)
+                self._next_submit = start + self._submit_interval
+                await asyncio.sleep(start - now)
+            yield
+
+
+def _for_running_loop(
+    cache: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, T],
+    factory: Callable[[], T],
+) -> T:
+    """Get the cached object for the running event loop, creating it if needed."""
+    loop = asyncio.get_running_loop()
+    value = cache.get(loop)
+    if value is None:
+        value = factory()
+        cache[loop] = value
+    return value
+
+
+# asyncio primitives and the agents' async HTTP clients are bound to one event
+# loop, and agents may run under several (BaseAgent.invoke starts a fresh loop
+# per call), so these are shared per loop rather than per process
+_agent_call_limiters: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, _AgentCallLimiter
+] = weakref.WeakKeyDictionary()
+_search_agents_by_loop: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, BaseAgent]
+] = weakref.WeakKeyDictionary()
+
+
+def _agent_call_limiter() -> _AgentCallLimiter:
+    """Get the agent call limiter for the running event loop."""
+    return _for_running_loop(
+        _agent_call_limiters,
+        lambda: _AgentCallLimiter(
+            config.system.max_concurrency, config.system.agent_submit_interval
+        ),
+    )
+
+
+def _search_agents() -> dict[str, BaseAgent]:
+    """Get the search agents for the running event loop.
+
+    Agents keep no per-request state (the state is passed to each call), so
+    one set is reused for every search on the loop.
+    """
+    return _for_running_loop(
+        _search_agents_by_loop,
+        lambda: {
+            "flight": FlightSearchAgent(),
+            "accommodation": AccommodationAgent(),
+            "transportation": TransportationAgent(),
+            "activity": ActivityPlanningAgent(),
+        },
+    )
+
+
+def get_search_agent(name: str) -> BaseAgent:
+    """
+    Get the shared search agent of the given kind for the running event loop.
+
+    Args:
+        name: Agent kind ("flight", "accommodation", "transportation" or
+            "activity")
+
+    Returns:
+        The agent instance reused by every search on this loop
+    """
+    return _search_agents()[name]
+
+
+@dataclass(slots=True, frozen=True)
+class ParallelResult:
     """Model for storing results from parallel task execution."""
 
     task_type: ParallelTask
@@ -52,6 +182,77 @@ class ParallelResult(BaseModel):
     completed: bool = False
 
 
+# Exceptions that trigger a retry of an agent call
+_RETRYABLE_EXCEPTIONS = (
+    ConnectionError,
+    TimeoutError,
+    asyncio.TimeoutError,
+)
+
+
+@retry(
+    stop=stop_after_attempt(3),  # Try up to 3 times
+    wait=wait_exponential(multiplier=1, min=2, max=10),  # Exponential backoff
+    retry=retry_if_exception_type(_RETRYABLE_EXCEPTIONS),
+    reraise=True,  # Re-raise the last exception if all retries fail
+)
+async def _call_agent_with_retry(
+    agent: BaseAgent, params: dict[str, Any], state: TravelPlanningState
+) -> Any:
+    """Call an agent under the concurrency limit, retrying transient errors."""
+    try:
+        async with _agent_call_limiter().slot():
+            return await agent.process(**params, context=state)
+    except _RETRYABLE_EXCEPTIONS as e:
+        logger.warning("Retryable error in {}: {!s}. Will retry.", agent.name, e)
+        raise  # Re-raise to trigger retry
+    except Exception as e:
+        logger.error("Non-retryable error in {}: {!s}", agent.name, e)
+        raise  # Re-raise to be caught by _execute_task
+
+
+async def _execute_task(
+    agent: BaseAgent, params: dict[str, Any], state: TravelPlanningState
+) -> tuple[str, dict[str, Any]]:
+    """Execute a single agent task with retry logic."""
+    try:
+        # Try to execute with retry logic
+        result = await _call_agent_with_retry(agent, params, state)
+        return agent.name, {"result": result, "error": None, "retries": 0}
+    except Exception as e:
+        # Catch and log all exceptions after retries are exhausted
+        logger.error("Error in parallel task {} after retries: {!s}", agent.name, e)
+        return agent.name, {"result": None, "error": str(e), "retries": 3}
+
+
+async def iter_parallel_results(
+    tasks: list[tuple[BaseAgent, dict[str, Any]]], state: TravelPlanningState
+) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+    """
+    Execute multiple agent tasks concurrently, yielding results as they finish.
+
+    Args:
+        tasks: List of (agent, parameters) tuples to execute
+        state: Current travel planning state
+
+    Yields:
+        (agent name, result payload) tuples in completion order
+    """
+    pending = [
+        asyncio.ensure_future(_execute_task(agent, params, state))
+        for agent, params in tasks
+    ]
+    try:
+        for next_result in asyncio.as_completed(pending):
+            yield await next_result
+    finally:
+        # Stop stragglers if the consumer gives up early (e.g. on timeout) and
+        # wait for them to unwind, so no task outlives the call
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
 async def execute_in_parallel(
     tasks: list[tuple[BaseAgent, dict[str, Any]]], state: TravelPlanningState
 ) -> dict[str, Any]:
@@ -65,62 +266,11 @@ async def execute_in_parallel(
     Returns:
         Combined results from all parallel tasks
     """
-
-    async def execute_task(agent: BaseAgent, params: dict[str, Any]) -> dict[str, Any]:
-        """Execute a single agent task with retry logic."""
-        from tenacity import (
-            retry,
-            retry_if_exception_type,
-            stop_after_attempt,
-            wait_exponential,
-        )
-
-        # Define which exceptions should trigger retries
-        retryable_exceptions = (
-            ConnectionError,
-            TimeoutError,
-            asyncio.TimeoutError,
-        )
-
-        # Define retry decorator
-        @retry(
-            stop=stop_after_attempt(3),  # Try up to 3 times
-            wait=wait_exponential(multiplier=1, min=2, max=10),  # Exponential backoff
-            retry=retry_if_exception_type(retryable_exceptions),
-            reraise=True,  # Re-raise the last exception if all retries fail
-        )
-        async def execute_with_retry():
-            try:
-                return await agent.process(**params, context=state)
-            except retryable_exceptions as e:
-                logger.warning(f"Retryable error in {agent.name}: {e!s}. Will retry.")
-                raise  # Re-raise to trigger retry
-            except Exception as e:
-                logger.error(f"Non-retryable error in {agent.name}: {e!s}")
-                raise  # Re-raise to be caught by the outer try-except
-
-        try:
-            # Try to execute with retry logic
-            result = await execute_with_retry()
-            return {agent.name: {"result": result, "error": None, "retries": 0}}
-        except Exception as e:
-            # Catch and log all exceptions after retries are exhausted
-            logger.error(f"Error in parallel task {agent.name} after retries: {e!s}")
-            return {agent.name: {"result": None, "error": str(e), "retries": 3}}
-
-    # Create a list of coroutines to execute
-    coroutines = [execute_task(agent, params) for agent, params in tasks]
-
-    # Execute all coroutines in parallel with timeout protection
     try:
-        results = await asyncio.gather(*coroutines)
-
-        # Combine results into a single dictionary
-        combined_results = {}
-        for result in results:
-            combined_results.update(result)
-
-        return combined_results
+        return {
+            agent_name: payload
+            async for agent_name, payload in iter_parallel_results(tasks, state)
+        }
     except TimeoutError:
         logger.error("Parallel execution timed out")
         return {"error": "Execution timeout exceeded"}
@@ -140,30 +290,22 @@ async def parallel_search_tasks(state: TravelPlanningState) -> TravelPlanningSta
     Returns:
         Updated state with search results
     """
-    # Import specialized agents
-    from travel_planner.agents.accommodation import AccommodationAgent
-    from travel_planner.agents.activity_planning import ActivityPlanningAgent
-    from travel_planner.agents.flight_search import FlightSearchAgent
-    from travel_planner.agents.transportation import TransportationAgent
-
     logger.info("Setting up parallel search tasks")
 
-    # Create a deep copy of the state to avoid mutations during parallel processing
-    # This helps prevent race conditions and unexpected state changes
-    working_state = state.model_copy(deep=True)
+    # Copy-on-write: share everything with the caller's state except the plan,
+    # the only object written below. Nested containers on the copied plan are
+    # still shared, so writers must replace them (e.g. alerts) rather than
+    # mutate them in place.
+    working_state = state.model_copy(
+        update={"plan": state.plan.model_copy() if state.plan else None}
+    )
 
     try:
-        # Create agent instances with lazy loading for better resource utilization
-        agents = {
-            "flight": FlightSearchAgent(),
-            "accommodation": AccommodationAgent(),
-            "transportation": TransportationAgent(),
-            "activity": ActivityPlanningAgent(),
-        }
+        agents = _search_agents()
 
         # Set up task list with agents and their parameters
         # Include specific timeouts for each agent type
-        tasks = [
+        tasks: list[tuple[BaseAgent, dict[str, Any]]] = [
             (agents["flight"], {"query": working_state.query, "timeout": 60}),
             (agents["accommodation"], {"query": working_state.query, "timeout": 60}),
             (agents["transportation"], {"query": working_state.query, "timeout": 45}),
@@ -177,66 +319,65 @@ async def parallel_search_tasks(state: TravelPlanningState) -> TravelPlanningSta
             ),
         ]
 
-        logger.info(f"Executing {len(tasks)} tasks in parallel")
+        logger.info("Executing {} tasks in parallel", len(tasks))
 
-        # Execute all tasks in parallel with overall timeout
+        # Merge each agent's result as soon as it arrives, so fast agents update
+        # the working state while slower ones are still running
         async with asyncio.timeout(180):  # 3 minute overall timeout
-            results = await execute_in_parallel(tasks, working_state)
-
-        # Check for overall errors in parallel execution
-        if "error" in results and not any(k != "error" for k in results):
-            logger.error(f"All parallel tasks failed: {results['error']}")
-            working_state.error = f"Parallel execution error: {results['error']}"
-            if not working_state.plan or not working_state.plan.alerts:
-                if not working_state.plan:
-                    from travel_planner.data.models import TravelPlan
-
-                    working_state.plan = TravelPlan()
-                working_state.plan.alerts = []
-            working_state.plan.alerts.append(
-                f"Error in parallel search: {results['error']}"
-            )
-            working_state.current_stage = "error"
-            return working_state
-
-        # Merge results into the state
-        updated_state = merge_parallel_results(working_state, results)
+            async for agent_name, payload in iter_parallel_results(
+                tasks, working_state
+            ):
+                merge_parallel_results(working_state, {agent_name: payload})
 
         # Update the current stage
-        updated_state.current_stage = PARALLEL_SEARCH_COMPLETED
+        working_state.current_stage = WorkflowStage.PARALLEL_SEARCH_COMPLETED
 
         logger.info("Parallel search tasks completed successfully")
-        return updated_state
+        return working_state
 
     except TimeoutError:
+        # Results merged before the deadline are kept
         logger.error("Parallel search tasks timed out after 3 minutes")
         working_state.error = "Parallel search timed out"
-        if not working_state.plan or not working_state.plan.alerts:
-            if not working_state.plan:
-                from travel_planner.data.models import TravelPlan
-
-                working_state.plan = TravelPlan()
-            working_state.plan.alerts = []
-        working_state.plan.alerts.append(
-            "Search operations timed out. Some results may be incomplete."
+        _add_alert(
+            working_state,
+            "Search operations timed out. Some results may be incomplete.",
         )
         working_state.current_stage = "error"
         return working_state
 
     except Exception as e:
-        logger.error(f"Unexpected error in parallel search: {e!s}")
+        logger.error("Unexpected error in parallel search: {!s}", e)
         working_state.error = f"Unexpected error: {e!s}"
-        if not working_state.plan or not working_state.plan.alerts:
-            if not working_state.plan:
-                from travel_planner.data.models import TravelPlan
-
-                working_state.plan = TravelPlan()
-            working_state.plan.alerts = []
-        working_state.plan.alerts.append(f"Unexpected error in search: {e!s}")
+        _add_alert(working_state, f"Unexpected error in search: {e!s}")
         working_state.current_stage = "error"
         return working_state
 
 
+# Agent name -> (plan field, result keys in order of preference)
+_MERGE_SCHEMA: dict[str, tuple[str, tuple[str, ...]]] = {
+    "FlightSearchAgent": ("flights", ("flights", "flight_options")),
+    "AccommodationAgent": (
+        "accommodation",
+        ("accommodations", "accommodation_options"),
+    ),
+    "TransportationAgent": (
+        "transportation",
+        ("transportation", "transportation_options"),
+    ),
+    "ActivityPlanningAgent": ("activities", ("activities", "daily_itineraries")),
+}
+
+# Task type -> (plan field, result key, factory for the value when missing)
+_BRANCH_SCHEMA: dict[ParallelTask, tuple[str, str, Callable[[], Any]]] = {
+    ParallelTask.FLIGHT_SEARCH: ("flights", "flight_options", list),
+    ParallelTask.ACCOMMODATION: ("accommodation", "accommodations", list),
+    ParallelTask.TRANSPORTATION: ("transportation", "transportation_options", dict),
+    ParallelTask.ACTIVITIES: ("activities", "daily_itineraries", dict),
+    ParallelTask.BUDGET: ("budget", "report", dict),
+}
+
+
 def merge_parallel_results(
     state: TravelPlanningState, results: dict[str, Any]
 ) -> TravelPlanningState:
@@ -245,6 +386,8 @@ def merge_parallel_results(
 
     This function takes the results from parallel agent executions and merges them
     into a consolidated state, ensuring that all data is properly integrated.
+    The state is mutated in place and returned; callers pass a state they own
+    (see parallel_search_tasks).
 
     Args:
         state: Current travel planning state
@@ -253,124 +396,43 @@ def merge_parallel_results(
     Returns:
         Updated state with merged results
     """
-    # Create a copy of the state to update
-    updated_state = state.model_copy(deep=True)
-
-    # Initialize the plan if not yet created
-    updated_state = _ensure_plan_initialized(updated_state)
+    if state.plan is None:
+        state.plan = TravelPlan()
 
-    # Process results from each agent
-    updated_state = _process_flight_results(updated_state, results)
-    updated_state = _process_accommodation_results(updated_state, results)
-    updated_state = _process_transportation_results(updated_state, results)
-    updated_state = _process_activity_results(updated_state, results)
+    # Copy each agent's result onto its plan field, preferring the primary key
+    for agent_name, (plan_field, result_keys) in _MERGE_SCHEMA.items():
+        entry = results.get(agent_name)
+        if not entry or not entry.get("result"):
+            continue
+        data = entry["result"]
+        for key in result_keys:
+            if key in data:
+                setattr(state.plan, plan_field, data[key])
+                break
 
     # Handle errors
-    updated_state = _process_parallel_errors(updated_state, results)
+    return _process_parallel_errors(state, results)
 
-    return updated_state
 
-
-def _ensure_plan_initialized(state: TravelPlanningState) -> TravelPlanningState:
-    """Ensure the travel plan is initialized in the state."""
+def _add_alert(state: TravelPlanningState, message: str) -> None:
+    """Append an alert to the plan without mutating a shared alerts list."""
     if state.plan is None:
-        from travel_planner.data.models import TravelPlan
-
         state.plan = TravelPlan()
-    return state
-
-
-def _process_flight_results(
-    state: TravelPlanningState, results: dict[str, Any]
-) -> TravelPlanningState:
-    """Process flight search results from parallel execution."""
-    if "FlightSearchAgent" not in results or not results["FlightSearchAgent"]["result"]:
-        return state
-
-    flight_data = results["FlightSearchAgent"]["result"]
-
-    if "flights" in flight_data:
-        state.plan.flights = flight_data["flights"]
-    elif "flight_options" in flight_data:
-        state.plan.flights = flight_data["flight_options"]
-
-    return state
-
-
-def _process_accommodation_results(
-    state: TravelPlanningState, results: dict[str, Any]
-) -> TravelPlanningState:
-    """Process accommodation results from parallel execution."""
-    if (
-        "AccommodationAgent" not in results
-        or not results["AccommodationAgent"]["result"]
-    ):
-        return state
-
-    accom_data = results["AccommodationAgent"]["result"]
-
-    if "accommodations" in accom_data:
-        state.plan.accommodation = accom_data["accommodations"]
-    elif "accommodation_options" in accom_data:
-        state.plan.accommodation = accom_data["accommodation_options"]
-
-    return state
-
-
-def _process_transportation_results(
-    state: TravelPlanningState, results: dict[str, Any]
-) -> TravelPlanningState:
-    """Process transportation results from parallel execution."""
-    if (
-        "TransportationAgent" not in results
-        or not results["TransportationAgent"]["result"]
-    ):
-        return state
-
-    transport_data = results["TransportationAgent"]["result"]
-
-    if "transportation" in transport_data:
-        state.plan.transportation = transport_data["transportation"]
-    elif "transportation_options" in transport_data:
-        state.plan.transportation = transport_data["transportation_options"]
-
-    return state
-
-
-def _process_activity_results(
-    state: TravelPlanningState, results: dict[str, Any]
-) -> TravelPlanningState:
-    """Process activity planning results from parallel execution."""
-    if (
-        "ActivityPlanningAgent" not in results
-        or not results["ActivityPlanningAgent"]["result"]
-    ):
-        return state
-
-    activity_data = results["ActivityPlanningAgent"]["result"]
-
-    if "activities" in activity_data:
-        state.plan.activities = activity_data["activities"]
-    elif "daily_itineraries" in activity_data:
-        state.plan.activities = activity_data["daily_itineraries"]
-
-    return state
+    state.plan.alerts = [*(state.plan.alerts or []), message]
 
 
 def _process_parallel_errors(
     state: TravelPlanningState, results: dict[str, Any]
 ) -> TravelPlanningState:
     """Process errors from parallel execution and add them to the state."""
-    errors = []
-
-    for agent_name, result in results.items():
-        if result.get("error"):
-            errors.append(f"{agent_name}: {result['error']}")
-
+    errors = [
+        f"{agent_name}: {result['error']}"
+        for agent_name, result in results.items()
+        if result.get("error")
+    ]
     if errors:
-        if not state.plan.alerts:
-            state.plan.alerts = []
-        state.plan.alerts.extend(errors)
+        # Replace rather than extend: the list may be shared with another state
+        state.plan.alerts = [*(state.plan.alerts or []), *errors]
 
     return state
 
@@ -381,6 +443,8 @@ def combine_parallel_branch_results(
     """
     Combine results from a LangGraph parallel branch execution.
 
+    The state is mutated in place and returned.
+
     Args:
         state: Current travel planning state
         branch_results: Results from parallel branch execution
@@ -388,162 +452,61 @@ def combine_parallel_branch_results(
     Returns:
         Updated state with combined results
     """
-    # Create a copy of the state to update
-    updated_state = state.model_copy(deep=True)
-
-    # Initialize the plan if not yet created
-    updated_state = _ensure_plan_initialized(updated_state)
-
-    # Ensure there are results to process
-    if not _validate_branch_results(branch_results):
-        logger.warning("No results from parallel branch execution")
-        return updated_state
+    if state.plan is None:
+        state.plan = TravelPlan()
 
-    # Extract and organize results by task type
+    # Organize results by task type, ensuring there are results to process
     results_by_task = _organize_branch_results(branch_results)
+    if results_by_task is None:
+        logger.warning("No results from parallel branch execution")
+        return state
 
-    # Process results from each task type
-    updated_state = _process_branch_flight_results(updated_state, results_by_task)
-    updated_state = _process_branch_accommodation_results(
-        updated_state, results_by_task
-    )
-    updated_state = _process_branch_transportation_results(
-        updated_state, results_by_task
-    )
-    updated_state = _process_branch_activity_results(updated_state, results_by_task)
-    updated_state = _process_branch_budget_results(updated_state, results_by_task)
+    # One pass over the tasks that actually reported: copy each success onto
+    # its plan field and collect each failure as an alert
+    errors = []
+    for task_type, task_result in results_by_task.items():
+        if task_result.error:
+            errors.append(f"{task_type.value}: {task_result.error}")
+        elif task_result.completed:
+            plan_field, result_key, default = _BRANCH_SCHEMA[task_type]
+            data = task_result.result
+            value = data[result_key] if result_key in data else default()
+            setattr(state.plan, plan_field, value)
 
-    # Process errors
-    updated_state = _process_branch_errors(updated_state, results_by_task)
+    if errors:
+        # Replace rather than extend: the list may be shared with another state
+        state.plan.alerts = [*(state.plan.alerts or []), *errors]
 
     # Update workflow stage
-    updated_state = _update_workflow_stage(updated_state)
-
-    return updated_state
-
-
-def _validate_branch_results(branch_results: dict[str, ParallelResult]) -> bool:
-    """Validate that the branch results contain actual result data."""
-    # Improved validation that checks if there's any result in the branch results
-    if not branch_results:
-        return False
-
-    # Check for the 'result' key at the top level
-    if branch_results.get("result"):
-        return True
-
-    # Check if any of the values in branch_results are ParallelResult objects
-    # that have completed successfully
-    for key, value in branch_results.items():
-        if isinstance(value, ParallelResult) and value.completed and not value.error:
-            return True
-
-    return False
+    return _update_workflow_stage(state)
 
 
 def _organize_branch_results(
     branch_results: dict[str, ParallelResult],
-) -> dict[ParallelTask, ParallelResult]:
-    """Organize parallel branch results by task type."""
+) -> dict[ParallelTask, ParallelResult] | None:
+    """
+    Organize parallel branch results by task type.
+
+    Args:
+        branch_results: Results from parallel branch execution
+
+    Returns:
+        Results keyed by task type, or None if the branches produced no result
+        data (no top-level 'result' flag and no task that completed cleanly)
+    """
     results_by_task = {}
+    has_result = False
     for task_result in branch_results.values():
         if isinstance(task_result, ParallelResult):
-            task_type = task_result.task_type
-            results_by_task[task_type] = task_result
-    return results_by_task
-
-
-def _process_branch_flight_results(
-    state: TravelPlanningState, results_by_task: dict[ParallelTask, ParallelResult]
-) -> TravelPlanningState:
-    """Process flight search results from branch execution."""
-    if ParallelTask.FLIGHT_SEARCH not in results_by_task:
-        return state
-
-    flight_result = results_by_task[ParallelTask.FLIGHT_SEARCH]
-    if flight_result.completed and not flight_result.error:
-        state.plan.flights = flight_result.result.get("flight_options", [])
-
-    return state
-
-
-def _process_branch_accommodation_results(
-    state: TravelPlanningState, results_by_task: dict[ParallelTask, ParallelResult]
-) -> TravelPlanningState:
-    """Process accommodation results from branch execution."""
-    if ParallelTask.ACCOMMODATION not in results_by_task:
-        return state
-
-    accom_result = results_by_task[ParallelTask.ACCOMMODATION]
-    if accom_result.completed and not accom_result.error:
-        state.plan.accommodation = accom_result.result.get("accommodations", [])
-
-    return state
-
-
-def _process_branch_transportation_results(
-    state: TravelPlanningState, results_by_task: dict[ParallelTask, ParallelResult]
-) -> TravelPlanningState:
-    """Process transportation results from branch execution."""
-    if ParallelTask.TRANSPORTATION not in results_by_task:
-        return state
-
-    transport_result = results_by_task[ParallelTask.TRANSPORTATION]
-    if transport_result.completed and not transport_result.error:
-        state.plan.transportation = transport_result.result.get(
-            "transportation_options", {}
-        )
-
-    return state
+            results_by_task[task_result.task_type] = task_result
+            has_result = has_result or (task_result.completed and not task_result.error)
 
-
-def _process_branch_activity_results(
-    state: TravelPlanningState, results_by_task: dict[ParallelTask, ParallelResult]
-) -> TravelPlanningState:
-    """Process activity results from branch execution."""
-    if ParallelTask.ACTIVITIES not in results_by_task:
-        return state
-
-    activity_result = results_by_task[ParallelTask.ACTIVITIES]
-    if activity_result.completed and not activity_result.error:
-        state.plan.activities = activity_result.result.get("daily_itineraries", {})
-
-    return state
-
-
-def _process_branch_budget_results(
-    state: TravelPlanningState, results_by_task: dict[ParallelTask, ParallelResult]
-) -> TravelPlanningState:
-    """Process budget results from branch execution."""
-    if ParallelTask.BUDGET not in results_by_task:
-        return state
-
-    budget_result = results_by_task[ParallelTask.BUDGET]
-    if budget_result.completed and not budget_result.error:
-        state.plan.budget = budget_result.result.get("report", {})
-
-    return state
-
-
-def _process_branch_errors(
-    state: TravelPlanningState, results_by_task: dict[ParallelTask, ParallelResult]
-) -> TravelPlanningState:
-    """Process errors from branch execution and add them to the state."""
-    errors = []
-
-    for task_type, task_result in results_by_task.items():
-        if task_result.error:
-            errors.append(f"{task_type.value}: {task_result.error}")
-
-    if errors:
-        if not state.plan.alerts:
-            state.plan.alerts = []
-        state.plan.alerts.extend(errors)
-
-    return state
+    if has_result or branch_results.get("result"):
+        return results_by_task
+    return None
 
 
 def _update_workflow_stage(state: TravelPlanningState) -> TravelPlanningState:
     """Update the workflow stage in the state."""
-    state.current_stage = PARALLEL_SEARCH_COMPLETED
+    state.current_stage = WorkflowStage.PARALLEL_SEARCH_COMPLETED
     return state
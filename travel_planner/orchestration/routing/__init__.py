@@ -9,6 +9,7 @@ from travel_planner.orchestration.routing.conditions import (
     continue_after_intervention,
     error_recoverable,
     has_error,
+    has_terminal_failure,
     needs_human_intervention,
     query_research_needed,
     recover_to_stage,
@@ -24,6 +25,7 @@ __all__ = [
     "handle_error",
     "handle_interruption",
     "has_error",
+    "has_terminal_failure",
     "needs_human_intervention",
     "query_research_needed",
     "recover_to_stage",
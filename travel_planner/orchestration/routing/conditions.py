@@ -5,7 +5,12 @@ This module contains functions that determine workflow routing based on state an
 including error detection, recovery decisions, and human intervention requirements.
 """
 
-from travel_planner.orchestration.states.planning_state import TravelPlanningState
+from typing import Final
+
+from travel_planner.orchestration.states.planning_state import (
+    Msg,
+    TravelPlanningState,
+)
 from travel_planner.orchestration.states.workflow_stages import WorkflowStage
 
 # Constants
@@ -13,6 +18,11 @@ MAX_ERROR_COUNT = 3  # Maximum number of errors before recovery is not possible
 # Number of errors that trigger human intervention
 HUMAN_INTERVENTION_ERROR_THRESHOLD = 2
 
+# Edge labels returned by the boolean routers; LangGraph evaluates these at
+# every node boundary, so share one constant per label
+_TRUE: Final = "true"
+_FALSE: Final = "false"
+
 
 def query_research_needed(state: TravelPlanningState) -> str:
     """
@@ -41,9 +51,22 @@ def has_error(state: TravelPlanningState) -> str:
     Returns:
         "true" if the state has an error, "false" otherwise
     """
-    if state.error or state.current_stage == WorkflowStage.ERROR:
-        return "true"
-    return "false"
+    return (
+        _TRUE if state.error or state.current_stage == WorkflowStage.ERROR else _FALSE
+    )
+
+
+def has_terminal_failure(state: TravelPlanningState) -> str:
+    """
+    Check if a task has failed with no retries left.
+
+    Args:
+        state: Current travel planning state
+
+    Returns:
+        "true" if the workflow should stop and handle the error, "false" otherwise
+    """
+    return _TRUE if state.terminal_failure else _FALSE
 
 
 def error_recoverable(state: TravelPlanningState) -> str:
@@ -61,13 +84,13 @@ def error_recoverable(state: TravelPlanningState) -> str:
 
     # Check if we can retry this stage
     if state.should_retry(error_stage):
-        return "true"
+        return _TRUE
 
     # If error count is too high, not recoverable
     if state.error_count > MAX_ERROR_COUNT:
-        return "false"
+        return _FALSE
 
-    return "true"
+    return _TRUE
 
 
 def recover_to_stage(state: TravelPlanningState) -> str:
@@ -91,7 +114,7 @@ def recover_to_stage(state: TravelPlanningState) -> str:
 
     # Add a note to the conversation history
     state.conversation_history.append(
-        {"role": "system", "content": f"Recovering from error, retrying {error_stage}"}
+        Msg("system", f"Recovering from error, retrying {error_stage}")
     )
 
     return error_stage
@@ -109,17 +132,17 @@ def needs_human_intervention(state: TravelPlanningState) -> str:
     """
     # Check if the state has requested guidance
     if state.guidance_requested:
-        return "true"
+        return _TRUE
 
     # Check if we have too many errors (might need human help)
     if state.error_count >= HUMAN_INTERVENTION_ERROR_THRESHOLD:
-        return "true"
+        return _TRUE
 
     # Check if we have an interrupted state
     if state.interrupted:
-        return "true"
+        return _TRUE
 
-    return "false"
+    return _FALSE
 
 
 def continue_after_intervention(state: TravelPlanningState) -> str:
@@ -146,10 +169,7 @@ def continue_after_intervention(state: TravelPlanningState) -> str:
 
     # Add note to conversation history
     state.conversation_history.append(
-        {
-            "role": "system",
-            "content": f"Continuing workflow at {return_stage} after human intervention",
-        }
+        Msg("system", f"Continuing workflow at {return_stage} after human intervention")
     )
 
     return return_stage
@@ -170,20 +190,19 @@ def plan_complete(state: TravelPlanningState) -> bool:
         return True
 
     # Check if all required components of the travel plan are present
-    if not state.plan:
+    plan = state.plan
+    if not plan:
         return False
 
-    required_fields = [
-        state.plan.destination,
-        state.plan.flights,
-        state.plan.accommodation,
-        state.plan.activities,
-        state.plan.transportation,
-        state.plan.budget,
-    ]
-
-    # Check if all required fields are present
-    fields_complete = all(required_fields)
+    # Check if all required fields are present, stopping at the first gap
+    fields_complete = bool(
+        plan.destination
+        and plan.flights
+        and plan.accommodation
+        and plan.activities
+        and plan.transportation
+        and plan.budget
+    )
 
     # If all fields are complete but state isn't marked complete, update it
     if fields_complete and state.current_stage != WorkflowStage.COMPLETE:
@@ -5,7 +5,13 @@ This module implements functions for handling errors and recovering from
 interruptions in the workflow, including checkpointing and resumption.
 """
 
-from travel_planner.orchestration.states.planning_state import TravelPlanningState
+from travel_planner.orchestration.serialization.checkpoint import (
+    save_state_checkpoint,
+)
+from travel_planner.orchestration.states.planning_state import (
+    Msg,
+    TravelPlanningState,
+)
 from travel_planner.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -21,25 +27,22 @@ def handle_error(state: TravelPlanningState) -> TravelPlanningState:
     Returns:
         Updated state with error handling
     """
-    from travel_planner.orchestration.serialization.checkpoint import (
-        save_state_checkpoint,
-    )
-
     # Get the error message
     error_message = state.error or "Unknown error"
 
     # Add error to the conversation history
-    state.conversation_history.append(
-        {"role": "system", "content": f"Error occurred: {error_message}"}
-    )
+    state.conversation_history.append(Msg("system", f"Error occurred: {error_message}"))
 
-    # Create checkpoint for potential recovery
-    checkpoint_id = save_state_checkpoint(state)
+    # Create checkpoint for potential recovery. The workflow usually carries
+    # on in this process, so keep it in memory and let the disk write batch.
+    checkpoint_id = save_state_checkpoint(state, persist=False)
 
     # Update checkpoint ID in state
     state.state_checkpoint_id = checkpoint_id
 
-    logger.error(f"Handled error: {error_message}. Created checkpoint: {checkpoint_id}")
+    logger.error(
+        "Handled error: {}. Created checkpoint: {}", error_message, checkpoint_id
+    )
 
     return state
 
@@ -54,10 +57,6 @@ def handle_interruption(state: TravelPlanningState) -> TravelPlanningState:
     Returns:
         Updated state with interruption handling
     """
-    from travel_planner.orchestration.serialization.checkpoint import (
-        save_state_checkpoint,
-    )
-
     # Mark the state as interrupted if not already
     if not state.interrupted:
         state.mark_interrupted("User requested interruption")
@@ -70,13 +69,13 @@ def handle_interruption(state: TravelPlanningState) -> TravelPlanningState:
 
     # Add note to conversation history
     state.conversation_history.append(
-        {
-            "role": "system",
-            "content": (
+        Msg(
+            "system",
+            (
                 f"Workflow interrupted: {state.interruption_reason}. "
                 f"Checkpoint ID: {checkpoint_id}"
             ),
-        }
+        )
     )
 
     logger.info(
@@ -11,7 +11,9 @@ from travel_planner.orchestration.serialization.checkpoint import (
     delete_state_checkpoint,
     list_state_checkpoints,
     load_state_checkpoint,
+    peek_state_checkpoint,
     save_state_checkpoint,
+    save_state_checkpoint_in_background,
 )
 from travel_planner.orchestration.serialization.incremental import (
     IncrementalCheckpointManager,
@@ -19,16 +21,22 @@ from travel_planner.orchestration.serialization.incremental import (
     load_incremental_checkpoint,
     save_incremental_checkpoint,
 )
+from travel_planner.orchestration.serialization.sqlite_store import (
+    SQLiteCheckpointManager,
+)
 
 __all__ = [
     "CheckpointManager",
     "IncrementalCheckpointManager",
+    "SQLiteCheckpointManager",
     "default_checkpoint_manager",
     "delete_state_checkpoint",
     "incremental_checkpoint_manager",
     "list_state_checkpoints",
     "load_incremental_checkpoint",
     "load_state_checkpoint",
+    "peek_state_checkpoint",
     "save_incremental_checkpoint",
     "save_state_checkpoint",
+    "save_state_checkpoint_in_background",
 ]
@@ -6,14 +6,22 @@ checkpoints, allowing for resumption of interrupted workflows and reliable
 error recovery.
 """
 
-import json
+import atexit
+import contextlib
+import hashlib
+import heapq
+import itertools
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 
-from travel_planner.data.models import TravelPlan, TravelQuery, UserPreferences
+from travel_planner.config import CheckpointBackend, config
+from travel_planner.orchestration.serialization import codec
 from travel_planner.orchestration.states.planning_state import TravelPlanningState
-from travel_planner.orchestration.states.workflow_stages import WorkflowStage
 from travel_planner.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -21,6 +29,76 @@ logger = get_logger(__name__)
 # Default directory for storing checkpoints
 DEFAULT_CHECKPOINT_DIR = os.path.expanduser("~/.travel_planner/checkpoints")
 
+# Number of checkpoints kept in memory per manager
+DEFAULT_CACHE_SIZE = 32
+
+# Checkpoint file extensions, in the order load_checkpoint looks for them.
+# Files are written with codec.FILE_SUFFIX; the others cover checkpoints
+# saved before an optional codec dependency was installed.
+CHECKPOINT_SUFFIXES = (".msgpack.zst", ".json.zst", ".msgpack", ".json")
+
+# Small per-checkpoint file holding just the metadata list_checkpoints reports,
+# so rebuilding the index does not have to decode every checkpoint
+META_SUFFIX = ".meta.json"
+
+# Append-only log of a checkpoint's conversation messages, one JSON line each.
+# Checkpoint files only record which lines make up their history.
+HISTORY_SUFFIX = ".history.jsonl"
+
+# Append-only log of checkpoint metadata, replayed by list_checkpoints
+INDEX_FILENAME = "_index.jsonl"
+
+# The index is rewritten from its replayed rows once it holds at least this
+# many superseded rows and they outnumber the live ones
+INDEX_COMPACT_MIN_DEAD_ROWS = 64
+
+# Seconds a checkpoint saved with persist=False may stay memory-only
+DEFERRED_FLUSH_DELAY = 5.0
+
+# Dedicated writer thread for checkpoint writes that should not block the
+# workflow. A single worker drains its queue in order, so repeated saves of
+# one checkpoint land on disk (and in the index) oldest first.
+_CHECKPOINT_POOL = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="checkpoint-writer"
+)
+
+
+def _checkpoint_id_from_filename(filename: str) -> str | None:
+    """Get the checkpoint ID from a file name, or None for other files."""
+    if filename.endswith(META_SUFFIX):
+        return None
+    for suffix in CHECKPOINT_SUFFIXES:
+        if filename.endswith(suffix):
+            return filename.removesuffix(suffix)
+    return None
+
+
+def _unlogged_messages(
+    logged: list[dict[str, Any]], history: list[dict[str, Any]]
+) -> list[dict[str, Any]] | None:
+    """
+    Find the messages appended to a history since it was last logged.
+
+    The history is a ring buffer, so older messages may have dropped off
+    the front. The new messages are whatever follows the longest prefix of
+    history that matches the end of the logged messages.
+
+    Args:
+        logged: Messages as of the last log write
+        history: Current messages
+
+    Returns:
+        The new messages, or None if history does not continue the logged ones
+    """
+    if not logged:
+        return history
+    last = logged[-1]
+    # New messages are usually few, so search for the overlap from the end
+    for end in range(min(len(history), len(logged)), 0, -1):
+        if history[end - 1] == last and history[:end] == logged[-end:]:
+            return history[end:]
+    return None
+
 
 class CheckpointManager:
     """
@@ -30,31 +108,223 @@ class CheckpointManager:
     disk, load them for workflow resumption, and manage checkpoint cleanup.
     """
 
-    def __init__(self, checkpoint_dir: str | None = None):
+    def __init__(
+        self, checkpoint_dir: str | None = None, cache_size: int = DEFAULT_CACHE_SIZE
+    ):
         """
         Initialize the checkpoint manager.
 
         Args:
             checkpoint_dir: Directory for storing checkpoints (optional)
+            cache_size: Maximum number of checkpoints kept in memory
         """
         self.checkpoint_dir = checkpoint_dir or DEFAULT_CHECKPOINT_DIR
 
         # Ensure checkpoint directory exists
         os.makedirs(self.checkpoint_dir, exist_ok=True)
 
-        # Keep track of active checkpoints
-        self.active_checkpoints: dict[str, dict[str, Any]] = {}
-
-    def save_checkpoint(self, state: TravelPlanningState) -> str:
+        # Recently saved or loaded checkpoints, least recently used first
+        self.active_checkpoints: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self.cache_size = cache_size
+        # Digest of each cached checkpoint as last written to disk, private so
+        # no caller can change it the way they can a cached dict
+        self._saved_digests: dict[str, bytes] = {}
+
+        # Disk writes still in flight from save_checkpoint_in_background
+        self.pending_writes: dict[str, Future] = {}
+
+        # Checkpoints saved with persist=False, not yet written to disk, and
+        # the digest and write ticket of each
+        self.pending_flush: dict[str, dict[str, Any]] = {}
+        self._flush_writes: dict[str, tuple[bytes, int]] = {}
+        self._flush_lock = threading.Lock()
+        self._flush_timer: threading.Timer | None = None
+        self._flush_registered = False
+
+        # Ticket of the newest write claimed for each checkpoint. Writes run
+        # one at a time under _write_lock and drop out once a newer save or a
+        # delete has replaced their ticket, so old data never lands last.
+        self._write_tickets = itertools.count()
+        self._latest_writes: dict[str, int] = {}
+        self._claim_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+        # Per checkpoint: lines in its history log and the messages they end
+        # with, so each save only appends what is new
+        self._history_logs: dict[str, tuple[int, list[dict[str, Any]]]] = {}
+        self._history_lock = threading.Lock()
+
+        # Metadata index, appended to from the background write pool as well
+        self._index_path = os.path.join(self.checkpoint_dir, INDEX_FILENAME)
+        self._index_lock = threading.Lock()
+
+    def save_checkpoint(self, state: TravelPlanningState, persist: bool = True) -> str:
         """
         Save a checkpoint of the current workflow state.
 
+        Args:
+            state: Current workflow state to save
+            persist: Write the checkpoint to disk before returning. When False
+                it is only kept in memory, and written out in a batch by
+                flush_pending_checkpoints after DEFERRED_FLUSH_DELAY seconds
+                or at interpreter exit.
+
+        Returns:
+            Checkpoint ID of the saved checkpoint
+        """
+        checkpoint_id, checkpoint_data, digest, unchanged = self._prepare_checkpoint(
+            state
+        )
+
+        if unchanged and not self._write_pending(checkpoint_id):
+            logger.debug(f"Checkpoint {checkpoint_id} is unchanged; skipping write")
+            return checkpoint_id
+
+        ticket = self._claim_write(checkpoint_id)
+        if not persist:
+            self._defer_write(checkpoint_id, checkpoint_data, digest, ticket)
+            logger.info(
+                f"Cached checkpoint {checkpoint_id} at stage {state.current_stage}"
+            )
+            return checkpoint_id
+
+        # A later flush must not overwrite this save with an older snapshot
+        with self._flush_lock:
+            self.pending_flush.pop(checkpoint_id, None)
+            self._flush_writes.pop(checkpoint_id, None)
+        self._persist(checkpoint_id, checkpoint_data, digest, ticket)
+
+        logger.info(f"Saved checkpoint {checkpoint_id} at stage {state.current_stage}")
+
+        return checkpoint_id
+
+    def save_checkpoint_in_background(self, state: TravelPlanningState) -> str:
+        """
+        Save a checkpoint, writing it to disk on a background thread.
+
+        The checkpoint is snapshotted and cached in memory before returning,
+        so it can be loaded immediately; only the disk write is deferred.
+
         Args:
             state: Current workflow state to save
 
         Returns:
             Checkpoint ID of the saved checkpoint
         """
+        checkpoint_id, checkpoint_data, digest, unchanged = self._prepare_checkpoint(
+            state
+        )
+        if unchanged and not self._write_pending(checkpoint_id):
+            logger.debug(f"Checkpoint {checkpoint_id} is unchanged; skipping write")
+            return checkpoint_id
+
+        # As in save_checkpoint, a later flush must not land an older snapshot
+        ticket = self._claim_write(checkpoint_id)
+        with self._flush_lock:
+            self.pending_flush.pop(checkpoint_id, None)
+            self._flush_writes.pop(checkpoint_id, None)
+        future = _CHECKPOINT_POOL.submit(
+            self._persist, checkpoint_id, checkpoint_data, digest, ticket
+        )
+        self.pending_writes[checkpoint_id] = future
+        future.add_done_callback(
+            lambda done: self._forget_pending_write(checkpoint_id, done)
+        )
+
+        logger.info(f"Queued checkpoint {checkpoint_id} at stage {state.current_stage}")
+
+        return checkpoint_id
+
+    def _forget_pending_write(self, checkpoint_id: str, future: Future) -> None:
+        """Drop a finished write, unless the checkpoint was queued again."""
+        # Nobody may ever wait on the future, so report failures here
+        error = future.exception()
+        if error is not None:
+            logger.opt(exception=error).error(
+                f"Background write of checkpoint {checkpoint_id} failed"
+            )
+        if self.pending_writes.get(checkpoint_id) is future:
+            del self.pending_writes[checkpoint_id]
+
+    def wait_for_checkpoint(self, checkpoint_id: str) -> str:
+        """
+        Block until a background checkpoint write has reached disk.
+
+        Args:
+            checkpoint_id: ID returned by save_checkpoint_in_background
+
+        Returns:
+            The same checkpoint ID, once durable
+        """
+        future = self.pending_writes.get(checkpoint_id)
+        if future is not None:
+            future.result()
+        return checkpoint_id
+
+    def _defer_write(
+        self,
+        checkpoint_id: str,
+        checkpoint_data: dict[str, Any],
+        digest: bytes,
+        ticket: int,
+    ) -> None:
+        """Hold checkpoint data for the next flush, scheduling one if needed."""
+        with self._flush_lock:
+            self.pending_flush[checkpoint_id] = checkpoint_data
+            self._flush_writes[checkpoint_id] = (digest, ticket)
+            if not self._flush_registered:
+                atexit.register(self.flush_pending_checkpoints)
+                self._flush_registered = True
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(
+                    DEFERRED_FLUSH_DELAY, self.flush_pending_checkpoints
+                )
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush_pending_checkpoints(self) -> int:
+        """
+        Write every checkpoint saved with persist=False to disk.
+
+        Returns:
+            Number of checkpoints written
+        """
+        with self._flush_lock:
+            pending = dict(self.pending_flush)
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+        written = 0
+        for checkpoint_id, checkpoint_data in pending.items():
+            # Write under the lock, and only if the entry is still pending: a
+            # save that took it over writes a newer snapshot, and one that
+            # comes during the write waits for it, so old data never lands last
+            with self._flush_lock:
+                if self.pending_flush.get(checkpoint_id) is not checkpoint_data:
+                    continue
+                self._persist(
+                    checkpoint_id, checkpoint_data, *self._flush_writes[checkpoint_id]
+                )
+                del self.pending_flush[checkpoint_id]
+                del self._flush_writes[checkpoint_id]
+            written += 1
+
+        if written:
+            logger.info(f"Flushed {written} deferred checkpoints")
+        return written
+
+    def _prepare_checkpoint(
+        self, state: TravelPlanningState
+    ) -> tuple[str, dict[str, Any], bytes, bool]:
+        """
+        Snapshot the state into checkpoint data and cache it in memory.
+
+        Returns:
+            Checkpoint ID, checkpoint data, its digest for _persist, and
+            whether the data matches what was last written under that ID
+            apart from its timestamps
+        """
         # Create checkpoint data
         checkpoint_data = state.create_checkpoint()
         checkpoint_id = checkpoint_data["checkpoint_id"]
@@ -63,17 +333,182 @@ class CheckpointManager:
         checkpoint_data["timestamp"] = datetime.now().isoformat()
         checkpoint_data["workflow_stage"] = str(state.current_stage)
 
+        # Nested values are mutated in place all over the workflow, so there
+        # is no cheap revision to key on; a digest of the JSON dump, without
+        # the timestamps, still spares an unchanged save the encode and write
+        digest = hashlib.blake2b(
+            codec.dumps(
+                {**checkpoint_data, "checkpoint_time": None, "timestamp": None}
+            ),
+            digest_size=16,
+        ).digest()
+        unchanged = self._saved_digests.get(checkpoint_id) == digest
+
         # Save to in-memory cache
+        self._cache_put(checkpoint_id, checkpoint_data)
+
+        return checkpoint_id, checkpoint_data, digest, unchanged
+
+    def _cache_get(self, checkpoint_id: str) -> dict[str, Any] | None:
+        """Get cached checkpoint data, marking it as recently used."""
+        checkpoint_data = self.active_checkpoints.get(checkpoint_id)
+        if checkpoint_data is not None:
+            self.active_checkpoints.move_to_end(checkpoint_id)
+        return checkpoint_data
+
+    def _cache_put(self, checkpoint_id: str, checkpoint_data: dict[str, Any]) -> None:
+        """Cache checkpoint data, evicting the least recently used overflow."""
         self.active_checkpoints[checkpoint_id] = checkpoint_data
+        self.active_checkpoints.move_to_end(checkpoint_id)
+        while len(self.active_checkpoints) > self.cache_size:
+            evicted_id, _ = self.active_checkpoints.popitem(last=False)
+            self._saved_digests.pop(evicted_id, None)
+
+    def _cache_drop(self, checkpoint_id: str) -> None:
+        """Forget a checkpoint's cached data and saved digest."""
+        self.active_checkpoints.pop(checkpoint_id, None)
+        self._saved_digests.pop(checkpoint_id, None)
+
+    def _write_pending(self, checkpoint_id: str) -> bool:
+        """Whether a deferred or queued write may still replace what is on disk."""
+        with self._claim_lock:
+            return checkpoint_id in self._latest_writes
+
+    def _claim_write(self, checkpoint_id: str) -> int:
+        """Take the ticket a write needs to be the latest one for a checkpoint."""
+        with self._claim_lock:
+            ticket = next(self._write_tickets)
+            self._latest_writes[checkpoint_id] = ticket
+        return ticket
+
+    def _persist(
+        self,
+        checkpoint_id: str,
+        checkpoint_data: dict[str, Any],
+        digest: bytes,
+        ticket: int,
+    ) -> None:
+        """
+        Write checkpoint data unless a newer save or a delete has superseded it.
 
-        # Save to disk
-        checkpoint_path = os.path.join(self.checkpoint_dir, f"{checkpoint_id}.json")
-        with open(checkpoint_path, "w") as f:
-            json.dump(checkpoint_data, f, indent=2)
+        The digest is recorded only once the data is stored.
+        """
+        with self._write_lock:
+            with self._claim_lock:
+                if self._latest_writes.get(checkpoint_id) != ticket:
+                    logger.debug(
+                        f"Checkpoint {checkpoint_id} was superseded; skipping write"
+                    )
+                    return
+            try:
+                self._write_checkpoint(checkpoint_id, checkpoint_data)
+            except BaseException:
+                # The stored copy may now be partial, so no later save may be
+                # skipped as matching it
+                self._saved_digests.pop(checkpoint_id, None)
+                raise
+            finally:
+                with self._claim_lock:
+                    if self._latest_writes.get(checkpoint_id) == ticket:
+                        del self._latest_writes[checkpoint_id]
+            self._saved_digests[checkpoint_id] = digest
+
+    def _write_checkpoint(
+        self, checkpoint_id: str, checkpoint_data: dict[str, Any]
+    ) -> None:
+        """Persist checkpoint data to disk."""
+        checkpoint_path = os.path.join(
+            self.checkpoint_dir, f"{checkpoint_id}{codec.FILE_SUFFIX}"
+        )
+        # Store the conversation by reference into its append-only log, so
+        # checkpoint size does not grow with the conversation
+        history = checkpoint_data.get("conversation_history") or []
+        stored_data = {
+            **checkpoint_data,
+            "conversation_history": None,
+            "history_ref": f"{checkpoint_id}{HISTORY_SUFFIX}",
+            "history_end": self._log_history(checkpoint_id, history),
+            "history_len": len(history),
+        }
+
+        # Encode up front and hand the file one buffer: json.dump streams
+        # through iterencode and issues a write per chunk
+        payload = codec.encode(stored_data)
+        with open(checkpoint_path, "wb") as f:
+            f.write(payload)
+            if config.system.checkpoint_fsync:
+                # Checkpoints exist for crash recovery, so make them durable
+                f.flush()
+                os.fsync(f.fileno())
+
+        # The sidecar can always be rebuilt from the checkpoint, so no fsync
+        info = self._checkpoint_info(checkpoint_data)
+        with open(self._meta_path(checkpoint_id), "wb") as f:
+            f.write(codec.dumps(info))
+
+        self._append_to_index(info)
+
+    def _log_history(self, checkpoint_id: str, history: list[dict[str, Any]]) -> int:
+        """
+        Append the messages not yet in a checkpoint's history log.
 
-        logger.info(f"Saved checkpoint {checkpoint_id} at stage {state.current_stage}")
+        Args:
+            checkpoint_id: Checkpoint the history belongs to
+            history: Dumped conversation history being saved
 
-        return checkpoint_id
+        Returns:
+            Number of lines in the log, the last len(history) of which are
+            the history
+        """
+        history_path = os.path.join(
+            self.checkpoint_dir, f"{checkpoint_id}{HISTORY_SUFFIX}"
+        )
+        with self._history_lock:
+            if checkpoint_id in self._history_logs:
+                line_count, logged = self._history_logs[checkpoint_id]
+                new_messages = _unlogged_messages(logged, history)
+            else:
+                # First write in this process; keep what an earlier one logged
+                line_count = self._count_history_lines(history_path)
+                new_messages = None
+            if new_messages is None:
+                # Earlier lines stay valid for the checkpoint file on disk
+                # until it is replaced, so log the whole history again
+                new_messages = history
+
+            if new_messages:
+                with open(history_path, "ab") as f:
+                    f.write(b"".join(codec.dumps(msg) + b"\n" for msg in new_messages))
+                    if config.system.checkpoint_fsync:
+                        f.flush()
+                        os.fsync(f.fileno())
+            line_count += len(new_messages)
+            self._history_logs[checkpoint_id] = (line_count, history)
+            return line_count
+
+    @staticmethod
+    def _count_history_lines(history_path: str) -> int:
+        """Count complete lines in a history log, dropping a torn final line."""
+        try:
+            with open(history_path, "rb+") as f:
+                data = f.read()
+                complete = data.rfind(b"\n") + 1
+                if complete < len(data):
+                    f.truncate(complete)
+        except FileNotFoundError:
+            return 0
+        return data.count(b"\n")
+
+    def _read_history(self, checkpoint_data: dict[str, Any]) -> list[dict[str, Any]]:
+        """Read the conversation history a checkpoint file refers to."""
+        history_len = checkpoint_data["history_len"]
+        if not history_len:
+            return []
+        history_path = os.path.join(self.checkpoint_dir, checkpoint_data["history_ref"])
+        with open(history_path, "rb") as f:
+            lines = f.read().splitlines()
+        end = checkpoint_data["history_end"]
+        return [codec.loads(line) for line in lines[end - history_len : end]]
 
     def load_checkpoint(self, checkpoint_id: str) -> TravelPlanningState:
         """
@@ -85,31 +520,67 @@ class CheckpointManager:
         Returns:
             Reconstructed workflow state
 
+        Raises:
+            ValueError: If the checkpoint doesn't exist
+        """
+        checkpoint_data = self.peek_checkpoint(checkpoint_id)
+
+        # Reconstruct the state
+        state = self._reconstruct_state_from_checkpoint(checkpoint_data)
+
+        logger.info(f"Loaded checkpoint {checkpoint_id} at stage {state.current_stage}")
+
+        return state
+
+    def peek_checkpoint(self, checkpoint_id: str) -> dict[str, Any]:
+        """
+        Get a checkpoint's raw data without rebuilding the workflow state.
+
+        Skips the Pydantic validation load_checkpoint performs, for callers
+        that only inspect a few fields. The returned dict is shared with the
+        cache and must not be modified.
+
+        Args:
+            checkpoint_id: ID of the checkpoint to read
+
+        Returns:
+            Checkpoint data as saved
+
         Raises:
             ValueError: If the checkpoint doesn't exist
         """
         # Check in-memory cache first
-        if checkpoint_id in self.active_checkpoints:
-            checkpoint_data = self.active_checkpoints[checkpoint_id]
-        else:
+        checkpoint_data = self._cache_get(checkpoint_id) or self.pending_flush.get(
+            checkpoint_id
+        )
+        if checkpoint_data is None:
+            # An evicted background save may not have reached disk yet
+            self.wait_for_checkpoint(checkpoint_id)
+
             # Check on disk
-            checkpoint_path = os.path.join(self.checkpoint_dir, f"{checkpoint_id}.json")
-            if not os.path.exists(checkpoint_path):
+            checkpoint_data = self._read_checkpoint(checkpoint_id)
+            if checkpoint_data is None:
                 raise ValueError(f"Checkpoint {checkpoint_id} not found")
 
-            # Load checkpoint data
-            with open(checkpoint_path) as f:
-                checkpoint_data = json.load(f)
-
             # Add to in-memory cache
-            self.active_checkpoints[checkpoint_id] = checkpoint_data
+            self._cache_put(checkpoint_id, checkpoint_data)
 
-        # Reconstruct the state
-        state = self._reconstruct_state_from_checkpoint(checkpoint_data)
+        return checkpoint_data
 
-        logger.info(f"Loaded checkpoint {checkpoint_id} at stage {state.current_stage}")
+    def _read_checkpoint(self, checkpoint_id: str) -> dict[str, Any] | None:
+        """Read checkpoint data from storage, or None if it is not stored."""
+        checkpoint_paths = self._checkpoint_files(checkpoint_id)
+        if not checkpoint_paths:
+            return None
 
-        return state
+        # Load checkpoint data
+        with open(checkpoint_paths[0], "rb") as f:
+            checkpoint_data = codec.decode(f.read())
+        if "history_ref" in checkpoint_data:
+            checkpoint_data["conversation_history"] = self._read_history(
+                checkpoint_data
+            )
+        return checkpoint_data
 
     def list_checkpoints(
         self, stage: str | None = None, limit: int = 10
@@ -124,44 +595,131 @@ class CheckpointManager:
         Returns:
             List of checkpoint metadata dictionaries
         """
-        checkpoints = []
+        checkpoints = [
+            info
+            for info in self._read_index().values()
+            if not stage or info.get("workflow_stage") == stage
+        ]
+
+        # Newest first; a partial heap select avoids sorting the whole index
+        return heapq.nlargest(
+            limit, checkpoints, key=lambda x: x.get("timestamp") or ""
+        )
 
-        # First gather all checkpoints from disk
-        for filename in os.listdir(self.checkpoint_dir):
-            if not filename.endswith(".json"):
+    def _checkpoint_files(self, checkpoint_id: str) -> list[str]:
+        """Find a checkpoint's files on disk, preferred format first."""
+        return [
+            path
+            for suffix in CHECKPOINT_SUFFIXES
+            if os.path.exists(
+                path := os.path.join(self.checkpoint_dir, f"{checkpoint_id}{suffix}")
+            )
+        ]
+
+    def _meta_path(self, checkpoint_id: str) -> str:
+        """Get the path of a checkpoint's metadata sidecar."""
+        return os.path.join(self.checkpoint_dir, f"{checkpoint_id}{META_SUFFIX}")
+
+    @staticmethod
+    def _checkpoint_info(checkpoint_data: dict[str, Any]) -> dict[str, Any]:
+        """Extract the metadata list_checkpoints reports for a checkpoint."""
+        plan = checkpoint_data.get("plan") or {}
+        return {
+            "checkpoint_id": checkpoint_data.get("checkpoint_id"),
+            "timestamp": checkpoint_data.get("timestamp"),
+            "workflow_stage": checkpoint_data.get("workflow_stage"),
+            "plan_id": (plan.get("metadata") or {}).get("id"),
+            "destination": (plan.get("destination") or {}).get("name"),
+            "error": checkpoint_data.get("error"),
+        }
+
+    def _read_index(self) -> dict[str, dict[str, Any]]:
+        """Replay the index log into checkpoint metadata keyed by ID."""
+        with self._index_lock:
+            if not os.path.exists(self._index_path):
+                return self._rebuild_index()
+
+            with open(self._index_path, "rb") as f:
+                content = f.read()
+
+        lines = content.splitlines()
+        index: dict[str, dict[str, Any]] = {}
+        for line in lines:
+            try:
+                row = codec.loads(line)
+            except ValueError:
+                # A torn final line from an interrupted append
+                logger.warning("Skipping unreadable checkpoint index entry")
                 continue
+            if row.get("deleted"):
+                index.pop(row["checkpoint_id"], None)
+            else:
+                index[row["checkpoint_id"]] = row
+
+        # Re-saves and deletions leave superseded rows behind
+        dead_rows = len(lines) - len(index)
+        if dead_rows >= INDEX_COMPACT_MIN_DEAD_ROWS and dead_rows > len(index):
+            self._compact_index(index, len(content))
+        return index
+
+    def _compact_index(self, index: dict[str, dict[str, Any]], size: int) -> None:
+        """
+        Rewrite the index log with one row per live checkpoint.
 
-            checkpoint_path = os.path.join(self.checkpoint_dir, filename)
+        Args:
+            index: Rows replayed from the log
+            size: Length of the log they were replayed from; if rows have
+                been appended since, compaction is left to a later read
+        """
+        with self._index_lock:
+            if os.path.getsize(self._index_path) != size:
+                return
+            temp_path = f"{self._index_path}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(b"".join(codec.dumps(row) + b"\n" for row in index.values()))
+            os.replace(temp_path, self._index_path)
+        logger.info(f"Compacted checkpoint index to {len(index)} rows")
+
+    def _append_to_index(self, row: dict[str, Any]) -> None:
+        """Append a metadata row (or a deletion marker) to the index log."""
+        with self._index_lock:
+            if not os.path.exists(self._index_path):
+                # The scan picks up this row's checkpoint along with older ones
+                self._rebuild_index()
+                return
+            with open(self._index_path, "ab") as f:
+                f.write(codec.dumps(row) + b"\n")
+
+    def _rebuild_index(self) -> dict[str, dict[str, Any]]:
+        """
+        Rebuild the index log by scanning the checkpoint directory.
+
+        Only needed when the index is missing, e.g. for a directory written
+        before the index existed. Metadata comes from the sidecar files,
+        decoding the full checkpoint only where a sidecar is missing.
+        Callers must hold the index lock.
+        """
+        index: dict[str, dict[str, Any]] = {}
+        for filename in os.listdir(self.checkpoint_dir):
+            checkpoint_id = _checkpoint_id_from_filename(filename)
+            if checkpoint_id is None or checkpoint_id in index:
+                continue
 
             try:
-                with open(checkpoint_path) as f:
-                    metadata = json.load(f)
-
-                    # Apply stage filter if provided
-                    if stage and metadata.get("workflow_stage") != stage:
-                        continue
-
-                    # Extract minimal metadata
-                    checkpoint_info = {
-                        "checkpoint_id": metadata.get("checkpoint_id"),
-                        "timestamp": metadata.get("timestamp"),
-                        "workflow_stage": metadata.get("workflow_stage"),
-                        "plan_id": metadata.get("plan", {})
-                        .get("metadata", {})
-                        .get("id"),
-                        "destination": metadata.get("plan", {})
-                        .get("destination", {})
-                        .get("name"),
-                        "error": metadata.get("error"),
-                    }
-
-                    checkpoints.append(checkpoint_info)
+                try:
+                    with open(self._meta_path(checkpoint_id), "rb") as f:
+                        info = codec.loads(f.read())
+                except FileNotFoundError:
+                    checkpoint_path = os.path.join(self.checkpoint_dir, filename)
+                    with open(checkpoint_path, "rb") as f:
+                        info = self._checkpoint_info(codec.decode(f.read()))
+                index[checkpoint_id] = info
             except Exception as e:
                 logger.error(f"Error reading checkpoint {filename}: {e}")
 
-        # Sort by timestamp (newest first) and limit
-        checkpoints.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
-        return checkpoints[:limit]
+        with open(self._index_path, "wb") as f:
+            f.write(b"".join(codec.dumps(info) + b"\n" for info in index.values()))
+        return index
 
     def delete_checkpoint(self, checkpoint_id: str) -> bool:
         """
@@ -174,19 +732,44 @@ class CheckpointManager:
             True if deleted successfully, False otherwise
         """
         # Remove from in-memory cache
-        if checkpoint_id in self.active_checkpoints:
-            del self.active_checkpoints[checkpoint_id]
-
-        # Remove from disk
-        checkpoint_path = os.path.join(self.checkpoint_dir, f"{checkpoint_id}.json")
-        if os.path.exists(checkpoint_path):
-            os.remove(checkpoint_path)
+        self._cache_drop(checkpoint_id)
+        with self._flush_lock:
+            self.pending_flush.pop(checkpoint_id, None)
+            self._flush_writes.pop(checkpoint_id, None)
+
+        # Let a write in progress finish first, and drop any still queued
+        with self._write_lock:
+            with self._claim_lock:
+                self._latest_writes.pop(checkpoint_id, None)
+            removed = self._remove_checkpoint(checkpoint_id)
+
+        if removed:
             logger.info(f"Deleted checkpoint {checkpoint_id}")
             return True
 
         logger.warning(f"Checkpoint {checkpoint_id} not found for deletion")
         return False
 
+    def _remove_checkpoint(self, checkpoint_id: str) -> bool:
+        """Remove a checkpoint from storage, returning whether it existed."""
+        # Remove from disk, in every format it was saved in
+        checkpoint_paths = self._checkpoint_files(checkpoint_id)
+        if not checkpoint_paths:
+            return False
+
+        for checkpoint_path in checkpoint_paths:
+            os.remove(checkpoint_path)
+        with self._history_lock:
+            self._history_logs.pop(checkpoint_id, None)
+        for derived_path in (
+            self._meta_path(checkpoint_id),
+            os.path.join(self.checkpoint_dir, f"{checkpoint_id}{HISTORY_SUFFIX}"),
+        ):
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(derived_path)
+        self._append_to_index({"checkpoint_id": checkpoint_id, "deleted": True})
+        return True
+
     def cleanup_old_checkpoints(self, max_age_days: int = 7) -> int:
         """
         Clean up old checkpoints.
@@ -197,39 +780,33 @@ class CheckpointManager:
         Returns:
             Number of checkpoints deleted
         """
-        now = datetime.now()
+        # Files at least a whole day older than max_age_days are expired
+        cutoff = time.time() - (max_age_days + 1) * 86400
         deleted_count = 0
 
-        for filename in os.listdir(self.checkpoint_dir):
-            if not filename.endswith(".json"):
-                continue
-
-            checkpoint_path = os.path.join(self.checkpoint_dir, filename)
-
-            try:
-                # Check file age
-                file_mtime = datetime.fromtimestamp(os.path.getmtime(checkpoint_path))
-                age_days = (now - file_mtime).days
-
-                if age_days > max_age_days:
-                    # Load the file to get checkpoint ID
-                    with open(checkpoint_path) as f:
-                        metadata = json.load(f)
-                        checkpoint_id = metadata.get("checkpoint_id")
-
-                    # Delete the checkpoint
-                    if checkpoint_id and self.delete_checkpoint(checkpoint_id):
+        with os.scandir(self.checkpoint_dir) as entries:
+            for entry in entries:
+                checkpoint_id = _checkpoint_id_from_filename(entry.name)
+                if checkpoint_id is None:
+                    continue
+
+                try:
+                    # DirEntry caches the stat, and checkpoint files are named
+                    # after their IDs, so no file needs to be opened
+                    if entry.stat().st_mtime <= cutoff and self.delete_checkpoint(
+                        checkpoint_id
+                    ):
                         deleted_count += 1
-            except Exception as e:
-                logger.error(f"Error cleaning up checkpoint {filename}: {e}")
+                except Exception as e:
+                    logger.error(f"Error cleaning up checkpoint {entry.name}: {e}")
+
+        if deleted_count:
+            # Replaying the index compacts away the deletion rows if needed
+            self._read_index()
 
         logger.info(f"Cleaned up {deleted_count} old checkpoints")
         return deleted_count
 
-    def _parse_datetime(self, datetime_str: str | None) -> datetime | None:
-        """Parse datetime string to datetime object."""
-        return datetime.fromisoformat(datetime_str) if datetime_str else None
-
     def _reconstruct_state_from_checkpoint(
         self, checkpoint_data: dict[str, Any]
     ) -> TravelPlanningState:
@@ -242,79 +819,41 @@ class CheckpointManager:
         Returns:
             Reconstructed TravelPlanningState
         """
-        # Extract plan data if available
-        plan_data = checkpoint_data.get("plan")
-        plan = TravelPlan.model_validate(plan_data) if plan_data else None
+        return TravelPlanningState.from_checkpoint_data(checkpoint_data)
 
-        # Extract query data if available
-        query_data = checkpoint_data.get("query")
-        query = TravelQuery.model_validate(query_data) if query_data else None
 
-        # Extract preferences data if available
-        preferences_data = checkpoint_data.get("preferences")
-        preferences = (
-            UserPreferences.model_validate(preferences_data)
-            if preferences_data
-            else None
+def _create_default_manager() -> CheckpointManager:
+    """Create the default manager for the configured checkpoint backend."""
+    if config.system.checkpoint_backend is CheckpointBackend.SQLITE:
+        from travel_planner.orchestration.serialization.sqlite_store import (
+            SQLiteCheckpointManager,
         )
 
-        # Convert string stage to enum
-        current_stage_str = checkpoint_data.get("current_stage", "start")
-        current_stage = (
-            WorkflowStage(current_stage_str)
-            if current_stage_str
-            else WorkflowStage.START
-        )
+        return SQLiteCheckpointManager()
+    return CheckpointManager()
 
-        # Extract previous stage if available
-        previous_stage_str = checkpoint_data.get("previous_stage")
-        previous_stage = (
-            WorkflowStage(previous_stage_str) if previous_stage_str else None
-        )
 
-        # Reconstruct state
-        state = TravelPlanningState(
-            query=query,
-            preferences=preferences,
-            plan=plan,
-            conversation_history=checkpoint_data.get("conversation_history", []),
-            current_stage=current_stage,
-            previous_stage=previous_stage,
-            error=checkpoint_data.get("error"),
-            error_count=checkpoint_data.get("error_count", 0),
-            retry_count=checkpoint_data.get("retry_count", {}),
-            interrupted=checkpoint_data.get("interrupted", False),
-            interruption_reason=checkpoint_data.get("interruption_reason"),
-            checkpoint_id=checkpoint_data.get("checkpoint_id"),
-            progress=checkpoint_data.get("progress", 0.0),
-            stage_progress=checkpoint_data.get("stage_progress", {}),
-            parallel_tasks=checkpoint_data.get("parallel_tasks", []),
-            completed_tasks=checkpoint_data.get("completed_tasks", []),
-            task_results=checkpoint_data.get("task_results", {}),
-            human_feedback=checkpoint_data.get("human_feedback", []),
-            guidance_requested=checkpoint_data.get("guidance_requested", False),
-            start_time=self._parse_datetime(checkpoint_data.get("start_time")),
-            last_update_time=self._parse_datetime(
-                checkpoint_data.get("last_update_time")
-            ),
-        )
+# Create a singleton instance
+default_checkpoint_manager = _create_default_manager()
 
-        # Reconstruct stage_times as datetimes
-        state.stage_times = {}
-        for stage_name, time_str in checkpoint_data.get("stage_times", {}).items():
-            if time_str:
-                state.stage_times[stage_name] = datetime.fromisoformat(time_str)
 
-        return state
+def save_state_checkpoint(state: TravelPlanningState, persist: bool = True) -> str:
+    """
+    Save a checkpoint of the current workflow state using the default manager.
 
+    Args:
+        state: Current workflow state to save
+        persist: Write the checkpoint to disk now rather than in a later batch
 
-# Create a singleton instance
-default_checkpoint_manager = CheckpointManager()
+    Returns:
+        Checkpoint ID of the saved checkpoint
+    """
+    return default_checkpoint_manager.save_checkpoint(state, persist=persist)
 
 
-def save_state_checkpoint(state: TravelPlanningState) -> str:
+def save_state_checkpoint_in_background(state: TravelPlanningState) -> str:
     """
-    Save a checkpoint of the current workflow state using the default manager.
+    Save a checkpoint using the default manager without waiting for disk I/O.
 
     Args:
         state: Current workflow state to save
@@ -322,7 +861,7 @@ def save_state_checkpoint(state: TravelPlanningState) -> str:
     Returns:
         Checkpoint ID of the saved checkpoint
     """
-    return default_checkpoint_manager.save_checkpoint(state)
+    return default_checkpoint_manager.save_checkpoint_in_background(state)
 
 
 def load_state_checkpoint(checkpoint_id: str) -> TravelPlanningState:
@@ -338,6 +877,19 @@ def load_state_checkpoint(checkpoint_id: str) -> TravelPlanningState:
     return default_checkpoint_manager.load_checkpoint(checkpoint_id)
 
 
+def peek_state_checkpoint(checkpoint_id: str) -> dict[str, Any]:
+    """
+    Get a checkpoint's raw data using the default manager.
+
+    Args:
+        checkpoint_id: ID of the checkpoint to read
+
+    Returns:
+        Checkpoint data as saved, without rebuilding the workflow state
+    """
+    return default_checkpoint_manager.peek_checkpoint(checkpoint_id)
+
+
 def list_state_checkpoints(
     stage: str | None = None, limit: int = 10
 ) -> list[dict[str, Any]]:
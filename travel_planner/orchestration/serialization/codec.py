@@ -0,0 +1,153 @@
+"""
+Byte-level encoding for checkpoint payloads.
+
+Checkpoint files are written as MessagePack when msgpack is installed and as
+JSON otherwise; decode() tells the two apart by their first byte, so files
+written in either format stay readable. When zstandard is installed the
+encoded bytes are also zstd-compressed, which decode() detects from the frame
+magic number. JSON is encoded with orjson when it is installed, falling back
+to the standard library json module. Line-oriented files such as the
+checkpoint index always use uncompressed JSON via dumps() and loads().
+"""
+
+import json
+import threading
+from typing import Any, cast
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - exercised only without msgpack
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - exercised only without zstandard
+    zstandard = None  # type: ignore[assignment]
+
+# Extension for files holding encode() output
+FILE_SUFFIX = (".msgpack" if msgpack is not None else ".json") + (
+    ".zst" if zstandard is not None else ""
+)
+
+# Fast level that still shrinks repetitive plan and history data several times
+ZSTD_LEVEL = 3
+
+# First bytes of every zstd frame
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# zstd contexts are reusable but not thread-safe, and checkpoints are written
+# from a thread pool, so each thread keeps its own pair
+_zstd_contexts = threading.local()
+
+
+def _zstd_compressor() -> Any:
+    """Get this thread's zstd compression context."""
+    compressor = getattr(_zstd_contexts, "compressor", None)
+    if compressor is None:
+        compressor = _zstd_contexts.compressor = zstandard.ZstdCompressor(
+            level=ZSTD_LEVEL
+        )
+    return compressor
+
+
+def _zstd_decompressor() -> Any:
+    """Get this thread's zstd decompression context."""
+    decompressor = getattr(_zstd_contexts, "decompressor", None)
+    if decompressor is None:
+        decompressor = _zstd_contexts.decompressor = zstandard.ZstdDecompressor()
+    return decompressor
+
+
+def _default(obj: Any) -> Any:
+    """Encode the types orjson handles natively for the json fallback."""
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    if hasattr(obj, "value"):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Encode an object as compact JSON bytes.
+
+    Args:
+        obj: JSON-compatible object; datetimes become ISO strings and enums
+            their values
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":"), default=_default).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Decode JSON bytes produced by dumps (or any JSON document).
+
+    Args:
+        data: Encoded JSON
+
+    Returns:
+        Decoded object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def encode(obj: Any) -> bytes:
+    """
+    Encode an object in the checkpoint file format.
+
+    Args:
+        obj: JSON-compatible object; datetimes become ISO strings and enums
+            their values, exactly as with dumps
+
+    Returns:
+        MessagePack bytes if msgpack is installed, otherwise JSON bytes;
+        zstd-compressed if zstandard is installed
+    """
+    if msgpack is not None:
+        payload = msgpack.packb(obj, default=_default, use_bin_type=True)
+    else:
+        payload = dumps(obj)
+    if zstandard is not None:
+        # cast rather than bytes(), which would copy the compressed frame
+        return cast(bytes, _zstd_compressor().compress(payload))
+    return payload
+
+
+def decode(data: bytes) -> Any:
+    """
+    Decode a checkpoint file written by encode, in any format.
+
+    Args:
+        data: Encoded checkpoint, compressed or not
+
+    Returns:
+        Decoded object
+
+    Raises:
+        ValueError: If the data needs msgpack or zstandard and it is not
+            installed
+    """
+    if data[:4] == _ZSTD_MAGIC:
+        if zstandard is None:
+            raise ValueError(
+                "Compressed checkpoint found but zstandard is not installed"
+            )
+        data = _zstd_decompressor().decompress(data)
+    # Checkpoints are JSON objects; a MessagePack map never starts with "{"
+    if data[:1] == b"{":
+        return loads(data)
+    if msgpack is None:
+        raise ValueError("MessagePack checkpoint found but msgpack is not installed")
+    return msgpack.unpackb(data, raw=False, strict_map_key=False)
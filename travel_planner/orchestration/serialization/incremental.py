@@ -6,16 +6,49 @@ changes since the last checkpoint, significantly reducing storage
 requirements and performance impact for large state objects.
 """
 
-import json
+import contextlib
+import os
+import secrets
+import time
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any
 
-from travel_planner.orchestration.serialization.checkpoint import CheckpointManager
-from travel_planner.orchestration.states.planning_state import TravelPlanningState
+try:
+    import jsonpatch
+except ImportError:  # pragma: no cover - exercised only without jsonpatch
+    jsonpatch = None
+
+from travel_planner.config import config
+from travel_planner.orchestration.serialization import codec
+from travel_planner.orchestration.serialization.checkpoint import (
+    DEFAULT_CACHE_SIZE,
+    CheckpointManager,
+)
+from travel_planner.orchestration.states.planning_state import (
+    TravelPlanningState,
+    new_checkpoint_id,
+)
 from travel_planner.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Diffs larger than this (in encoded bytes) start a new chain with a full
+# checkpoint instead, since they no longer save much over one
+DEFAULT_FULL_CHECKPOINT_THRESHOLD = 64 * 1024
+
+# Incremental checkpoints sit next to the full ones as {checkpoint_id}.incr;
+# the suffix keeps them out of the base manager's checkpoint file scans
+INCREMENTAL_SUFFIX = ".incr"
+
+# Metadata format of increments stored as JSON Patch operations rather than
+# whole changed fields; needs the optional jsonpatch package, without which
+# increments store whole changed fields
+PATCH_FORMAT = "json-patch"
+
+# Marks fields absent from the base state, which always count as changed
+_MISSING = object()
+
 
 class IncrementalCheckpoint:
     """
@@ -46,9 +79,28 @@ class IncrementalCheckpoint:
         self.parent_id = parent_id
         self.metadata = metadata or {
             "timestamp": datetime.now().isoformat(),
-            "size": len(json.dumps(data)),
+            "size": len(codec.encode(data)),
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the checkpoint to a serializable dictionary."""
+        return {
+            "checkpoint_id": self.checkpoint_id,
+            "data": self.data,
+            "parent_id": self.parent_id,
+            "metadata": self.metadata,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "IncrementalCheckpoint":
+        """Rebuild a checkpoint from the output of to_dict."""
+        return cls(
+            checkpoint_id=data["checkpoint_id"],
+            data=data["data"],
+            parent_id=data.get("parent_id"),
+            metadata=data.get("metadata"),
+        )
+
 
 class IncrementalCheckpointManager:
     """
@@ -59,23 +111,37 @@ class IncrementalCheckpointManager:
     and improving performance for large state objects.
     """
 
-    def __init__(self, base_manager: CheckpointManager | None = None):
+    def __init__(
+        self,
+        base_manager: CheckpointManager | None = None,
+        full_checkpoint_threshold: int = DEFAULT_FULL_CHECKPOINT_THRESHOLD,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
         """
         Initialize the incremental checkpoint manager.
 
         Args:
             base_manager: Optional base checkpoint manager
+            full_checkpoint_threshold: Encoded diff size, in bytes, above which
+                a full checkpoint is written instead
+            cache_size: Maximum number of incremental checkpoints kept in
+                memory; older ones are read back from disk
         """
         from travel_planner.orchestration.serialization.checkpoint import (
             default_checkpoint_manager,
         )
 
         self.base_manager = base_manager or default_checkpoint_manager
-        self.checkpoints: dict[str, IncrementalCheckpoint] = {}
+        # Recently saved or loaded checkpoints, least recently used first
+        self.checkpoints: OrderedDict[str, IncrementalCheckpoint] = OrderedDict()
+        self.cache_size = cache_size
         self.last_full_checkpoint_id: str | None = None
+        # Dump of the last full checkpoint's state, the base for every diff
+        self._base_state_dict: dict[str, Any] | None = None
         self.chain_length = 0
         # Maximum number of incremental checkpoints before a full one
         self.max_chain_length = 5
+        self.full_checkpoint_threshold = full_checkpoint_threshold
 
     def save_checkpoint(self, state: TravelPlanningState) -> str:
         """
@@ -87,21 +153,56 @@ class IncrementalCheckpointManager:
         Returns:
             ID of the new checkpoint
         """
-        # Generate checkpoint ID
+        # Generate checkpoint ID; the random suffix keeps saves made within
+        # the same second from overwriting each other's files
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        plan_id = state.plan.id if state.plan else "noplan"
-        checkpoint_id = f"incr_{state.current_stage.value}_{timestamp}_{plan_id}"
+        plan_id = (state.plan.metadata.get("id") if state.plan else None) or "noplan"
+        checkpoint_id = (
+            f"incr_{state.current_stage.value}_{timestamp}_{plan_id}_"
+            f"{secrets.token_hex(16)}"
+        )
 
-        # Check if we need a full checkpoint
+        # Diff against the current chain's base while the chain has room
+        use_patch = config.system.checkpoint_json_patch and jsonpatch is not None
+        diff_data = None
         if (
-            not self.last_full_checkpoint_id
-            or self.chain_length >= self.max_chain_length
+            self._base_state_dict is not None
+            and self.chain_length < self.max_chain_length
         ):
-            # Create a full checkpoint
-            full_checkpoint_id = self.base_manager.save_checkpoint(state)
+            if use_patch:
+                diff_data = self._calculate_state_patch(
+                    self._base_state_dict, state.model_dump()
+                )
+            else:
+                diff_data = self._calculate_state_diff(
+                    self._base_state_dict, state.model_dump()
+                )
+            diff_size = len(codec.encode(diff_data))
+            if diff_size > self.full_checkpoint_threshold:
+                logger.info(
+                    f"State diff of {diff_size} bytes exceeds "
+                    f"{self.full_checkpoint_threshold}; writing a full checkpoint"
+                )
+                diff_data = None
+
+        # Check if we need a full checkpoint
+        if diff_data is None:
+            # Create a full checkpoint under an ID of its own: saving it as
+            # state.state_checkpoint_id would overwrite the base that older
+            # chains' increments are diffed against
+            full_checkpoint_id = self.base_manager.save_checkpoint(
+                state.model_copy(update={"state_checkpoint_id": new_checkpoint_id()})
+            )
             self.last_full_checkpoint_id = full_checkpoint_id
             self.chain_length = 0
 
+            # Diff against the state as load_checkpoint will rebuild it, so
+            # fields a full checkpoint does not persist still land in diffs.
+            # Done once per chain instead of once per incremental save.
+            self._base_state_dict = self.base_manager.load_checkpoint(
+                full_checkpoint_id
+            ).model_dump()
+
             # Create metadata for the incremental checkpoint
             metadata = {
                 "timestamp": datetime.now().isoformat(),
@@ -110,50 +211,45 @@ class IncrementalCheckpointManager:
                 "full_checkpoint_id": full_checkpoint_id,
             }
 
-            # Store reference to the full checkpoint
-            self.checkpoints[checkpoint_id] = IncrementalCheckpoint(
-                checkpoint_id=checkpoint_id,
-                data={},  # No incremental data for a full checkpoint
-                parent_id=full_checkpoint_id,
-                metadata=metadata,
+            # Store reference to the full checkpoint, with the state's own
+            # checkpoint ID as its only change
+            self._store(
+                IncrementalCheckpoint(
+                    checkpoint_id=checkpoint_id,
+                    data={"state_checkpoint_id": state.state_checkpoint_id},
+                    parent_id=full_checkpoint_id,
+                    metadata=metadata,
+                )
             )
 
             logger.info(f"Created full checkpoint: {full_checkpoint_id}")
             return checkpoint_id
 
         # Create incremental checkpoint
-        if self.last_full_checkpoint_id:
-            # Load the previous state
-            previous_state = self.base_manager.load_checkpoint(
-                self.last_full_checkpoint_id
-            )
-
-            # Calculate differences
-            diff_data = self._calculate_state_diff(previous_state, state)
-
-            # Create checkpoint
-            self.checkpoints[checkpoint_id] = IncrementalCheckpoint(
+        metadata = {
+            "timestamp": datetime.now().isoformat(),
+            "stage": str(state.current_stage),
+            "is_incremental": True,
+            "parent_checkpoint_id": self.last_full_checkpoint_id,
+            "diff_size": diff_size,
+        }
+        if use_patch:
+            metadata["format"] = PATCH_FORMAT
+        self._store(
+            IncrementalCheckpoint(
                 checkpoint_id=checkpoint_id,
                 data=diff_data,
                 parent_id=self.last_full_checkpoint_id,
-                metadata={
-                    "timestamp": datetime.now().isoformat(),
-                    "stage": str(state.current_stage),
-                    "is_incremental": True,
-                    "parent_checkpoint_id": self.last_full_checkpoint_id,
-                    "diff_size": len(json.dumps(diff_data)),
-                },
+                metadata=metadata,
             )
+        )
 
-            self.chain_length += 1
-            logger.info(
-                f"Created incremental checkpoint: {checkpoint_id} "
-                f"(based on {self.last_full_checkpoint_id})"
-            )
-            return checkpoint_id
-        else:
-            # No previous checkpoint, create a full one
-            return self.save_checkpoint(state)
+        self.chain_length += 1
+        logger.info(
+            f"Created incremental checkpoint: {checkpoint_id} "
+            f"(based on {self.last_full_checkpoint_id})"
+        )
+        return checkpoint_id
 
     def load_checkpoint(self, checkpoint_id: str) -> TravelPlanningState:
         """
@@ -168,15 +264,18 @@ class IncrementalCheckpointManager:
         Raises:
             ValueError: If the checkpoint doesn't exist
         """
-        if checkpoint_id not in self.checkpoints:
-            raise ValueError(f"Checkpoint {checkpoint_id} not found")
-
-        checkpoint = self.checkpoints[checkpoint_id]
+        checkpoint = self.checkpoints.get(checkpoint_id)
+        if checkpoint is None:
+            # Evicted, or saved by an earlier process; read it back from disk
+            checkpoint = self._load_incremental(checkpoint_id)
+        self._cache_put(checkpoint)
 
         # If this is a reference to a full checkpoint, load it directly
         if "full_checkpoint_id" in checkpoint.metadata:
             full_id = checkpoint.metadata["full_checkpoint_id"]
-            return self.base_manager.load_checkpoint(full_id)
+            return self._apply_state_diff(
+                self.base_manager.load_checkpoint(full_id), checkpoint.data
+            )
 
         # Load the parent checkpoint
         if not checkpoint.parent_id:
@@ -186,36 +285,181 @@ class IncrementalCheckpointManager:
         base_state = self.base_manager.load_checkpoint(checkpoint.parent_id)
 
         # Apply the incremental changes
-        updated_state = self._apply_state_diff(base_state, checkpoint.data)
+        if checkpoint.metadata.get("format") == PATCH_FORMAT:
+            updated_state = self._apply_state_patch(base_state, checkpoint.data)
+        else:
+            updated_state = self._apply_state_diff(base_state, checkpoint.data)
 
         logger.info(f"Loaded incremental checkpoint: {checkpoint_id}")
         return updated_state
 
+    def _incremental_path(self, checkpoint_id: str) -> str:
+        """Get the on-disk path of an incremental checkpoint."""
+        return os.path.join(
+            self.base_manager.checkpoint_dir, f"{checkpoint_id}{INCREMENTAL_SUFFIX}"
+        )
+
+    def delete_checkpoint(self, checkpoint_id: str) -> bool:
+        """
+        Delete an incremental checkpoint.
+
+        The full checkpoint it is based on is left alone, since other
+        checkpoints in its chain may still refer to it.
+
+        Args:
+            checkpoint_id: ID of the checkpoint to delete
+
+        Returns:
+            True if deleted successfully, False otherwise
+        """
+        self.checkpoints.pop(checkpoint_id, None)
+        try:
+            os.remove(self._incremental_path(checkpoint_id))
+        except FileNotFoundError:
+            logger.warning(f"Checkpoint {checkpoint_id} not found for deletion")
+            return False
+        logger.info(f"Deleted incremental checkpoint {checkpoint_id}")
+        return True
+
+    def cleanup_old_checkpoints(self, max_age_days: int = 7) -> int:
+        """
+        Clean up old incremental checkpoints and the base manager's old ones.
+
+        Args:
+            max_age_days: Maximum age of checkpoints to keep (in days)
+
+        Returns:
+            Number of checkpoints deleted
+        """
+        # Same cutoff as the base manager: at least a whole day past the limit
+        cutoff = time.time() - (max_age_days + 1) * 86400
+        deleted_count = 0
+
+        with os.scandir(self.base_manager.checkpoint_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(INCREMENTAL_SUFFIX):
+                    continue
+                with contextlib.suppress(FileNotFoundError):
+                    if entry.stat().st_mtime <= cutoff and self.delete_checkpoint(
+                        entry.name.removesuffix(INCREMENTAL_SUFFIX)
+                    ):
+                        deleted_count += 1
+
+        logger.info(f"Cleaned up {deleted_count} old incremental checkpoints")
+        return deleted_count + self.base_manager.cleanup_old_checkpoints(max_age_days)
+
+    def _cache_put(self, checkpoint: IncrementalCheckpoint) -> None:
+        """Cache a checkpoint, evicting the least recently used overflow."""
+        self.checkpoints[checkpoint.checkpoint_id] = checkpoint
+        self.checkpoints.move_to_end(checkpoint.checkpoint_id)
+        while len(self.checkpoints) > self.cache_size:
+            self.checkpoints.popitem(last=False)
+
+    def _store(self, checkpoint: IncrementalCheckpoint) -> None:
+        """Record an incremental checkpoint in memory and on disk."""
+        self._cache_put(checkpoint)
+
+        payload = codec.encode(checkpoint.to_dict())
+        with open(self._incremental_path(checkpoint.checkpoint_id), "wb") as f:
+            f.write(payload)
+            if config.system.checkpoint_fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _load_incremental(self, checkpoint_id: str) -> IncrementalCheckpoint:
+        """
+        Read an incremental checkpoint back from disk.
+
+        Args:
+            checkpoint_id: ID of the checkpoint to read
+
+        Returns:
+            The stored checkpoint
+
+        Raises:
+            ValueError: If the checkpoint doesn't exist
+        """
+        try:
+            with open(self._incremental_path(checkpoint_id), "rb") as f:
+                return IncrementalCheckpoint.from_dict(codec.decode(f.read()))
+        except FileNotFoundError:
+            raise ValueError(f"Checkpoint {checkpoint_id} not found") from None
+
     def _calculate_state_diff(
-        self, base_state: TravelPlanningState, current_state: TravelPlanningState
+        self, base_dict: dict[str, Any], current_dict: dict[str, Any]
     ) -> dict[str, Any]:
         """
-        Calculate the differences between two states.
+        Calculate the differences between two dumped states.
 
         Args:
-            base_state: Previous state
-            current_state: Current state
+            base_dict: model_dump() of the previous state
+            current_dict: model_dump() of the current state
 
         Returns:
             Dictionary of changes
         """
-        diff = {}
+        # Find changed/added fields. Plain equality is the cheapest check
+        # here: it runs in C and stops at the first difference, whereas
+        # hashing would have to encode every current field in full
+        return {
+            key: value
+            for key, value in current_dict.items()
+            if base_dict.get(key, _MISSING) != value
+        }
 
-        # Convert states to dictionaries for comparison
-        base_dict = base_state.model_dump()
-        current_dict = current_state.model_dump()
+    def _calculate_state_patch(
+        self, base_dict: dict[str, Any], current_dict: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        Calculate a path-level JSON Patch between two dumped states.
+
+        Unlike _calculate_state_diff, a small edit deep inside the plan only
+        records the changed value, not the whole plan.
+
+        Args:
+            base_dict: model_dump() of the previous state
+            current_dict: model_dump() of the current state
+
+        Returns:
+            Dictionary holding the patch operations under "ops"
+        """
+        # jsonpatch keys values by their JSON text when detecting moves; the
+        # codec handles the datetimes and enums a python-mode dump contains
+        patch = jsonpatch.JsonPatch.from_diff(
+            base_dict, current_dict, dumps=codec.dumps
+        )
+        return {"ops": patch.patch}
 
-        # Find changed/added fields
-        for key, value in current_dict.items():
-            if key not in base_dict or base_dict[key] != value:
-                diff[key] = value
+    def _apply_state_patch(
+        self, base_state: TravelPlanningState, patch: dict[str, Any]
+    ) -> TravelPlanningState:
+        """
+        Apply a patch from _calculate_state_patch to a base state.
 
-        return diff
+        Args:
+            base_state: Base state to apply changes to
+            patch: Dictionary holding the patch operations under "ops"
+
+        Returns:
+            Updated state
+        """
+        if jsonpatch is None:
+            raise ValueError(
+                "JSON Patch checkpoint found but jsonpatch is not installed"
+            )
+        ops = patch["ops"]
+        # Patch a fresh dump in place, then revalidate only the top-level
+        # fields the operations touched
+        patched = jsonpatch.apply_patch(base_state.model_dump(), ops, in_place=True)
+        touched = {
+            path.split("/", 2)[1]
+            for op in ops
+            for path in (op["path"], op.get("from"))
+            if path
+        }
+        return self._apply_state_diff(
+            base_state, {key: patched[key] for key in touched if key in patched}
+        )
 
     def _apply_state_diff(
         self, base_state: TravelPlanningState, diff: dict[str, Any]
@@ -230,13 +474,16 @@ class IncrementalCheckpointManager:
         Returns:
             Updated state
         """
-        # Create a copy of the base state
-        updated_state = base_state.model_copy(deep=True)
+        # Diffs only rebind top-level fields, so a shallow copy is enough to
+        # leave the base state untouched
+        updated_state = base_state.model_copy()
 
-        # Apply changes
+        # Validate just the changed fields: diffs hold dumped (or, once read
+        # from disk, JSON-decoded) values that must become models again
+        validate_field = TravelPlanningState.__pydantic_validator__.validate_assignment
         for key, value in diff.items():
-            if hasattr(updated_state, key):
-                setattr(updated_state, key, value)
+            if key in TravelPlanningState.model_fields:
+                validate_field(updated_state, key, value)
 
         return updated_state
 
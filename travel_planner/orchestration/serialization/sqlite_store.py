@@ -0,0 +1,183 @@
+"""
+SQLite-backed checkpoint storage for the travel planner workflow.
+
+This module provides a checkpoint manager that keeps every checkpoint in a
+single SQLite database in WAL mode instead of one file per checkpoint, so
+lookups by ID and listings by stage and time are served by indexes.
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Any
+
+from travel_planner.config import config
+from travel_planner.orchestration.serialization import codec
+from travel_planner.orchestration.serialization.checkpoint import (
+    DEFAULT_CACHE_SIZE,
+    CheckpointManager,
+)
+from travel_planner.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Database file created inside the checkpoint directory
+DB_FILENAME = "checkpoints.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ckpt (
+    id TEXT PRIMARY KEY,
+    ts TEXT,
+    stage TEXT,
+    plan_id TEXT,
+    destination TEXT,
+    error TEXT,
+    blob BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_ts ON ckpt (ts DESC);
+CREATE INDEX IF NOT EXISTS ix_stage_ts ON ckpt (stage, ts DESC);
+"""
+
+# Columns list_checkpoints reports, in the keys the file backend uses
+_INFO_COLUMNS = {
+    "id": "checkpoint_id",
+    "ts": "timestamp",
+    "stage": "workflow_stage",
+    "plan_id": "plan_id",
+    "destination": "destination",
+    "error": "error",
+}
+
+
+class SQLiteCheckpointManager(CheckpointManager):
+    """
+    Checkpoint manager storing checkpoints in a SQLite database.
+
+    Caching, background and deferred saves behave as in CheckpointManager;
+    only the storage layer differs. Checkpoint payloads are stored in the
+    codec's encoded form.
+    """
+
+    def __init__(
+        self,
+        checkpoint_dir: str | None = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        db_filename: str = DB_FILENAME,
+    ):
+        """
+        Initialize the SQLite checkpoint manager.
+
+        Args:
+            checkpoint_dir: Directory holding the database (optional)
+            cache_size: Maximum number of checkpoints kept in memory
+            db_filename: Name of the database file within checkpoint_dir
+        """
+        super().__init__(checkpoint_dir=checkpoint_dir, cache_size=cache_size)
+        self.db_path = os.path.join(self.checkpoint_dir, db_filename)
+
+        # One connection shared by the workflow and the writer thread
+        self._db_lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # WAL with NORMAL survives application crashes; FULL also survives
+        # power loss, matching what fsyncing checkpoint files guarantees
+        synchronous = "FULL" if config.system.checkpoint_fsync else "NORMAL"
+        self._conn.execute(f"PRAGMA synchronous={synchronous}")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._db_lock:
+            self._conn.close()
+
+    def _write_checkpoint(
+        self, checkpoint_id: str, checkpoint_data: dict[str, Any]
+    ) -> None:
+        """Persist checkpoint data to the database."""
+        info = self._checkpoint_info(checkpoint_data)
+        blob = codec.encode(checkpoint_data)
+        with self._db_lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ckpt "
+                "(id, ts, stage, plan_id, destination, error, blob) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    checkpoint_id,
+                    info["timestamp"],
+                    info["workflow_stage"],
+                    info["plan_id"],
+                    info["destination"],
+                    info["error"],
+                    blob,
+                ),
+            )
+
+    def _read_checkpoint(self, checkpoint_id: str) -> dict[str, Any] | None:
+        """Read checkpoint data from the database, or None if it is absent."""
+        with self._db_lock:
+            row = self._conn.execute(
+                "SELECT blob FROM ckpt WHERE id = ?", (checkpoint_id,)
+            ).fetchone()
+        return codec.decode(row[0]) if row else None
+
+    def _remove_checkpoint(self, checkpoint_id: str) -> bool:
+        """Delete a checkpoint row, returning whether it existed."""
+        with self._db_lock:
+            cursor = self._conn.execute(
+                "DELETE FROM ckpt WHERE id = ?", (checkpoint_id,)
+            )
+        return cursor.rowcount > 0
+
+    def list_checkpoints(
+        self, stage: str | None = None, limit: int = 10
+    ) -> list[dict[str, Any]]:
+        """
+        List available checkpoints with optional filtering.
+
+        Args:
+            stage: Filter by workflow stage (optional)
+            limit: Maximum number of checkpoints to return
+
+        Returns:
+            List of checkpoint metadata dictionaries, newest first
+        """
+        columns = ", ".join(_INFO_COLUMNS)
+        query = f"SELECT {columns} FROM ckpt"
+        params: tuple[Any, ...] = ()
+        if stage:
+            query += " WHERE stage = ?"
+            params = (stage,)
+        query += " ORDER BY ts DESC LIMIT ?"
+
+        with self._db_lock:
+            rows = self._conn.execute(query, (*params, limit)).fetchall()
+        return [dict(zip(_INFO_COLUMNS.values(), row, strict=True)) for row in rows]
+
+    def cleanup_old_checkpoints(self, max_age_days: int = 7) -> int:
+        """
+        Clean up old checkpoints.
+
+        Args:
+            max_age_days: Maximum age of checkpoints to keep (in days)
+
+        Returns:
+            Number of checkpoints deleted
+        """
+        # Same cutoff as the file backend: at least a whole day past the limit
+        cutoff = (datetime.now() - timedelta(days=max_age_days + 1)).isoformat()
+        with self._db_lock:
+            deleted_ids = [
+                row[0]
+                for row in self._conn.execute(
+                    "DELETE FROM ckpt WHERE ts <= ? RETURNING id", (cutoff,)
+                )
+            ]
+
+        for checkpoint_id in deleted_ids:
+            self._cache_drop(checkpoint_id)
+
+        logger.info(f"Cleaned up {len(deleted_ids)} old checkpoints")
+        return len(deleted_ids)
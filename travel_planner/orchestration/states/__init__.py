@@ -5,7 +5,18 @@ This package contains the state models used by the travel planning workflow,
 including the main TravelPlanningState and WorkflowStage enum.
 """
 
-from travel_planner.orchestration.states.planning_state import TravelPlanningState
+from travel_planner.orchestration.states.planning_state import (
+    Msg,
+    ReadOnlyStateView,
+    StateTransaction,
+    TravelPlanningState,
+)
 from travel_planner.orchestration.states.workflow_stages import WorkflowStage
 
-__all__ = ["TravelPlanningState", "WorkflowStage"]
+__all__ = [
+    "Msg",
+    "ReadOnlyStateView",
+    "StateTransaction",
+    "TravelPlanningState",
+    "WorkflowStage",
+]
@@ -6,14 +6,213 @@ complete state of a travel planning workflow, including progress tracking,
 error handling, and checkpointing capabilities.
 """
 
-import uuid
+import hashlib
+import json
+import secrets
+import time
+from collections import deque
 from datetime import datetime
-from typing import Any
+from types import TracebackType
+from typing import Annotated, Any, Final, NamedTuple, cast
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, field_serializer, field_validator
+from pydantic_core import to_jsonable_python
 
 from travel_planner.data.models import TravelPlan, TravelQuery, UserPreferences
-from travel_planner.orchestration.states.workflow_stages import WorkflowStage
+from travel_planner.orchestration.states.workflow_stages import (
+    STAGE_VALUES,
+    WorkflowStage,
+)
+
+# Upper bound on retained conversation messages; older entries are dropped
+MAX_CONVERSATION_HISTORY = 500
+
+# Overall progress reached on entering each stage; other stages keep the
+# current progress
+_STAGE_WEIGHTS: Final[dict[WorkflowStage, float]] = {
+    WorkflowStage.START: 0.0,
+    WorkflowStage.QUERY_ANALYZED: 0.1,
+    WorkflowStage.DESTINATION_RESEARCHED: 0.2,
+    WorkflowStage.FLIGHTS_SEARCHED: 0.4,
+    WorkflowStage.ACCOMMODATION_SEARCHED: 0.5,
+    WorkflowStage.TRANSPORTATION_PLANNED: 0.6,
+    WorkflowStage.ACTIVITIES_PLANNED: 0.8,
+    WorkflowStage.BUDGET_MANAGED: 0.9,
+    WorkflowStage.COMPLETE: 1.0,
+    # Equivalent to completing several stages at once
+    WorkflowStage.PARALLEL_SEARCH_COMPLETED: 0.6,
+}
+
+# Containers most workflows never write; they stay None until first used and
+# are checkpointed as empty containers
+_LAZY_DICT_FIELDS: Final = ("retry_count", "stage_progress", "task_results")
+_LAZY_LIST_FIELDS: Final = ("parallel_tasks", "completed_tasks", "human_feedback")
+
+
+class Msg(NamedTuple):
+    """Compact record for a single conversation history entry."""
+
+    role: str
+    content: str
+
+
+def new_checkpoint_id() -> str:
+    """
+    Generate a checkpoint ID that sorts by creation time.
+
+    Returns:
+        ID of the form checkpoint_YYYYMMDDHHMMSS_<32 random hex digits>
+    """
+    return f"checkpoint_{datetime.now():%Y%m%d%H%M%S}_{secrets.token_hex(16)}"
+
+
+# Second last formatted by _iso_now and its "YYYY-MM-DDTHH:MM:SS" prefix
+_iso_second_cache: tuple[int, str] = (-1, "")
+
+
+def _iso_now() -> str:
+    """
+    Get the current local time as an ISO 8601 string with microseconds.
+
+    Task results and feedback often arrive in bursts within the same second,
+    so the date and time-of-day prefix is formatted once per second and only
+    the microseconds are formatted per call.
+
+    Returns:
+        Timestamp of the form YYYY-MM-DDTHH:MM:SS.ffffff
+    """
+    global _iso_second_cache  # noqa: PLW0603
+    second, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _iso_second_cache
+    if second != cached_second:
+        prefix = datetime.fromtimestamp(second).isoformat()
+        _iso_second_cache = (second, prefix)
+    return f"{prefix}.{nanos // 1_000:06d}"
+
+
+def _to_epoch_ns(value: int | datetime | str) -> int:
+    """
+    Convert a workflow time to nanoseconds since the epoch.
+
+    Args:
+        value: Epoch nanoseconds, or a datetime or ISO string as written by
+            checkpoints from before times were stored as integers
+
+    Returns:
+        Nanoseconds since the epoch
+    """
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if isinstance(value, datetime):
+        return round(value.timestamp() * 1_000_000) * 1_000
+    return value
+
+
+def _stage_key(key: str) -> str:
+    """
+    Normalize a stage_times key to the stage value.
+
+    Args:
+        key: Stage value, or "WorkflowStage.NAME" as older checkpoints wrote
+
+    Returns:
+        The stage value
+    """
+    if key.startswith("WorkflowStage."):
+        return WorkflowStage[key.removeprefix("WorkflowStage.")].value
+    return key
+
+
+def merge_branch_results(
+    current: dict[str, Any], update: dict[str, Any]
+) -> dict[str, Any]:
+    """
+    Reducer for branch results written concurrently by parallel graph branches.
+
+    Args:
+        current: Results already recorded in the state
+        update: Partial results returned by a branch
+
+    Returns:
+        Merged results, with the update taking precedence per task
+    """
+    return {**current, **update}
+
+
+class ReadOnlyStateView:
+    """
+    Read-only proxy over a planning state handed to parallel branch agents.
+
+    Attribute reads are forwarded to the wrapped state; assignments raise, so
+    a branch can only contribute through the delta it returns.
+    """
+
+    __slots__ = ("_state",)
+
+    def __init__(self, state: "TravelPlanningState"):
+        object.__setattr__(self, "_state", state)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._state, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"Cannot set {name!r} on a read-only state view")
+
+
+class StateTransaction:
+    """
+    Buffer stage, history and task-result updates for a single commit.
+
+    Updates queued inside a ``with state.transaction()`` block are applied
+    together when the block exits cleanly and discarded if it raises, so a
+    failing node never leaves a half-applied completion behind.
+    """
+
+    def __init__(self, state: "TravelPlanningState"):
+        """
+        Initialize a transaction against a planning state.
+
+        Args:
+            state: The state the buffered updates will be applied to
+        """
+        self.state = state
+        self._stage: WorkflowStage | None = None
+        self._messages: list[Msg] = []
+        self._task_results: list[tuple[str, dict[str, Any], str | None]] = []
+
+    def __enter__(self) -> "StateTransaction":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.commit()
+
+    def update_stage(self, new_stage: WorkflowStage) -> None:
+        """Queue a workflow stage change."""
+        self._stage = new_stage
+
+    def append_message(self, message: Msg) -> None:
+        """Queue a conversation history entry."""
+        self._messages.append(message)
+
+    def add_task_result(
+        self, task_name: str, result: dict[str, Any], error: str | None = None
+    ) -> None:
+        """Queue a task result."""
+        self._task_results.append((task_name, result, error))
+
+    def commit(self) -> None:
+        """Apply all queued updates to the state."""
+        if self._stage is not None:
+            self.state.update_stage(self._stage)
+        self.state.conversation_history.extend(self._messages)
+        for task_name, result, error in self._task_results:
+            self.state.add_task_result(task_name, result, error)
 
 
 class TravelPlanningState(BaseModel):
@@ -31,75 +230,160 @@ class TravelPlanningState(BaseModel):
     plan: TravelPlan | None = None
 
     # Conversation and history tracking
-    conversation_history: list[dict[str, Any]] = Field(default_factory=list)
+    conversation_history: deque[Msg] = Field(
+        default_factory=lambda: deque(maxlen=MAX_CONVERSATION_HISTORY)
+    )
 
     # Workflow state management
     current_stage: WorkflowStage = WorkflowStage.START
     previous_stage: WorkflowStage | None = None
-    start_time: datetime | None = None
-    last_update_time: datetime | None = None
-    stage_times: dict[str, datetime] = Field(default_factory=dict)
+    # Nanoseconds since the epoch, from time.time_ns()
+    start_time: int | None = None
+    last_update_time: int | None = None
+    stage_times: dict[str, int] = Field(default_factory=dict)
 
     # Error handling and recovery
     error: str | None = None
     error_count: int = 0
-    retry_count: dict[str, int] = Field(default_factory=dict)
+    retry_count: dict[str, int] | None = None
+    # Set once a task has exhausted its retries; remaining nodes are skipped
+    terminal_failure: bool = False
 
     # Interruption handling
     interrupted: bool = False
     interruption_reason: str | None = None
     state_checkpoint_id: str | None = None
+    # Fingerprint of the data captured by the last checkpoint
+    state_checkpoint_hash: str | None = None
 
     # Progress tracking
     progress: float = 0.0  # 0.0 to 1.0
-    stage_progress: dict[str, float] = Field(default_factory=dict)
+    stage_progress: dict[str, float] | None = None
 
     # Parallel execution tracking
-    parallel_tasks: list[str] = Field(default_factory=list)
-    completed_tasks: list[str] = Field(default_factory=list)
-    task_results: dict[str, dict[str, Any]] = Field(default_factory=dict)
+    parallel_tasks: list[str] | None = None
+    completed_tasks: list[str] | None = None
+    task_results: dict[str, dict[str, Any]] | None = None
+    # The completed_tasks list last indexed and its membership set, rebuilt
+    # on demand once the list is replaced or loaded
+    _completed_task_index: tuple[list[str], set[str]] | None = PrivateAttr(default=None)
+    # ParallelResult deltas keyed by task, merged by the graph reducer
+    branch_results: Annotated[dict[str, Any], merge_branch_results] = Field(
+        default_factory=dict
+    )
 
     # Human feedback and guidance
-    human_feedback: list[dict[str, Any]] = Field(default_factory=list)
+    human_feedback: list[dict[str, Any]] | None = None
     guidance_requested: bool = False
 
+    # Ask the orchestrator for a narrative summary of the final plan
+    generate_summary: bool = False
+
     def __init__(self, **data):
         """Initialize the travel planning state with timing information."""
         super().__init__(**data)
-        current_time = datetime.now()
-        if self.start_time is None:
-            self.start_time = current_time
+        # States rebuilt from existing data, as the graph does between nodes,
+        # keep the times they were given
+        if self.start_time is not None:
+            return
+        current_time = time.time_ns()
+        self.start_time = current_time
         self.last_update_time = current_time
-        self.stage_times[str(self.current_stage)] = current_time
+        self.stage_times[STAGE_VALUES[self.current_stage]] = current_time
+
+    @field_validator("start_time", "last_update_time", mode="before")
+    @classmethod
+    def _coerce_time(cls, value: int | datetime | str | None) -> int | None:
+        """Accept the datetimes and ISO strings older checkpoints hold."""
+        return None if value is None else _to_epoch_ns(value)
+
+    @field_validator("stage_times", mode="before")
+    @classmethod
+    def _coerce_stage_times(
+        cls, stage_times: dict[str, int | datetime | str | None]
+    ) -> dict[str, int]:
+        """Accept the keys, datetimes and ISO strings older checkpoints hold."""
+        return {
+            _stage_key(stage): _to_epoch_ns(value)
+            for stage, value in stage_times.items()
+            if value is not None
+        }
+
+    @field_validator("conversation_history")
+    @classmethod
+    def _bound_conversation_history(cls, history: deque[Msg]) -> deque[Msg]:
+        """Ensure the history is a ring buffer regardless of the input type."""
+        if history.maxlen == MAX_CONVERSATION_HISTORY:
+            return history
+        return deque(history, maxlen=MAX_CONVERSATION_HISTORY)
+
+    @field_serializer("conversation_history")
+    def _serialize_conversation_history(
+        self, history: deque[Msg]
+    ) -> list[dict[str, str]]:
+        """Export the history as plain dicts so checkpoints stay JSON-friendly."""
+        # Every model_dump walks the whole history, so build the dicts with a
+        # literal: NamedTuple._asdict is several times slower per message
+        return [{"role": role, "content": content} for role, content in history]
+
+    @field_serializer("branch_results")
+    def _serialize_branch_results(
+        self, branch_results: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Dump branch result records to JSON-compatible dicts."""
+        return cast(dict[str, Any], to_jsonable_python(branch_results))
+
+    def history_to_dicts(self) -> list[dict[str, str]]:
+        """
+        Convert the conversation history into a list of role/content dicts.
+
+        Returns:
+            List of message dictionaries in chronological order
+        """
+        return self._serialize_conversation_history(self.conversation_history)
+
+    def read_only(self) -> ReadOnlyStateView:
+        """
+        Get a view of the state that rejects attribute assignment.
+
+        Returns:
+            Read-only proxy over this state
+        """
+        return ReadOnlyStateView(self)
+
+    def transaction(self) -> StateTransaction:
+        """
+        Start a transaction that applies queued updates together on exit.
+
+        Returns:
+            Context manager buffering stage, history and task-result updates
+        """
+        return StateTransaction(self)
 
     def update_stage(self, new_stage: WorkflowStage) -> None:
         """
         Update the current stage and related timing information.
 
+        Args:
+            new_stage: The new workflow stage
+        """
+        self._transition_to(new_stage)
+
+        # Update progress based on stage
+        self.progress = _STAGE_WEIGHTS.get(new_stage, self.progress)
+
+    def _transition_to(self, new_stage: WorkflowStage) -> None:
+        """
+        Move to a stage, recording the stage left and the transition time.
+
         Args:
             new_stage: The new workflow stage
         """
         self.previous_stage = self.current_stage
         self.current_stage = new_stage
-        current_time = datetime.now()
+        current_time = time.time_ns()
         self.last_update_time = current_time
-        self.stage_times[str(new_stage)] = current_time
-
-        # Update progress based on stage
-        stage_weights = {
-            WorkflowStage.START: 0.0,
-            WorkflowStage.QUERY_ANALYZED: 0.1,
-            WorkflowStage.DESTINATION_RESEARCHED: 0.2,
-            WorkflowStage.FLIGHTS_SEARCHED: 0.4,
-            WorkflowStage.ACCOMMODATION_SEARCHED: 0.5,
-            WorkflowStage.TRANSPORTATION_PLANNED: 0.6,
-            WorkflowStage.ACTIVITIES_PLANNED: 0.8,
-            WorkflowStage.BUDGET_MANAGED: 0.9,
-            WorkflowStage.COMPLETE: 1.0,
-            # Equivalent to completing several stages at once
-            WorkflowStage.PARALLEL_SEARCH_COMPLETED: 0.6,
-        }
-        self.progress = stage_weights.get(new_stage, self.progress)
+        self.stage_times[STAGE_VALUES[new_stage]] = current_time
 
     def mark_interrupted(self, reason: str) -> None:
         """
@@ -110,11 +394,10 @@ class TravelPlanningState(BaseModel):
         """
         self.interrupted = True
         self.interruption_reason = reason
-        previous_stage = self.current_stage
-        self.update_stage(WorkflowStage.INTERRUPTED)
-        # Preserve the actual stage we were interrupted at
-        self.previous_stage = previous_stage
-        self.state_checkpoint_id = f"checkpoint_{uuid.uuid4().hex}"
+        # previous_stage keeps the stage we were interrupted at; progress
+        # does not change
+        self._transition_to(WorkflowStage.INTERRUPTED)
+        self.state_checkpoint_id = new_checkpoint_id()
 
     def mark_error(self, error_message: str) -> None:
         """
@@ -125,10 +408,9 @@ class TravelPlanningState(BaseModel):
         """
         self.error = error_message
         self.error_count += 1
-        previous_stage = self.current_stage
-        self.update_stage(WorkflowStage.ERROR)
-        # Preserve the stage where the error occurred
-        self.previous_stage = previous_stage
+        # previous_stage keeps the stage where the error occurred; progress
+        # does not change
+        self._transition_to(WorkflowStage.ERROR)
 
     def add_human_feedback(self, feedback: dict[str, Any]) -> None:
         """
@@ -137,13 +419,14 @@ class TravelPlanningState(BaseModel):
         Args:
             feedback: Dictionary with feedback information
         """
-        feedback["timestamp"] = datetime.now().isoformat()
+        feedback["timestamp"] = _iso_now()
+        if self.human_feedback is None:
+            self.human_feedback = []
         self.human_feedback.append(feedback)
 
-        # Add feedback to conversation history for context
-        self.conversation_history.append(
-            {"role": "human", "content": feedback.get("content", ""), "feedback": True}
-        )
+        # Add feedback to conversation history for context; only feedback is
+        # recorded with the "human" role, so it needs no separate marker
+        self.conversation_history.append(Msg("human", feedback.get("content", "")))
 
     def add_task_result(
         self, task_name: str, result: dict[str, Any], error: str | None = None
@@ -156,13 +439,30 @@ class TravelPlanningState(BaseModel):
             result: Result data from the task
             error: Optional error information
         """
+        if self.task_results is None:
+            self.task_results = {}
+        if self.completed_tasks is None:
+            self.completed_tasks = []
         self.task_results[task_name] = {
             "result": result,
             "error": error,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _iso_now(),
         }
 
-        if task_name not in self.completed_tasks:
+        # Rebuild the index if completed_tasks was reassigned (as
+        # from_checkpoint and resumed updates do) or appended to elsewhere;
+        # the list has no duplicates, so a size mismatch reveals the latter
+        index = self._completed_task_index
+        if (
+            index is None
+            or index[0] is not self.completed_tasks
+            or len(index[1]) != len(self.completed_tasks)
+        ):
+            index = (self.completed_tasks, set(self.completed_tasks))
+            self._completed_task_index = index
+        completed = index[1]
+        if task_name not in completed:
+            completed.add(task_name)
             self.completed_tasks.append(task_name)
 
     def should_retry(self, stage: str, max_retries: int = 3) -> bool:
@@ -176,12 +476,31 @@ class TravelPlanningState(BaseModel):
         Returns:
             True if a retry should be attempted, False otherwise
         """
+        if self.retry_count is None:
+            self.retry_count = {}
         current_retries = self.retry_count.get(stage, 0)
         if current_retries < max_retries:
             self.retry_count[stage] = current_retries + 1
             return True
         return False
 
+    def checkpoint_hash(self) -> str:
+        """
+        Compute a fingerprint of the checkpoint-relevant parts of the state.
+
+        Returns:
+            SHA-256 hex digest of the canonical JSON of plan, query and stage
+        """
+        payload = to_jsonable_python(
+            {
+                "plan": self.plan,
+                "query": self.query,
+                "current_stage": self.current_stage,
+            }
+        )
+        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
     def create_checkpoint(self) -> dict[str, Any]:
         """
         Create a serializable checkpoint of the current state.
@@ -193,27 +512,99 @@ class TravelPlanningState(BaseModel):
 
         # Generate a unique checkpoint ID if not already set
         if not self.state_checkpoint_id:
-            self.state_checkpoint_id = f"checkpoint_{uuid.uuid4().hex}"
+            self.state_checkpoint_id = new_checkpoint_id()
 
         checkpoint_data["state_checkpoint_id"] = self.state_checkpoint_id
         # Also store as "checkpoint_id" for serialization compatibility
         checkpoint_data["checkpoint_id"] = self.state_checkpoint_id
-        checkpoint_data["checkpoint_time"] = datetime.now().isoformat()
+        checkpoint_data["checkpoint_time"] = _iso_now()
 
-        # Convert datetime objects to ISO format strings for serialization
-        if self.start_time:
-            checkpoint_data["start_time"] = self.start_time.isoformat()
+        for key in _LAZY_DICT_FIELDS:
+            if checkpoint_data[key] is None:
+                checkpoint_data[key] = {}
+        for key in _LAZY_LIST_FIELDS:
+            if checkpoint_data[key] is None:
+                checkpoint_data[key] = []
 
-        if self.last_update_time:
-            checkpoint_data["last_update_time"] = self.last_update_time.isoformat()
+        return checkpoint_data
 
-        # Convert stage_times datetime objects to strings
-        if self.stage_times:
-            checkpoint_data["stage_times"] = {
-                k: v.isoformat() if v else None for k, v in self.stage_times.items()
-            }
+    @classmethod
+    def from_checkpoint_data(
+        cls, checkpoint_data: dict[str, Any]
+    ) -> "TravelPlanningState":
+        """
+        Rebuild a state from create_checkpoint output without revalidating it.
 
-        return checkpoint_data
+        Checkpoints are written by this process, so only the nested models
+        are validated (which also builds them from their dumps); every other
+        field is converted directly and the state is assembled with
+        model_construct. That also skips __init__, keeping the saved times.
+
+        Args:
+            checkpoint_data: Checkpoint data, as saved or decoded from disk;
+                it is not modified, and the state shares no containers with it
+
+        Returns:
+            Reconstructed state
+        """
+        # Branch results are in-flight deltas of a parallel step and are left
+        # for the graph reducer to fill, rather than restored as plain dicts
+        fields = {
+            key: value
+            for key, value in checkpoint_data.items()
+            if key in cls.model_fields and key != "branch_results"
+        }
+
+        for key, model in (
+            ("query", TravelQuery),
+            ("preferences", UserPreferences),
+            ("plan", TravelPlan),
+        ):
+            if fields.get(key):
+                fields[key] = model.model_validate(fields[key])
+
+        # Stages are stored as their values; times are epoch integers, or
+        # ISO strings in older checkpoints, which also keyed stage_times by
+        # str(stage)
+        fields["current_stage"] = WorkflowStage(
+            fields.get("current_stage") or WorkflowStage.START
+        )
+        if fields.get("previous_stage"):
+            fields["previous_stage"] = WorkflowStage(fields["previous_stage"])
+        for key in ("start_time", "last_update_time"):
+            if fields.get(key):
+                fields[key] = _to_epoch_ns(fields[key])
+        fields["stage_times"] = {
+            _stage_key(stage): _to_epoch_ns(value)
+            for stage, value in (fields.get("stage_times") or {}).items()
+            if value
+        }
+
+        # model_construct keeps the objects it is given, and the checkpoint
+        # manager caches checkpoint dicts, so copy the containers (and the
+        # dicts inside them) that validation would have copied
+        for key in _LAZY_DICT_FIELDS:
+            if fields.get(key) is not None:
+                fields[key] = {
+                    k: dict(v) if isinstance(v, dict) else v
+                    for k, v in fields[key].items()
+                }
+        for key in _LAZY_LIST_FIELDS:
+            if fields.get(key) is not None:
+                fields[key] = [
+                    dict(v) if isinstance(v, dict) else v for v in fields[key]
+                ]
+
+        # model_construct skips the ring-buffer validator, so build it here
+        fields["conversation_history"] = deque(
+            (
+                msg if isinstance(msg, Msg) else Msg(msg["role"], msg["content"])
+                for msg in fields.get("conversation_history") or ()
+            ),
+            maxlen=MAX_CONVERSATION_HISTORY,
+        )
+
+        return cls.model_construct(**fields)
 
     def from_checkpoint(self, checkpoint_data: dict[str, Any]) -> None:
         """
@@ -222,37 +613,10 @@ class TravelPlanningState(BaseModel):
         Args:
             checkpoint_data: Checkpoint data to load
         """
-        # Handle special fields first
-
-        # Convert stage strings to enums
-        current_stage_str = checkpoint_data.get("current_stage", "start")
-        checkpoint_data["current_stage"] = (
-            WorkflowStage(current_stage_str)
-            if current_stage_str
-            else WorkflowStage.START
-        )
+        restored = self.from_checkpoint_data(checkpoint_data)
+        for key in type(self).model_fields:
+            setattr(self, key, getattr(restored, key))
+
 
-        previous_stage_str = checkpoint_data.get("previous_stage")
-        if previous_stage_str:
-            checkpoint_data["previous_stage"] = WorkflowStage(previous_stage_str)
-
-        # Convert ISO timestamp strings back to datetime objects
-        start_time_str = checkpoint_data.get("start_time")
-        if start_time_str:
-            self.start_time = datetime.fromisoformat(start_time_str)
-
-        last_update_time_str = checkpoint_data.get("last_update_time")
-        if last_update_time_str:
-            self.last_update_time = datetime.fromisoformat(last_update_time_str)
-
-        # Convert stage_times strings back to datetime objects
-        stage_times_data = checkpoint_data.get("stage_times", {})
-        for stage, time_str in stage_times_data.items():
-            if time_str:
-                self.stage_times[stage] = datetime.fromisoformat(time_str)
-
-        # Now update all the basic attributes
-        excluded_fields = ["start_time", "last_update_time", "stage_times"]
-        for key, value in checkpoint_data.items():
-            if key not in excluded_fields and hasattr(self, key):
-                setattr(self, key, value)
+# Names updates may set on a state, computed once instead of probing with hasattr
+STATE_FIELDS: Final[frozenset[str]] = frozenset(TravelPlanningState.model_fields)
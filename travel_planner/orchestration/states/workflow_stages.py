@@ -26,18 +26,6 @@ class WorkflowStage(str, Enum):
     PARALLEL_SEARCH_COMPLETED = "parallel_search_completed"
 
 
-# Create string constants for the workflow stages
-# This allows importing just the strings without the enum
-# to avoid circular imports
-START = WorkflowStage.START.value
-QUERY_ANALYZED = WorkflowStage.QUERY_ANALYZED.value
-DESTINATION_RESEARCHED = WorkflowStage.DESTINATION_RESEARCHED.value
-FLIGHTS_SEARCHED = WorkflowStage.FLIGHTS_SEARCHED.value
-ACCOMMODATION_SEARCHED = WorkflowStage.ACCOMMODATION_SEARCHED.value
-TRANSPORTATION_PLANNED = WorkflowStage.TRANSPORTATION_PLANNED.value
-ACTIVITIES_PLANNED = WorkflowStage.ACTIVITIES_PLANNED.value
-BUDGET_MANAGED = WorkflowStage.BUDGET_MANAGED.value
-COMPLETE = WorkflowStage.COMPLETE.value
-ERROR = WorkflowStage.ERROR.value
-INTERRUPTED = WorkflowStage.INTERRUPTED.value
-PARALLEL_SEARCH_COMPLETED = WorkflowStage.PARALLEL_SEARCH_COMPLETED.value
+# Stage values keyed by member, for hot paths that would otherwise go through
+# the enum's value descriptor
+STAGE_VALUES: dict[WorkflowStage, str] = {stage: stage.value for stage in WorkflowStage}
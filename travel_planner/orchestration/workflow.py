@@ -5,9 +5,8 @@ This module implements the high-level workflow orchestration for the travel plan
 integrating the LangGraph state graph with agent interactions and event handling.
 """
 
-import traceback
-from datetime import datetime
-from typing import Any, cast
+import time
+from typing import Any
 
 from langgraph.errors import GraphInterrupt, GraphRecursionError
 
@@ -15,11 +14,18 @@ from travel_planner.data.models import TravelPlan, TravelQuery, UserPreferences
 from travel_planner.orchestration.core.agent_registry import register_default_agents
 from travel_planner.orchestration.core.graph_builder import create_planning_graph
 from travel_planner.orchestration.serialization.checkpoint import save_state_checkpoint
-from travel_planner.orchestration.states.planning_state import TravelPlanningState
+from travel_planner.orchestration.states.planning_state import (
+    STATE_FIELDS,
+    Msg,
+    TravelPlanningState,
+)
 from travel_planner.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Second-resolution local ISO 8601 format for plan metadata timestamps
+_ISO_SECONDS = "%Y-%m-%dT%H:%M:%S"
+
 
 class TravelWorkflow:
     """
@@ -62,7 +68,7 @@ class TravelWorkflow:
         initial_state = TravelPlanningState(
             query=TravelQuery(raw_query=query),
             preferences=preferences or UserPreferences(),
-            conversation_history=[{"role": "user", "content": query}],
+            conversation_history=[Msg("user", query)],
         )
 
         # Execute the graph with the initial state
@@ -75,13 +81,13 @@ class TravelWorkflow:
             logger.error(f"Validation error in workflow: {e!s}")
             initial_state.error = f"Validation error: {e!s}"
             initial_state.conversation_history.append(
-                {
-                    "role": "system",
-                    "content": (
+                Msg(
+                    "system",
+                    (
                         f"Error: The travel query couldn't be processed due to "
                         f"validation issues. {e!s}"
                     ),
-                }
+                )
             )
             return self._create_error_plan(e, "validation_error")
         except GraphInterrupt as e:
@@ -95,8 +101,7 @@ class TravelWorkflow:
             return self._create_error_plan(e, "graph_error")
         except Exception as e:
             # Handle any other unexpected errors
-            logger.error(f"Unexpected error in travel planning workflow: {e!s}")
-            logger.error(traceback.format_exc())
+            logger.exception(f"Unexpected error in travel planning workflow: {e!s}")
             initial_state.error = f"Unexpected error: {e!s}"
             return self._create_error_plan(e, "unexpected_error")
 
@@ -119,7 +124,7 @@ class TravelWorkflow:
         initial_state = TravelPlanningState(
             query=TravelQuery(raw_query=query),
             preferences=preferences or UserPreferences(),
-            conversation_history=[{"role": "user", "content": query}],
+            conversation_history=[Msg("user", query)],
         )
 
         # Execute the graph with the initial state
@@ -132,13 +137,13 @@ class TravelWorkflow:
             logger.error(f"Validation error in async workflow: {e!s}")
             initial_state.error = f"Validation error: {e!s}"
             initial_state.conversation_history.append(
-                {
-                    "role": "system",
-                    "content": (
+                Msg(
+                    "system",
+                    (
                         f"Error: The travel query couldn't be processed due to "
                         f"validation issues. {e!s}"
                     ),
-                }
+                )
             )
             return self._create_error_plan(e, "validation_error")
         except GraphInterrupt as e:
@@ -152,8 +157,9 @@ class TravelWorkflow:
             return self._create_error_plan(e, "graph_error")
         except Exception as e:
             # Handle any other unexpected errors
-            logger.error(f"Unexpected error in async travel planning workflow: {e!s}")
-            logger.error(traceback.format_exc())
+            logger.exception(
+                f"Unexpected error in async travel planning workflow: {e!s}"
+            )
             initial_state.error = f"Unexpected error: {e!s}"
             return self._create_error_plan(e, "unexpected_error")
 
@@ -173,11 +179,11 @@ class TravelWorkflow:
 
         try:
             # Execute the graph with initial state
-            result = self.graph.invoke(initial_state)
+            result: TravelPlanningState = self.graph.invoke(initial_state)
 
             # Return the final state from the result
             logger.info("Workflow execution completed successfully")
-            return cast(TravelPlanningState, result)
+            return result
 
         except Exception as e:
             logger.error(f"Error executing graph: {e!s}")
@@ -203,11 +209,11 @@ class TravelWorkflow:
 
         try:
             # Execute the graph asynchronously with initial state
-            result = await self.graph.ainvoke(initial_state)
+            result: TravelPlanningState = await self.graph.ainvoke(initial_state)
 
             # Return the final state from the result
             logger.info("Async workflow execution completed successfully")
-            return cast(TravelPlanningState, result)
+            return result
 
         except Exception as e:
             logger.error(f"Error executing async graph: {e!s}")
@@ -228,7 +234,7 @@ class TravelWorkflow:
         error_plan.metadata = {
             "error": str(error),
             "error_type": error_type,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.strftime(_ISO_SECONDS),
             "status": "failed",
         }
         error_plan.alerts = [f"Error: {error!s}"]
@@ -251,25 +257,23 @@ class TravelWorkflow:
         partial_plan = state.plan or TravelPlan()
 
         # Add interruption metadata
-        partial_plan.metadata = partial_plan.metadata or {}
-        partial_plan.metadata.update(
-            {
-                "interrupted": True,
-                "interruption_reason": str(interrupt_error),
-                "timestamp": datetime.now().isoformat(),
-                "current_stage": str(state.current_stage),
-                "resumable": True,
-                "checkpoint_id": state.state_checkpoint_id
-                or f"auto_{datetime.now().strftime('%Y%m%d%H%M%S')}",
-            }
-        )
+        partial_plan.metadata = {
+            **(partial_plan.metadata or {}),
+            "interrupted": True,
+            "interruption_reason": str(interrupt_error),
+            "timestamp": time.strftime(_ISO_SECONDS),
+            "current_stage": str(state.current_stage),
+            "resumable": True,
+            "checkpoint_id": state.state_checkpoint_id
+            or f"auto_{time.strftime('%Y%m%d%H%M%S')}",
+        }
 
         # Add an alert about the interruption
-        if not partial_plan.alerts:
-            partial_plan.alerts = []
-        partial_plan.alerts.append(
-            f"Note: This plan is incomplete due to an interruption: {interrupt_error!s}"
-        )
+        partial_plan.alerts = [
+            *(partial_plan.alerts or []),
+            "Note: This plan is incomplete due to an interruption: "
+            f"{interrupt_error!s}",
+        ]
 
         # Store the interrupted state for possible resumption
         if not state.state_checkpoint_id:
@@ -317,7 +321,7 @@ class TravelWorkflow:
             # Apply any updates to the state
             if updates:
                 for key, value in updates.items():
-                    if hasattr(state, key):
+                    if key in STATE_FIELDS:
                         setattr(state, key, value)
 
             # Mark as no longer interrupted
@@ -326,10 +330,7 @@ class TravelWorkflow:
 
             # Add a note about resumption to conversation history
             state.conversation_history.append(
-                {
-                    "role": "system",
-                    "content": f"Resuming workflow from stage: {state.current_stage}",
-                }
+                Msg("system", f"Resuming workflow from stage: {state.current_stage}")
             )
 
             # Execute the graph with the resumed state
@@ -338,13 +339,12 @@ class TravelWorkflow:
             return resumed_state.plan
 
         except Exception as e:
-            logger.error(f"Error resuming workflow: {e!s}")
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error resuming workflow: {e!s}")
             error_plan = TravelPlan()
             error_plan.metadata = {
                 "error": str(e),
                 "error_type": "resume_error",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": time.strftime(_ISO_SECONDS),
                 "status": "failed",
                 "checkpoint_id": checkpoint_id,
             }
@@ -379,7 +379,7 @@ class TravelWorkflow:
             # Apply any updates to the state
             if updates:
                 for key, value in updates.items():
-                    if hasattr(state, key):
+                    if key in STATE_FIELDS:
                         setattr(state, key, value)
 
             # Mark as no longer interrupted
@@ -388,10 +388,7 @@ class TravelWorkflow:
 
             # Add a note about resumption to conversation history
             state.conversation_history.append(
-                {
-                    "role": "system",
-                    "content": f"Resuming workflow from stage: {state.current_stage}",
-                }
+                Msg("system", f"Resuming workflow from stage: {state.current_stage}")
             )
 
             # Execute the graph with the resumed state asynchronously
@@ -400,13 +397,12 @@ class TravelWorkflow:
             return resumed_state.plan
 
         except Exception as e:
-            logger.error(f"Error resuming workflow asynchronously: {e!s}")
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error resuming workflow asynchronously: {e!s}")
             error_plan = TravelPlan()
             error_plan.metadata = {
                 "error": str(e),
                 "error_type": "resume_error",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": time.strftime(_ISO_SECONDS),
                 "status": "failed",
                 "checkpoint_id": checkpoint_id,
             }
@@ -6,11 +6,102 @@ and CMS content into a structured context dict for prompt injection.
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from travel_planner.data.conversation_models import Message
 from travel_planner.data.preferences import UserPreferences
 
+# Distinct (preferences, location, minute) combinations kept assembled
+SYSTEM_PROMPT_CACHE_SIZE = 1024
+
+# Fixed system prompt sections. They lead the prompt so every request shares
+# the same prefix, which provider-side prompt caching can reuse; the
+# per-user preferences and real-time context follow them.
+
+# --- 1. Identity & Expertise ---
+_ROLE_SECTION = (
+    "<role>\n"
+    "You are 'Trip', an expert AI tourism concierge specializing in "
+    "Japan travel. You have deep knowledge of:\n"
+    "- Regional cuisine, seasonal ingredients, and restaurant culture\n"
+    "- Hot springs (onsen), temples, shrines, and cultural etiquette\n"
+    "- Public transit systems (JR, metro, buses, IC cards)\n"
+    "- Local festivals, seasonal events, and hidden gems\n"
+    "- Budget optimization and travel logistics\n"
+    "</role>"
+)
+
+# --- 2. Thinking Process ---
+_THINKING_SECTION = (
+    "<thinking_process>\n"
+    "Before responding, silently consider:\n"
+    "1. What is the user actually asking for? (food, activity, transit, general info)\n"
+    "2. Which preferences are relevant to THIS specific question?\n"
+    "3. What time/location constraints apply?\n"
+    "4. Am I confident this place exists and is accurate, or should I caveat it?\n"
+    "Do NOT output this thinking — go straight to the answer.\n"
+    "</thinking_process>"
+)
+
+# --- 3. Response Format ---
+_RESPONSE_FORMAT_SECTION = (
+    "<response_format>\n"
+    "For each recommendation, include:\n"
+    "- **Name** — the actual place name\n"
+    "- **Why** — 1 sentence connecting it to the user's taste\n"
+    "- **Details** — address, hours, price range, what to order\n"
+    "- **Getting there** — nearest station + walk time\n\n"
+    "Keep it scannable. Use bold headers. "
+    "2-3 recommendations is ideal — do not overwhelm.\n"
+    "For simple questions (directions, yes/no), answer directly "
+    "without the full template.\n"
+    "</response_format>"
+)
+
+# --- 4. Hard Rules ---
+_RULES_SECTION = (
+    "<rules>\n"
+    "- Respond in the SAME LANGUAGE the user writes in\n"
+    "- Greet ONLY on the very first message. After that, straight to the answer\n"
+    "- If you are not sure a place exists or is still open, say "
+    "'I believe...' or 'You may want to verify...'\n"
+    "- NEVER invent addresses or opening hours. "
+    "If unsure, omit rather than fabricate\n"
+    "- If the user asks something outside your expertise "
+    "(medical, legal, emergency), say so and suggest they contact "
+    "local services (police: 110, ambulance: 119, tourist hotline: 050-3816-2787)\n"
+    "- Keep responses concise. Aim for quality over quantity\n"
+    "</rules>"
+)
+
+# --- 5. User Preferences (usage instructions after the preferences) ---
+_PREFERENCE_USAGE = (
+    "IMPORTANT — How to use preferences:\n"
+    "- Treat these as hard constraints, not suggestions. "
+    "NEVER recommend something that violates dietary restrictions.\n"
+    "- Proactively match suggestions to their style "
+    "(e.g., if 'hidden gems' is set, skip tourist traps).\n"
+    "- If the user's request conflicts with a preference, "
+    "acknowledge the conflict and offer alternatives.\n"
+    "- Reference preferences naturally in your response "
+    "(e.g., 'Since you enjoy seafood...' not 'Based on your profile...')."
+)
+
+# --- 6. Real-Time Context (usage instructions after location + time) ---
+_REAL_TIME_USAGE = (
+    "Use this context to:\n"
+    "- Recommend places that are open NOW\n"
+    "- Suggest time-appropriate activities "
+    "(breakfast spots in morning, bars in evening)\n"
+    "- Prioritize nearby options when GPS is available\n"
+    "- Factor in day of week (some places close on certain days)"
+)
+
+_STATIC_PREFIX = "\n\n".join(
+    (_ROLE_SECTION, _THINKING_SECTION, _RESPONSE_FORMAT_SECTION, _RULES_SECTION)
+)
+
 
 class ContextBuilder:
     """Builds prompt context from multiple data sources."""
@@ -41,9 +132,9 @@ class ContextBuilder:
 
         # Time awareness
         if timestamp:
-            dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-            ctx["time_of_day"] = self._get_time_of_day(dt.hour)
-            ctx["day_of_week"] = dt.strftime("%A")
+            time_of_day, day_of_week, _ = _time_context(timestamp)
+            ctx["time_of_day"] = time_of_day
+            ctx["day_of_week"] = day_of_week
             ctx["timestamp"] = timestamp
 
         # Conversation history
@@ -64,113 +155,39 @@ class ContextBuilder:
         preferences: UserPreferences | None = None,
         location: dict[str, float] | None = None,
         timestamp: str | None = None,
+        preferences_text: str | None = None,
     ) -> str:
-        """Build a rich, structured system prompt for Gemini."""
-        sections: list[str] = []
-
-        # --- 1. Identity & Expertise ---
-        sections.append(
-            "<role>\n"
-            "You are 'Trip', an expert AI tourism concierge specializing in "
-            "Japan travel. You have deep knowledge of:\n"
-            "- Regional cuisine, seasonal ingredients, and restaurant culture\n"
-            "- Hot springs (onsen), temples, shrines, and cultural etiquette\n"
-            "- Public transit systems (JR, metro, buses, IC cards)\n"
-            "- Local festivals, seasonal events, and hidden gems\n"
-            "- Budget optimization and travel logistics\n"
-            "</role>"
-        )
-
-        # --- 2. User Preferences (with usage instructions) ---
-        if preferences:
+        """
+        Build a rich, structured system prompt for Gemini.
+
+        Args:
+            preferences: User preferences to personalize with
+            location: GPS coordinates with "lat" and "lng"
+            timestamp: ISO timestamp of the request
+            preferences_text: preferences.to_prompt_context(), for callers
+                that already rendered it
+        """
+        pref_text = preferences_text
+        if pref_text is None and preferences:
             pref_text = preferences.to_prompt_context()
-            if pref_text != "No preferences set":
-                sections.append(
-                    "<user_preferences>\n"
-                    f"{pref_text}\n"
-                    "</user_preferences>\n\n"
-                    "IMPORTANT — How to use preferences:\n"
-                    "- Treat these as hard constraints, not suggestions. "
-                    "NEVER recommend something that violates dietary restrictions.\n"
-                    "- Proactively match suggestions to their style "
-                    "(e.g., if 'hidden gems' is set, skip tourist traps).\n"
-                    "- If the user's request conflicts with a preference, "
-                    "acknowledge the conflict and offer alternatives.\n"
-                    "- Reference preferences naturally in your response "
-                    "(e.g., 'Since you enjoy seafood...' not 'Based on your profile...')."
-                )
-
-        # --- 3. Real-Time Context (location + time) ---
+        if pref_text == "No preferences set":
+            pref_text = None
+
         context_parts: list[str] = []
         if location:
             context_parts.append(
                 f"GPS: lat {location['lat']}, lng {location['lng']}"
             )
         if timestamp:
-            dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-            time_label = self._get_time_of_day(dt.hour)
-            context_parts.append(
-                f"Time: {time_label} ({dt.strftime('%A %H:%M')})"
-            )
-
-        if context_parts:
-            sections.append(
-                "<real_time_context>\n"
-                + "\n".join(context_parts)
-                + "\n</real_time_context>\n\n"
-                "Use this context to:\n"
-                "- Recommend places that are open NOW\n"
-                "- Suggest time-appropriate activities "
-                "(breakfast spots in morning, bars in evening)\n"
-                "- Prioritize nearby options when GPS is available\n"
-                "- Factor in day of week (some places close on certain days)"
-            )
+            time_label, _, day_and_time = _time_context(timestamp)
+            context_parts.append(f"Time: {time_label} ({day_and_time})")
 
-        # --- 4. Thinking Process ---
-        sections.append(
-            "<thinking_process>\n"
-            "Before responding, silently consider:\n"
-            "1. What is the user actually asking for? (food, activity, transit, general info)\n"
-            "2. Which preferences are relevant to THIS specific question?\n"
-            "3. What time/location constraints apply?\n"
-            "4. Am I confident this place exists and is accurate, or should I caveat it?\n"
-            "Do NOT output this thinking — go straight to the answer.\n"
-            "</thinking_process>"
+        # The prompt only varies with these texts, so chats from the same
+        # user, place and minute share one assembled prompt
+        return _assemble_system_prompt(
+            pref_text, "\n".join(context_parts) if context_parts else None
         )
 
-        # --- 5. Response Format ---
-        sections.append(
-            "<response_format>\n"
-            "For each recommendation, include:\n"
-            "- **Name** — the actual place name\n"
-            "- **Why** — 1 sentence connecting it to the user's taste\n"
-            "- **Details** — address, hours, price range, what to order\n"
-            "- **Getting there** — nearest station + walk time\n\n"
-            "Keep it scannable. Use bold headers. "
-            "2-3 recommendations is ideal — do not overwhelm.\n"
-            "For simple questions (directions, yes/no), answer directly "
-            "without the full template.\n"
-            "</response_format>"
-        )
-
-        # --- 6. Hard Rules ---
-        sections.append(
-            "<rules>\n"
-            "- Respond in the SAME LANGUAGE the user writes in\n"
-            "- Greet ONLY on the very first message. After that, straight to the answer\n"
-            "- If you are not sure a place exists or is still open, say "
-            "'I believe...' or 'You may want to verify...'\n"
-            "- NEVER invent addresses or opening hours. "
-            "If unsure, omit rather than fabricate\n"
-            "- If the user asks something outside your expertise "
-            "(medical, legal, emergency), say so and suggest they contact "
-            "local services (police: 110, ambulance: 119, tourist hotline: 050-3816-2787)\n"
-            "- Keep responses concise. Aim for quality over quantity\n"
-            "</rules>"
-        )
-
-        return "\n\n".join(sections)
-
     @staticmethod
     def _get_time_of_day(hour: int) -> str:
         if 5 <= hour < 11:
@@ -183,3 +200,49 @@ class ContextBuilder:
             return "evening"
         else:
             return "night"
+
+
+@lru_cache(maxsize=256)
+def _time_context(timestamp: str) -> tuple[str, str, str]:
+    """
+    Parse an ISO timestamp into the time labels the prompts use.
+
+    Client timestamps repeat within a request and across retries, so each
+    distinct string is parsed once. fromisoformat accepts a trailing "Z"
+    directly on Python 3.11+.
+
+    Returns:
+        Tuple of (time of day, weekday name, "Weekday HH:MM")
+    """
+    dt = datetime.fromisoformat(timestamp)
+    return (
+        ContextBuilder._get_time_of_day(dt.hour),
+        dt.strftime("%A"),
+        dt.strftime("%A %H:%M"),
+    )
+
+
+@lru_cache(maxsize=SYSTEM_PROMPT_CACHE_SIZE)
+def _assemble_system_prompt(pref_text: str | None, context_text: str | None) -> str:
+    """
+    Assemble the system prompt sections around its variable parts.
+
+    Args:
+        pref_text: Preferences as prompt context, or None if there are none
+        context_text: Location and time lines, or None if neither is known
+
+    Returns:
+        The complete system prompt
+    """
+    sections: tuple[str, ...] = (_STATIC_PREFIX,)
+    if pref_text:
+        sections += (
+            f"<user_preferences>\n{pref_text}\n</user_preferences>\n\n"
+            + _PREFERENCE_USAGE,
+        )
+    if context_text:
+        sections += (
+            f"<real_time_context>\n{context_text}\n</real_time_context>\n\n"
+            + _REAL_TIME_USAGE,
+        )
+    return "\n\n".join(sections)
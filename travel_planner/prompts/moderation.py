@@ -33,19 +33,17 @@ def moderate_input(text: str) -> ModerationResult:
     return ModerationResult(is_safe=True)
 
 
-# Simple PII patterns
-_EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
-_PHONE_PATTERN = re.compile(r"\b\d{3}[-.]?\d{3,4}[-.]?\d{4}\b")
+# Simple PII patterns, combined so output is scanned in a single pass
+_PII_PATTERN = re.compile(
+    r"(?P<email>[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})"
+    r"|(?P<phone>\b\d{3}[-.]?\d{3,4}[-.]?\d{4}\b)"
+)
 
 
 def moderate_output(text: str) -> ModerationResult:
     """Check AI output for PII or inappropriate content."""
-    if _EMAIL_PATTERN.search(text):
-        return ModerationResult(
-            is_safe=False, reason="PII detected: email address"
-        )
-    if _PHONE_PATTERN.search(text):
-        return ModerationResult(
-            is_safe=False, reason="PII detected: phone number"
-        )
+    match = _PII_PATTERN.search(text)
+    if match:
+        kind = "email address" if match.group("email") else "phone number"
+        return ModerationResult(is_safe=False, reason=f"PII detected: {kind}")
     return ModerationResult(is_safe=True)
@@ -4,15 +4,31 @@ Prompt template management.
 Templates are stored in DynamoDB with versioning and A/B test support.
 """
 
+import re
+from functools import lru_cache
+
 from pydantic import BaseModel, Field, computed_field
 
+_PLACEHOLDER = re.compile(r"\{(\w+)\}")
+
+
+@lru_cache(maxsize=256)
+def _template_segments(template: str) -> tuple[str, ...]:
+    """Split a template into literals (even indices) and variable names (odd)."""
+    return tuple(_PLACEHOLDER.split(template))
+
+
+def _render_segments(segments: tuple[str, ...], variables: dict[str, str]) -> str:
+    """Join template segments, substituting known variables in one pass."""
+    return "".join(
+        segment if i % 2 == 0 else variables.get(segment, f"{{{segment}}}")
+        for i, segment in enumerate(segments)
+    )
+
 
 def render_template(template: str, **kwargs: str) -> str:
     """Render a template string, leaving unresolved vars as-is."""
-    result = template
-    for key, value in kwargs.items():
-        result = result.replace(f"{{{key}}}", value)
-    return result
+    return _render_segments(_template_segments(template), kwargs)
 
 
 class PromptTemplate(BaseModel):
@@ -47,3 +63,13 @@ class PromptTemplate(BaseModel):
     def render(self, **kwargs: str) -> str:
         """Render this template with the given variables."""
         return render_template(self.template, **kwargs)
+
+    def render_many(self, variables: list[dict[str, str]]) -> list[str]:
+        """Render this template once for each set of variables."""
+        segments = _template_segments(self.template)
+        return [_render_segments(segments, v) for v in variables]
+
+
+def render_batch(templates: list[PromptTemplate], **kwargs: str) -> list[str]:
+    """Render several templates, such as A/B variants, with the same variables."""
+    return [_render_segments(_template_segments(t.template), kwargs) for t in templates]
@@ -23,24 +23,28 @@ class ABTestService:
     ) -> str:
         """Deterministically assign a variant based on user+test hash."""
         key = f"{user_id}:{test_id}"
-        hash_val = int(hashlib.md5(key.encode()).hexdigest(), 16)
-        index = hash_val % len(variants)
+        # A 64-bit BLAKE2b digest is faster than MD5 and needs no hex parsing;
+        # unlike hash(), it is stable across processes
+        digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+        index = int.from_bytes(digest, "big") % len(variants)
         return variants[index]
 
     def record_outcome(
         self, test_id: str, variant: str, score: float
     ) -> None:
         """Record an A/B test outcome."""
+        # One clock read so the sort key and the stored timestamp agree
+        now_ns = time.time_ns()
         self.db.put_item(
             {
                 "PK": f"ABTEST#{test_id}",
-                "SK": f"VARIANT#{variant}#{int(time.time())}",
+                "SK": f"VARIANT#{variant}#{now_ns // 1_000_000_000}",
                 "EntityType": "ABTestResult",
                 "Version": 1,
                 "Data": {
                     "variant": variant,
                     "score": score,
-                    "timestamp": time.time(),
+                    "timestamp": now_ns / 1e9,
                 },
             }
         )
@@ -7,12 +7,15 @@ before writing to CloudWatch or other log sinks.
 
 import re
 
-_EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
-_PHONE_RE = re.compile(r"\b\d{2,4}[-.]?\d{3,4}[-.]?\d{4}\b")
+# Emails and phone numbers in one alternation so text is scanned once
+_PII_RE = re.compile(
+    r"(?P<email>[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})"
+    r"|(?P<phone>\b\d{2,4}[-.]?\d{3,4}[-.]?\d{4}\b)"
+)
 
 
 def anonymize(text: str) -> str:
     """Replace PII patterns with placeholders."""
-    text = _EMAIL_RE.sub("[EMAIL]", text)
-    text = _PHONE_RE.sub("[PHONE]", text)
-    return text
+    return _PII_RE.sub(
+        lambda match: "[EMAIL]" if match.group("email") else "[PHONE]", text
+    )
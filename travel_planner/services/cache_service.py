@@ -5,11 +5,27 @@ Caches frequent recommendation results to reduce Gemini API calls.
 """
 
 import hashlib
+import re
+import string
 import time
+import unicodedata
 from typing import Any
 
 from travel_planner.data.dynamodb import DynamoDBClient
 
+_WHITESPACE = re.compile(r"\s+")
+
+
+def canonicalize_key(key: str) -> str:
+    """Normalize a key so trivially different phrasings share an entry.
+
+    Applies NFKC normalization and case folding, collapses whitespace and
+    drops surrounding punctuation, so "Best ramen in Tokyo?" and
+    "best  ramen in tokyo" map to the same key.
+    """
+    canon = unicodedata.normalize("NFKC", key).casefold()
+    return _WHITESPACE.sub(" ", canon).strip(" " + string.punctuation)
+
 
 class CacheService:
     """Cache service backed by DynamoDB with TTL auto-expiry."""
@@ -19,7 +35,8 @@ class CacheService:
         self.ttl = ttl
 
     def _cache_key(self, key: str) -> tuple[str, str]:
-        hashed = hashlib.sha256(key.encode()).hexdigest()[:16]
+        canon = canonicalize_key(key)
+        hashed = hashlib.blake2b(canon.encode(), digest_size=16).hexdigest()
         return f"CACHE#{hashed}", "DATA"
 
     def set(self, key: str, value: Any) -> None:
@@ -30,7 +47,7 @@ class CacheService:
                 "SK": sk,
                 "EntityType": "Cache",
                 "Data": {"value": value},
-                "TTL": int(time.time()) + self.ttl,
+                "TTL": time.time_ns() // 1_000_000_000 + self.ttl,
             }
         )
 
@@ -5,6 +5,9 @@ Handles: load preferences, load history, build context,
 call agent, save messages, return response.
 """
 
+import asyncio
+import hashlib
+import json
 import uuid
 from typing import Any
 
@@ -16,19 +19,43 @@ from travel_planner.data.conversation_models import (
 from travel_planner.data.repository import DynamoDBRepository
 from travel_planner.prompts.context import ContextBuilder
 from travel_planner.prompts.moderation import moderate_input, moderate_output
+from travel_planner.services.cache_service import CacheService, canonicalize_key
 from travel_planner.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Most recent messages sent to the agent as conversation history
+MAX_HISTORY_MESSAGES = 20
+
 
 class ConversationService:
     """Orchestrates the conversation flow."""
 
-    def __init__(self, repo: DynamoDBRepository, agent: Any):
+    def __init__(
+        self,
+        repo: DynamoDBRepository,
+        agent: Any,
+        cache: CacheService | None = None,
+    ):
         self.repo = repo
         self.agent = agent
+        self.cache = cache
         self.context_builder = ContextBuilder()
 
+    @staticmethod
+    def _response_cache_key(
+        system_prompt: str, history: list[dict[str, str]], message: str
+    ) -> str:
+        """Key a reply on everything the agent sees when producing it.
+
+        The message is canonicalized first, so rephrasings that differ only in
+        case, spacing or surrounding punctuation share a reply.
+        """
+        payload = "\x00".join(
+            (system_prompt, json.dumps(history), canonicalize_key(message))
+        )
+        return hashlib.blake2b(payload.encode()).hexdigest()
+
     async def handle_chat(
         self,
         user_id: str,
@@ -46,7 +73,12 @@ class ConversationService:
                 "conversation_id": conversation_id,
             }
 
-        # Get or create conversation
+        # Repository calls block on DynamoDB, so independent ones run in worker
+        # threads to overlap their round trips
+
+        # Get or create conversation, loading preferences alongside; a new
+        # conversation has no history to load, and an existing one loads only
+        # its most recent messages
         if not conversation_id:
             conversation_id = str(uuid.uuid4())
             conv = Conversation(
@@ -54,14 +86,22 @@ class ConversationService:
                 user_id=user_id,
                 title=message[:50],
             )
-            self.repo.save_conversation(conv)
-
-        # Load preferences
-        preferences = self.repo.get_preferences(user_id)
-
-        # Load history
-        messages = self.repo.get_messages(conversation_id)
-        next_seq = len(messages) + 1
+            preferences, _ = await asyncio.gather(
+                asyncio.to_thread(self.repo.get_preferences, user_id),
+                asyncio.to_thread(self.repo.save_conversation, conv),
+            )
+            messages: list[Message] = []
+        else:
+            preferences, messages = await asyncio.gather(
+                asyncio.to_thread(self.repo.get_preferences, user_id),
+                asyncio.to_thread(
+                    self.repo.get_recent_messages,
+                    conversation_id,
+                    MAX_HISTORY_MESSAGES,
+                ),
+            )
+        # History is truncated, so continue from the last sequence number
+        next_seq = messages[-1].sequence + 1 if messages else 1
 
         # Save user message
         user_msg = Message(
@@ -70,7 +110,6 @@ class ConversationService:
             role=MessageRole.USER,
             content=message,
         )
-        self.repo.save_message(user_msg)
 
         # Build system prompt
         system_prompt = self.context_builder.build_system_prompt(
@@ -85,21 +124,40 @@ class ConversationService:
             for msg in messages
         ]
 
-        # Call agent
-        response_text = await self.agent.chat(
-            message=message,
-            system_prompt=system_prompt,
-            history=history,
-        )
-
-        # Moderate output
-        out_mod = moderate_output(response_text)
-        if not out_mod.is_safe:
-            response_text = (
-                "I apologize, but I cannot provide that information. "
-                "Can I help you with something else?"
+        # Identical prompt, history and message get the cached reply instead
+        # of another model call
+        cache = self.cache
+        cache_key = None
+        cached = None
+        if cache is not None:
+            cache_key = self._response_cache_key(system_prompt, history, message)
+            cached = await asyncio.to_thread(cache.get, cache_key)
+
+        if cached is not None:
+            logger.debug(f"Response cache hit for conversation {conversation_id}")
+            await asyncio.to_thread(self.repo.save_message, user_msg)
+            response_text = cached
+        else:
+            # Call agent while the user message is saved
+            _, response_text = await asyncio.gather(
+                asyncio.to_thread(self.repo.save_message, user_msg),
+                self.agent.chat(
+                    message=message,
+                    system_prompt=system_prompt,
+                    history=history,
+                ),
             )
 
+            # Moderate output; only replies that pass are worth reusing
+            out_mod = moderate_output(response_text)
+            if not out_mod.is_safe:
+                response_text = (
+                    "I apologize, but I cannot provide that information. "
+                    "Can I help you with something else?"
+                )
+            elif cache is not None and cache_key is not None:
+                await asyncio.to_thread(cache.set, cache_key, response_text)
+
         # Save assistant message
         assistant_msg = Message(
             conversation_id=conversation_id,
@@ -44,11 +44,8 @@ class PlaceService:
     ) -> list[Place]:
         """Find places near a location by querying neighboring geohashes."""
         hashes = self.get_neighbor_hashes(lat, lng, precision)
-        places = []
-        seen_ids: set[str] = set()
-        for h in hashes:
-            for place in self.repo.get_places_by_geohash(h):
-                if place.place_id not in seen_ids:
-                    places.append(place)
-                    seen_ids.add(place.place_id)
-        return places
+        # Insertion-ordered dict keeps the first occurrence of each place
+        places_by_id: dict[str, Place] = {}
+        for place in self.repo.get_places_by_geohashes(hashes):
+            places_by_id.setdefault(place.place_id, place)
+        return list(places_by_id.values())
@@ -6,7 +6,6 @@ classes to handle errors consistently across the application.
 """
 
 import functools
-import traceback
 from collections.abc import Callable
 from typing import Any, TypeVar, cast
 
@@ -121,7 +120,7 @@ def handle_errors(
             except Exception as e:
                 func_name = func.__name__
                 logger.error(f"Error in {func_name}: {e!s}")
-                logger.debug(f"Traceback: {traceback.format_exc()}")
+                logger.opt(exception=True).debug("Traceback:")
 
                 if default_value is not None:
                     logger.info(f"Returning default value from {func_name}")
@@ -222,5 +221,5 @@ def safe_execute(
     except Exception as e:
         func_name = getattr(func, "__name__", str(func))
         logger.error(f"Error executing {func_name}: {e!s}")
-        logger.debug(f"Traceback: {traceback.format_exc()}")
+        logger.opt(exception=True).debug("Traceback:")
         return default